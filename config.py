@@ -1,6 +1,7 @@
 # config.py
 import os
 import sys
+from functools import lru_cache
 
 APP_NAME = "Slate"
 APP_VERSION = "1.0.1 (Shippable)" 
@@ -8,16 +9,19 @@ PROJECTS_BASE_DIR = os.path.join(os.path.expanduser("~"), "DIT_Projects")
 
 # --- START MODIFICATION ---
 
+# Resolved once at import; only a PyInstaller bundle sets sys.frozen/_MEIPASS.
+# Onedir builds may not set _MEIPASS, in which case resources sit next to the executable.
+if getattr(sys, 'frozen', False):
+    _BUNDLE_BASE = getattr(sys, '_MEIPASS', None) or os.path.dirname(sys.executable)
+else:
+    _BUNDLE_BASE = None
+
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path):
     """ Get absolute path to resource, works for dev and for PyInstaller """
-    try:
-
-        base_path = sys._MEIPASS
-    except Exception:
-
-        return relative_path
-
-    return os.path.join(base_path, relative_path)
+    if _BUNDLE_BASE:
+        return os.path.join(_BUNDLE_BASE, relative_path)
+    return relative_path
 
 
 FFPROBE_PATH = get_resource_path("ffprobe")
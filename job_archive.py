@@ -0,0 +1,117 @@
+# job_archive.py
+import json
+import os
+import sqlite3
+from datetime import datetime
+
+class JobArchive:
+    """
+    On-disk history of completed jobs that no longer fit in memory.
+    Jobs and their per-file records are stored in SQLite so single jobs/files can be
+    looked up or patched by key without loading the whole history.
+    """
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._conn = None
+
+    def _connection(self):
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            self._conn = sqlite3.connect(self.db_path)
+            self._conn.executescript("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    status TEXT,
+                    job_json TEXT NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS files (
+                    job_id TEXT NOT NULL,
+                    source TEXT NOT NULL,
+                    info_json TEXT NOT NULL,
+                    PRIMARY KEY (job_id, source)
+                );
+                CREATE INDEX IF NOT EXISTS idx_files_source ON files (source);
+            """)
+        return self._conn
+
+    @staticmethod
+    def _dumps(obj):
+        def dt_handler(o):
+            if isinstance(o, datetime):
+                return o.isoformat()
+        return json.dumps(obj, default=dt_handler)
+
+    def archive_jobs(self, jobs):
+        # The file list is stored row-per-file; the job row keeps everything else
+        conn = self._connection()
+        with conn:
+            for job in jobs:
+                report = job.get('report') or {}
+                files = report.get('files', [])
+                job_row = dict(job)
+                job_row['report'] = {k: v for k, v in report.items() if k != 'files'}
+                conn.execute("INSERT OR REPLACE INTO jobs (id, status, job_json) VALUES (?, ?, ?)",
+                             (job['id'], job.get('status'), self._dumps(job_row)))
+                conn.execute("DELETE FROM files WHERE job_id = ?", (job['id'],))
+                conn.executemany("INSERT OR REPLACE INTO files (job_id, source, info_json) VALUES (?, ?, ?)",
+                                 ((job['id'], f['source'], self._dumps(f)) for f in files))
+
+    def get_job(self, job_id):
+        conn = self._connection()
+        row = conn.execute("SELECT job_json FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        if row is None:
+            return None
+        job = json.loads(row[0])
+        report = job.setdefault('report', {})
+        for key in ('start_time', 'end_time'):
+            if isinstance(report.get(key), str):
+                report[key] = datetime.fromisoformat(report[key])
+        report['files'] = [json.loads(info) for (info,) in
+                           conn.execute("SELECT info_json FROM files WHERE job_id = ? ORDER BY rowid", (job_id,))]
+        return job
+
+    def update_file(self, job_id, source_path, updates):
+        # Read-modify-write keeps dict.update() semantics (json_patch would drop None values)
+        conn = self._connection()
+        with conn:
+            row = conn.execute("SELECT info_json FROM files WHERE job_id = ? AND source = ?", (job_id, source_path)).fetchone()
+            if row is None:
+                return False
+            info = json.loads(row[0])
+            info.update(updates)
+            conn.execute("UPDATE files SET info_json = ? WHERE job_id = ? AND source = ?",
+                         (self._dumps(info), job_id, source_path))
+        return True
+
+    def set_status(self, job_id, status):
+        conn = self._connection()
+        with conn:
+            conn.execute("UPDATE jobs SET status = ?, job_json = json_set(job_json, '$.status', ?) WHERE id = ?",
+                         (status, status, job_id))
+
+    # Same rule as JobManager._is_reportable_copy; the file list itself lives in the files table
+    _COPY_JOBS_WHERE = ("COALESCE(json_extract(job_json, '$.job_type'), 'copy') = 'copy'"
+                        " AND json_type(job_json, '$.report.end_time') IS NOT NULL")
+
+    def copy_jobs(self):
+        # Oldest first, matching the order jobs were evicted in
+        ids = [row[0] for row in self._connection().execute(
+            f"SELECT id FROM jobs WHERE {self._COPY_JOBS_WHERE} ORDER BY rowid")]
+        return [self.get_job(job_id) for job_id in ids]
+
+    def has_copy_jobs(self):
+        # Don't create the database just to find out it is empty
+        if self._conn is None and not os.path.exists(self.db_path):
+            return False
+        return self._connection().execute(f"SELECT 1 FROM jobs WHERE {self._COPY_JOBS_WHERE} LIMIT 1").fetchone() is not None
+
+    def clear(self):
+        conn = self._connection()
+        with conn:
+            conn.execute("DELETE FROM files")
+            conn.execute("DELETE FROM jobs")
+
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -1,16 +1,30 @@
 # job_manager.py
 import time
+import math
 import os
-import queue
+import sqlite3
+from functools import partial
 from datetime import datetime
-from collections import deque
-from PySide6.QtCore import QObject, Signal
+from collections import OrderedDict
+from itertools import chain
+from PySide6.QtCore import QObject, Signal, Slot, QTimer, Qt
 from PySide6.QtWidgets import QMessageBox
 
-from workers import TransferWorker, PostProcessWorker, MHLVerifyWorker, ScanWorker
+from job_archive import JobArchive
+from utils import get_device_id, json_dumps
+
+# Completed jobs kept in memory (and shown in the list); older ones move to the project's history.db
+MAX_COMPLETED_JOBS = 500
+_MB_PER_BYTE = 1.0 / (1024 * 1024)
+
+# workers (and its hashing/imaging dependencies) is imported lazily so it stays off the launch path
 
 class JobManager(QObject):
     job_list_changed = Signal()
+    # Emitted at once on every job collection change; job_list_changed trails it by up to 50 ms
+    jobs_modified = Signal()
+    # A single job's status changed without it moving between collections
+    job_status_changed = Signal(str)
     queue_state_changed = Signal(bool, list)
     
     overall_progress_updated = Signal(int, str, float, int)
@@ -24,25 +38,66 @@ class JobManager(QObject):
     def __init__(self, window):
         super().__init__()
         self.window = window
-        self.job_queue = []
-        self.completed_jobs = []
-        self.post_process_queue = []
+        # Job collections are insertion-ordered and keyed by job id
+        self.job_queue = OrderedDict()
+        self.completed_jobs = OrderedDict()
+        # Completed jobs that session reports cover; without a project archive these outlive
+        # their eviction from completed_jobs so no transfer drops out of the session report
+        self.completed_copy_jobs = OrderedDict()
+        self.post_process_queue = OrderedDict()
         self.active_workers = []
+        # Hash indexes so worker/post-process callbacks don't scan the job lists
+        self._active_by_id = {}
+        self._files_by_source = {}
+        # Volumes each running job writes to; jobs sharing a volume are not run concurrently
+        self._worker_devices = {}
+        # Snapshot returned by get_all_jobs(); dropped whenever a job collection changes
+        self._all_jobs_cache = None
+        # job id -> serialized JSON of a completed job; an entry is dropped whenever that job changes
+        self._completed_json = {}
+        self._archive = None
+        # Whether the open archive holds reportable copy jobs; None until first asked
+        self._archive_has_copy_jobs = None
+        # path -> st_dev, so jobs sharing destinations don't re-stat them on every scheduling pass
+        self._device_cache = {}
         self.scan_worker = None
+        self.post_process_worker = None
+        self._cancel_prompt = None
         self.max_concurrent_jobs = 1
         self.is_running = False
         self.is_paused = False
         self.current_queue_had_errors = False
         
         self.total_queue_size = 0
+        self._inv_queue_size_pct = 0.0
+        # Running total of queued copy-job sizes, maintained on enqueue/dequeue
+        self._queued_sizes = {}
+        self._queued_copy_size = 0
+        # Flat id -> size map for running copy jobs, so size updates skip job['report'] lookups
+        self._active_sizes = {}
         self.total_bytes_processed_in_queue = 0
         self.queue_start_time = 0
         self.active_job_progress = {}
 
-        # --- NEW: Attributes for rolling average speed calculation ---
-        self.speed_history = deque(maxlen=20) # Store last 20 data points (time, bytes)
+        # Exponential moving average of queue throughput (bytes/s)
+        self._ema_speed_bps = 0.0
+        self._ema_last_time = 0.0
+        self._ema_last_bytes = 0
         self.last_progress_update_time = 0
 
+        # Worker progress arrives far faster than the UI can use it; accumulate the
+        # byte counts per tick and emit one aggregated update per flush interval.
+        self._progress_flush_timer = QTimer(self)
+        self._progress_flush_timer.setSingleShot(True)
+        self._progress_flush_timer.setInterval(50)
+        self._progress_flush_timer.timeout.connect(self._flush_progress)
+
+        # Same idea for structural changes: bursts of add/start/finish collapse into one list refresh
+        self._job_list_timer = QTimer(self)
+        self._job_list_timer.setSingleShot(True)
+        self._job_list_timer.setInterval(50)
+        self._job_list_timer.timeout.connect(self.job_list_changed.emit)
+
     def create_job_from_ui(self):
         # Allow starting a new job even if another is scanning, but for simplicity
         # we still restrict one scan at a time if the UI depends on it (which it does slightly).
@@ -56,7 +111,9 @@ class JobManager(QObject):
             QMessageBox.warning(self.window, "Missing Paths", "Please add at least one source and one destination.")
             return
 
-        file_queue = queue.Queue()
+        from workers import ScanWorker, FileQueue
+
+        file_queue = FileQueue()
         job_id = f"Job_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{len(self.get_all_jobs()) + 1}"
 
         job_params = {
@@ -94,8 +151,8 @@ class JobManager(QObject):
         }
 
         self.scan_worker = ScanWorker(job_params, file_queue)
-        self.scan_worker.scan_progress.connect(lambda f, s: self.on_scan_progress(job, f, s))
-        self.scan_worker.scan_finished.connect(lambda params: self.on_scan_finished_update_job(job, params))
+        self.scan_worker.scan_progress.connect(partial(self.on_scan_progress, job))
+        self.scan_worker.scan_finished.connect(partial(self.on_scan_finished_update_job, job))
 
         # We don't block controls anymore, or maybe we do just for simplicity of "adding" jobs?
         # The user requested scalability. Non-blocking UI is key.
@@ -114,58 +171,254 @@ class JobManager(QObject):
              self.start_or_pause_queue()
 
     def on_scan_progress(self, job, files_found, current_total_size):
-        if 'report' in job:
-            job['report']['total_size'] = current_total_size
-        # Force update total queue size if this job is running/queued
-        if self.is_running:
-             copy_jobs = [j for j in self.job_queue if j.get("job_type", "copy") == "copy"]
-             # Recalculate total queue size from ALL jobs, as this one is updating
-             current_queue_total = sum(j['report']['total_size'] for j in copy_jobs)
-             self.total_queue_size = current_queue_total + sum(j['report']['total_size'] for j in self.active_workers if j.get("job_type", "copy") == "copy")
+        report = job.get('report')
+        if report is not None:
+            report['total_size'] = current_total_size
+            delta = self._update_job_size(job['id'], current_total_size)
+            # Apply only the growth of this job to the running queue total
+            if delta and self.is_running:
+                self._set_total_queue_size(self.total_queue_size + delta)
 
     def on_scan_finished_update_job(self, job, job_params):
         # Update the job record with final scan details (for report/restart)
         job['resolved_dests'] = job_params['resolved_dests']
-        job['report']['total_size'] = job_params['total_size']
+        total_size = job_params['total_size']
+        job['report']['total_size'] = total_size
+        delta = self._update_job_size(job['id'], total_size)
+        if delta and self.is_running:
+            self._set_total_queue_size(self.total_queue_size + delta)
         job['all_source_files'] = job_params['all_source_files']
 
         # If the job hasn't started yet (unlikely if queue is running), update status
         if job['status'] == "Scanning":
             job['status'] = "Queued"
 
-        self.job_list_changed.emit()
+        self.job_status_changed.emit(job['id'])
+
+    def _notify_jobs_changed(self):
+        self._all_jobs_cache = None
+        self.jobs_modified.emit()
+        if not self._job_list_timer.isActive():
+            self._job_list_timer.start()
 
     def set_max_concurrent_jobs(self, count):
         self.max_concurrent_jobs = count
+        # Raising the limit mid-queue should put the new capacity to work straight away
+        if self.is_running and not self.is_paused:
+            self._start_available_jobs()
+
+    def _job_devices(self, job):
+        if job.get("job_type", "copy") == "mhl_verify":
+            paths = [job.get('target_dir')]
+        else:
+            paths = job.get('destinations', [])
+        devices = set()
+        for path in set(paths):
+            if not path:
+                continue
+            if path not in self._device_cache:
+                self._device_cache[path] = get_device_id(path)
+            dev = self._device_cache[path]
+            if dev is not None:
+                devices.add(dev)
+        return devices
 
     def get_all_jobs(self):
-        active_jobs = [worker.job for worker in self.active_workers]
-        return active_jobs + self.job_queue + self.completed_jobs
+        if self._all_jobs_cache is None:
+            active_jobs = (worker.job for worker in self.active_workers)
+            self._all_jobs_cache = tuple(chain(active_jobs, self.job_queue.values(), self.completed_jobs.values()))
+        return self._all_jobs_cache
+
+    @property
+    def has_completed_copy_jobs(self):
+        if self.completed_copy_jobs:
+            return True
+        archive = self._job_archive()
+        if archive is None:
+            return False
+        if self._archive_has_copy_jobs is None:
+            try:
+                self._archive_has_copy_jobs = archive.has_copy_jobs()
+            except sqlite3.Error as e:
+                print(f"Error reading completed job archive: {e}")
+                return False
+        return self._archive_has_copy_jobs
+
+    def session_copy_jobs(self):
+        """Every reportable copy job, oldest first, including those evicted to the archive."""
+        archived = []
+        archive = self._job_archive()
+        if archive is not None:
+            try:
+                archived = archive.copy_jobs()
+            except sqlite3.Error as e:
+                print(f"Error reading completed job archive: {e}")
+        # A job is only archived once it leaves memory, so the two never overlap
+        return archived + list(self.completed_copy_jobs.values())
+
+    def get_job_by_id(self, job_id):
+        worker = self._active_by_id.get(job_id)
+        if worker is not None:
+            return worker.job
+        job = self.job_queue.get(job_id)
+        if job is None:
+            job = self._completed_job(job_id)
+        if job is None:
+            archive = self._job_archive()
+            if archive is not None:
+                try:
+                    job = archive.get_job(job_id)
+                except sqlite3.Error as e:
+                    print(f"Error reading completed job archive: {e}")
+        return job
+
+    def _completed_job(self, job_id):
+        # In-memory completed job, including copy jobs kept past eviction for lack of an archive
+        job = self.completed_jobs.get(job_id)
+        return job if job is not None else self.completed_copy_jobs.get(job_id)
+
+    def completed_jobs_json(self):
+        """Completed jobs as JSON texts, re-encoding only the jobs that changed since the last call."""
+        cache = self._completed_json
+        texts = []
+        for job_id, job in self.completed_jobs.items():
+            text = cache.get(job_id)
+            if text is None:
+                text = cache[job_id] = json_dumps(job)
+            texts.append(text)
+        return texts
+
+    @staticmethod
+    def _is_reportable_copy(job):
+        # Jobs cancelled before they started only carry the {"total_size": N} stub report, and
+        # projects saved by older builds hold mid-run cancels without an end_time
+        report = job.get('report', {})
+        return job.get("job_type", "copy") == "copy" and 'files' in report and 'end_time' in report
 
     def clear_completed_jobs(self):
         self.completed_jobs.clear()
-        self.job_list_changed.emit()
+        self.completed_copy_jobs.clear()
+        self._files_by_source.clear()
+        self._completed_json.clear()
+        archive = self._job_archive()
+        if archive is not None:
+            try:
+                archive.clear()
+                self._archive_has_copy_jobs = False
+            except sqlite3.Error as e:
+                print(f"Could not clear completed job archive: {e}")
+        self._notify_jobs_changed()
+
+    def load_completed_jobs(self, jobs):
+        self.completed_jobs = OrderedDict((job['id'], job) for job in jobs)
+        self.completed_copy_jobs = OrderedDict((job['id'], job) for job in jobs if self._is_reportable_copy(job))
+        self._files_by_source.clear()
+        self._completed_json.clear()
+        self._all_jobs_cache = None
+        self._evict_completed_jobs()
+
+    def _add_completed_job(self, job):
+        self.completed_jobs[job['id']] = job
+        if self._is_reportable_copy(job):
+            self.completed_copy_jobs[job['id']] = job
+        self._completed_json.pop(job['id'], None)
+        self._all_jobs_cache = None
+        self._evict_completed_jobs()
+
+    def _evict_completed_jobs(self):
+        overflow = len(self.completed_jobs) - MAX_COMPLETED_JOBS
+        if overflow <= 0:
+            return
+        evicted = [self.completed_jobs.popitem(last=False)[1] for _ in range(overflow)]
+        archived = self._archive_completed(evicted)
+        for job in evicted:
+            self._files_by_source.pop(job['id'], None)
+            self._completed_json.pop(job['id'], None)
+            if archived:
+                self.completed_copy_jobs.pop(job['id'], None)
+
+    def _job_archive(self):
+        # One archive per project; reopened if the window switched projects
+        project_path = getattr(self.window, 'project_path', None)
+        if not project_path:
+            return None
+        db_path = os.path.join(project_path, ".dit_project", "history.db")
+        if self._archive is None or self._archive.db_path != db_path:
+            if self._archive is not None:
+                self._archive.close()
+            self._archive = JobArchive(db_path)
+            self._archive_has_copy_jobs = None
+        return self._archive
+
+    def _archive_completed(self, jobs):
+        # Returns False when the jobs could not be archived and must stay in memory
+        archive = self._job_archive()
+        if archive is None:
+            return False
+        try:
+            archive.archive_jobs(jobs)
+        except sqlite3.Error as e:
+            print(f"Error archiving completed jobs: {e}")
+            return False
+        if any(self._is_reportable_copy(job) for job in jobs):
+            self._archive_has_copy_jobs = True
+        return True
+
+    def _track_queued_size(self, job):
+        if job.get("job_type", "copy") == "copy":
+            size = job['report']['total_size']
+            self._queued_sizes[job['id']] = size
+            self._queued_copy_size += size
+
+    def _untrack_queued_size(self, job_id):
+        self._queued_copy_size -= self._queued_sizes.pop(job_id, 0)
+
+    def _update_job_size(self, job_id, size):
+        # Returns the size delta for a tracked (queued or running) copy job, else 0
+        if job_id in self._queued_sizes:
+            delta = size - self._queued_sizes[job_id]
+            self._queued_sizes[job_id] = size
+            self._queued_copy_size += delta
+            return delta
+        if job_id in self._active_sizes:
+            delta = size - self._active_sizes[job_id]
+            self._active_sizes[job_id] = size
+            return delta
+        return 0
+
+    def _set_total_queue_size(self, size):
+        self.total_queue_size = size
+        # Percent is computed on every progress flush; keep the reciprocal alongside the total
+        self._inv_queue_size_pct = 100.0 / size if size > 0 else 0.0
+
+    def clear_job_queue(self):
+        self.job_queue.clear()
+        self._all_jobs_cache = None
+        self._queued_sizes.clear()
+        self._queued_copy_size = 0
 
     def add_job_to_queue(self, job):
-        self.job_queue.append(job)
-        self.job_list_changed.emit()
+        self.job_queue[job['id']] = job
+        self._track_queued_size(job)
+        self._notify_jobs_changed()
         if self.is_running:
+            self._set_total_queue_size(self.total_queue_size + self._queued_sizes.get(job['id'], 0))
             self._start_available_jobs()
 
     def remove_job_by_id(self, job_id_to_remove):
         if self.is_running:
             QMessageBox.warning(self.window, "Cannot Remove Job", "Jobs cannot be removed while the queue is running.")
             return
-        initial_len = len(self.job_queue)
-        self.job_queue = [job for job in self.job_queue if job['id'] != job_id_to_remove]
-        if len(self.job_queue) < initial_len:
-            self.job_list_changed.emit()
-            self.queue_state_changed.emit(self.is_running, self.job_queue)
+        if self.job_queue.pop(job_id_to_remove, None) is not None:
+            self._untrack_queued_size(job_id_to_remove)
+            self._notify_jobs_changed()
+            self.queue_state_changed.emit(self.is_running, list(self.job_queue))
             return
-        initial_len = len(self.completed_jobs)
-        self.completed_jobs = [job for job in self.completed_jobs if job['id'] != job_id_to_remove]
-        if len(self.completed_jobs) < initial_len:
-            self.job_list_changed.emit()
+        if self.completed_jobs.pop(job_id_to_remove, None) is not None:
+            self.completed_copy_jobs.pop(job_id_to_remove, None)
+            self._files_by_source.pop(job_id_to_remove, None)
+            self._completed_json.pop(job_id_to_remove, None)
+            self._notify_jobs_changed()
             return
 
     def start_or_pause_queue(self):
@@ -175,54 +428,97 @@ class JobManager(QObject):
             self.current_queue_had_errors = False
             self.is_running = True
             self.is_paused = False
-            copy_jobs = [j for j in self.job_queue if j.get("job_type", "copy") == "copy"]
-            self.total_queue_size = sum(j['report']['total_size'] for j in copy_jobs if 'report' in j and 'total_size' in j['report'])
+            self._set_total_queue_size(self._queued_copy_size)
             self.total_bytes_processed_in_queue = 0
             self.active_job_progress = {}
-            # --- REFACTOR: Reset speed calculation history ---
-            self.speed_history.clear()
+            # Drives may have been mounted/unmounted since the last run
+            self._device_cache.clear()
             self.queue_start_time = time.monotonic()
             self.last_progress_update_time = self.queue_start_time
-            self.queue_state_changed.emit(self.is_running, self.job_queue)
+            self._ema_speed_bps = 0.0
+            self._ema_last_time = self.queue_start_time
+            self._ema_last_bytes = 0
+            self.queue_state_changed.emit(self.is_running, list(self.job_queue))
             self._start_available_jobs()
         else:
             if self.is_paused:
                 self.is_paused = False
-                for worker in self.active_workers:
+                # active_workers is only mutated from GUI-thread slots, so a tuple snapshot suffices
+                for worker in tuple(self.active_workers):
                     worker.resume()
                 # Un-pause timers
-                self.queue_start_time += (time.monotonic() - self.pause_time)
-                self.last_progress_update_time += (time.monotonic() - self.pause_time)
+                paused_for = time.monotonic() - self.pause_time
+                self.queue_start_time += paused_for
+                self.last_progress_update_time += paused_for
+                self._ema_last_time += paused_for
             else:
                 self.is_paused = True
                 self.pause_time = time.monotonic()
-                for worker in self.active_workers:
+                for worker in tuple(self.active_workers):
                     worker.pause()
-            self.queue_state_changed.emit(self.is_running, self.job_queue)
+            self.queue_state_changed.emit(self.is_running, list(self.job_queue))
 
     def cancel_queue(self):
         if not self.is_running:
             return
-        reply = QMessageBox.question(self.window, "Cancel Queue", "Are you sure you want to cancel all running and queued jobs?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
-        if reply == QMessageBox.Yes:
-            for worker in self.active_workers[:]:
-                worker.cancel()
-                job = worker.job
-                job['status'] = 'Cancelled'
-                self.job_queue.insert(0, job)
-            for job in self.job_queue:
-                if job['status'] != 'Cancelled':
-                    job['status'] = 'Cancelled'
-            self.is_running = False
-            self.is_paused = False
-            self.job_list_changed.emit()
-            self.queue_state_changed.emit(self.is_running, self.job_queue)
+        if self._cancel_prompt is not None:
+            self._cancel_prompt.raise_()
+            return
+        # Non-blocking confirmation: open() keeps the event loop (and worker progress) flowing
+        # while the user decides, and the actual cancel runs from the finished signal.
+        prompt = QMessageBox(QMessageBox.Question, "Cancel Queue", "Are you sure you want to cancel all running and queued jobs?",
+                             QMessageBox.Yes | QMessageBox.No, self.window)
+        prompt.setDefaultButton(QMessageBox.No)
+        prompt.setAttribute(Qt.WA_DeleteOnClose)
+        prompt.finished.connect(self._on_cancel_prompt_finished)
+        self._cancel_prompt = prompt
+        prompt.open()
+
+    @Slot(int)
+    def _on_cancel_prompt_finished(self, result):
+        self._cancel_prompt = None
+        if result == QMessageBox.Yes:
+            self.cancel_all_jobs()
+
+    def cancel_all_jobs(self):
+        if not self.is_running:
+            return
+        # Running jobs come back through on_job_finished (with a Cancelled report) and land in
+        # completed_jobs there; re-queueing them as well used to list them twice.
+        for worker in tuple(self.active_workers):
+            worker.cancel()
+            worker.job['status'] = 'Cancelled'
+        # Queued jobs never started, so they go straight to completed in the same pass
+        for job in self.job_queue.values():
+            job['status'] = 'Cancelled'
+            self._add_completed_job(job)
+        self.clear_job_queue()
+        self.is_running = False
+        self.is_paused = False
+        self._progress_flush_timer.stop()
+        self._notify_jobs_changed()
+        self.queue_state_changed.emit(self.is_running, list(self.job_queue))
 
     def _start_available_jobs(self):
-        while len(self.active_workers) < self.max_concurrent_jobs and self.job_queue:
-            job = self.job_queue.pop(0)
+        from workers import TransferWorker, MHLVerifyWorker
+        # Start everything that fits first, then notify the job list once
+        list_changed = False
+        busy_devices = set().union(*self._worker_devices.values())
+        for job in list(self.job_queue.values()):
+            if len(self.active_workers) >= self.max_concurrent_jobs:
+                break
+            if job['status'] != 'Cancelled':
+                # Copies are I/O bound per volume: only run jobs in parallel when they hit different devices
+                devices = self._job_devices(job)
+                if devices & busy_devices:
+                    continue
+                busy_devices |= devices
+                self._worker_devices[job['id']] = devices
+            del self.job_queue[job['id']]
+            self._untrack_queued_size(job['id'])
+            list_changed = True
             if job['status'] == 'Cancelled':
-                self.completed_jobs.append(job)
+                self._add_completed_job(job)
                 continue
 
             # Allow "Scanning" jobs to start running (TransferWorker will consume from queue)
@@ -239,23 +535,34 @@ class JobManager(QObject):
             job_type = job.get("job_type", "copy")
             if job_type == "mhl_verify":
                 worker = MHLVerifyWorker(job)
-                worker.progress.connect(lambda p, t, s, e, jid=job_id: self.overall_progress_updated.emit(p, f"Verifying MHL: {t}", s, e))
+                worker.progress.connect(self._on_mhl_progress)
             else:
                 worker = TransferWorker(job, self.window.project_path)
                 self.active_job_progress[job_id] = 0
+                self._active_sizes[job_id] = job['report']['total_size']
                 worker.progress.connect(self._on_worker_progress_updated)
-            worker.file_progress.connect(
-                lambda p, t, path, s, jid=job_id: self.job_file_progress_updated.emit(jid, p, t, path, s)
-            )
+            # Workers tag file progress with their job id, so it can be forwarded signal-to-signal
+            worker.file_progress.connect(self.job_file_progress_updated)
             worker.job_finished.connect(self.on_job_finished)
-            worker.error.connect(lambda msg, jid=job_id: self.job_file_progress_updated.emit(jid, 0, f"ERROR: {msg}", "", 0.0))
-            worker.finished.connect(lambda w=worker: self._on_worker_finished(w))
+            worker.error.connect(self._on_worker_error)
+            worker.finished.connect(partial(self._on_worker_finished, worker))
             self.active_workers.append(worker)
-            self.job_list_changed.emit()
+            self._active_by_id[job_id] = worker
             worker.start()
+        if list_changed:
+            self._notify_jobs_changed()
+
+    @Slot(int, str, float, int)
+    def _on_mhl_progress(self, percent, text, speed_mbps, eta_seconds):
+        self.overall_progress_updated.emit(percent, f"Verifying MHL: {text}", speed_mbps, eta_seconds)
 
-    # --- START REFACTOR: Implement rolling average calculation ---
-    def _on_worker_progress_updated(self, job_id, bytes_processed_in_job, speed_mbps, eta_seconds):
+    @Slot(str, str)
+    def _on_worker_error(self, message, job_id):
+        self.job_file_progress_updated.emit(job_id, 0, f"ERROR: {message}", "", 0.0)
+
+    # --- START REFACTOR: Exponential moving average speed calculation ---
+    @Slot(str, 'qulonglong')
+    def _on_worker_progress_updated(self, job_id, bytes_processed_in_job):
         if job_id not in self.active_job_progress:
             return
         
@@ -267,70 +574,82 @@ class JobManager(QObject):
         self.total_bytes_processed_in_queue += delta
         self.active_job_progress[job_id] = bytes_processed_in_job
 
-        # Update speed history for rolling average
+        # Defer the speed/ETA maths and the UI signal to the next flush
+        if not self._progress_flush_timer.isActive():
+            self._progress_flush_timer.start()
+
+    @Slot()
+    def _flush_progress(self):
+        if not self.is_running:
+            return
+
+        # Fold the throughput since the last flush into the moving average (3 s time constant)
         current_time = time.monotonic()
-        self.speed_history.append((current_time, self.total_bytes_processed_in_queue))
-
-        # Prune old history points (older than 10 seconds)
-        while self.speed_history and current_time - self.speed_history[0][0] > 10:
-            self.speed_history.popleft()
-
-        # Calculate rolling average speed
-        overall_speed_mbps = 0.0
-        if len(self.speed_history) > 1:
-            time_delta = self.speed_history[-1][0] - self.speed_history[0][0]
-            byte_delta = self.speed_history[-1][1] - self.speed_history[0][1]
-            if time_delta > 0:
-                speed_bps = byte_delta / time_delta
-                overall_speed_mbps = speed_bps / (1024 * 1024)
-
-        # Calculate ETA based on the rolling average speed
+        self.last_progress_update_time = current_time
+        dt = current_time - self._ema_last_time
+        if dt > 0:
+            inst_bps = (self.total_bytes_processed_in_queue - self._ema_last_bytes) / dt
+            if self._ema_speed_bps <= 0:
+                self._ema_speed_bps = inst_bps
+            else:
+                alpha = 1 - math.exp(-dt / 3.0)
+                self._ema_speed_bps += alpha * (inst_bps - self._ema_speed_bps)
+            self._ema_last_time = current_time
+            self._ema_last_bytes = self.total_bytes_processed_in_queue
+        overall_speed_mbps = self._ema_speed_bps * _MB_PER_BYTE
+
+        # Calculate ETA based on the smoothed speed (straight from bytes/s, no MB round trip)
         bytes_remaining = self.total_queue_size - self.total_bytes_processed_in_queue
-        overall_eta_seconds = bytes_remaining / (overall_speed_mbps * 1024 * 1024) if overall_speed_mbps > 0 else -1
+        overall_eta_seconds = bytes_remaining / self._ema_speed_bps if self._ema_speed_bps > 0 else -1
 
         # Calculate overall percentage
-        percent = int((self.total_bytes_processed_in_queue / self.total_queue_size) * 100) if self.total_queue_size > 0 else 0
+        percent = int(self.total_bytes_processed_in_queue * self._inv_queue_size_pct)
         
         text = f"Processing queue... ({len(self.active_workers)} active jobs)"
         self.overall_progress_updated.emit(percent, text, overall_speed_mbps, overall_eta_seconds)
     # --- END REFACTOR ---
 
+    @Slot(object)
     def _on_worker_finished(self, worker):
         if worker in self.active_workers:
             self.active_workers.remove(worker)
+            self._all_jobs_cache = None
+        if self._active_by_id.get(worker.job['id']) is worker:
+            del self._active_by_id[worker.job['id']]
+            self._worker_devices.pop(worker.job['id'], None)
         if self.is_running:
             self._start_available_jobs()
         if not self.job_queue and not self.active_workers:
             self.queue_finished()
 
+    @Slot(dict)
     def on_job_finished(self, report_data):
         job_id = report_data['job_id']
-        finished_worker_job = None
-        for worker in self.active_workers:
-            if worker.job['id'] == job_id:
-                finished_worker_job = worker.job
-                break
-        if not finished_worker_job:
+        worker = self._active_by_id.get(job_id)
+        if worker is None:
             return
+        finished_worker_job = worker.job
 
         # --- START REFACTOR: Remove flawed "true-up" logic ---
         # The worker's progress signals are now the single source of truth.
         # This prevents over-counting and negative ETAs.
         self.active_job_progress.pop(job_id, 0)
+        self._active_sizes.pop(job_id, None)
         # --- END REFACTOR ---
         
-        self.completed_jobs.append(finished_worker_job)
+        # Report first: _add_completed_job decides from it whether the job is reportable
         finished_worker_job['status'] = report_data['status']
         finished_worker_job['report'] = report_data
+        self._add_completed_job(finished_worker_job)
 
         status_lower = report_data.get('status', '').lower()
         if 'error' in status_lower or 'failed' in status_lower:
             self.current_queue_had_errors = True
             self.play_sound.emit("error")
-        elif not self.window.global_settings.get("defer_post_process", False) and finished_worker_job.get("job_type", "copy") == "copy":
-            self.post_process_queue.append(finished_worker_job)
+        elif status_lower != 'cancelled' and not self.window.global_settings.get("defer_post_process", False) and finished_worker_job.get("job_type", "copy") == "copy":
+            self.post_process_queue[finished_worker_job['id']] = finished_worker_job
             self._start_post_processing_if_needed()
-        self.job_list_changed.emit()
+        self._notify_jobs_changed()
         if finished_worker_job.get("job_type") == "mhl_verify" and report_data.get('status') == 'Completed with issues':
             self.mhl_verify_report_ready.emit(report_data)
         ejectable_sources = report_data.get('ejectable_sources_on_success', [])
@@ -338,6 +657,7 @@ class JobManager(QObject):
             self.ejection_requested.emit(ejectable_sources)
 
     def queue_finished(self):
+        self._progress_flush_timer.stop()
         if self.is_running:
              if not self.current_queue_had_errors:
                 self.play_sound.emit("success")
@@ -346,42 +666,85 @@ class JobManager(QObject):
                 self.overall_progress_updated.emit(100, "Queue completed with errors", 0.0, 0)
         self.is_running = False
         self.is_paused = False
-        self.queue_state_changed.emit(self.is_running, self.job_queue)
+        self.queue_state_changed.emit(self.is_running, list(self.job_queue))
         
     def run_post_process_for_job(self, job_data):
         if job_data:
-            self.post_process_queue.append(job_data)
+            self.post_process_queue[job_data['id']] = job_data
             self._start_post_processing_if_needed()
 
     def _start_post_processing_if_needed(self):
-        if hasattr(self, 'post_process_worker') and self.post_process_worker.isRunning():
+        if self.post_process_worker is not None and self.post_process_worker.isRunning():
             return
         if not self.post_process_queue:
             self.post_process_status_updated.emit("")
             return
-        next_job = self.post_process_queue.pop(0)
+        from workers import PostProcessWorker
+        _, next_job = self.post_process_queue.popitem(last=False)
         next_job['status'] = 'Post-processing'
-        self.job_list_changed.emit()
+        self._completed_json.pop(next_job['id'], None)
+        self.job_status_changed.emit(next_job['id'])
         self.post_process_worker = PostProcessWorker(next_job, self.window.project_path)
-        self.post_process_worker.progress.connect(lambda cur, tot, name: self.post_process_status_updated.emit(f"Post-processing: {name} ({cur}/{tot})"))
+        self.post_process_worker.progress.connect(self._on_post_process_progress)
         self.post_process_worker.file_processed.connect(self._on_file_processed)
         self.post_process_worker.job_processed.connect(self._on_job_processed)
+        self.post_process_worker.finished.connect(self._on_post_process_worker_finished)
         self.post_process_worker.start()
 
-    def _on_file_processed(self, job_id, source_path, updates):
-        for job in self.completed_jobs:
-            if job['id'] == job_id:
-                if 'files' in job['report']:
-                    for file_info in job['report']['files']:
-                        if file_info['source'] == source_path:
-                            file_info.update(updates)
-                            break
-                break
+    @Slot(int, int, str)
+    def _on_post_process_progress(self, current, total, name):
+        self.post_process_status_updated.emit(f"Post-processing: {name} ({current}/{total})")
+
+    @Slot(str, list)
+    def _on_file_processed(self, job_id, batch):
+        self._completed_json.pop(job_id, None)
+        files_by_source = self._files_by_source.get(job_id)
+        if files_by_source is None:
+            job = self._completed_job(job_id)
+            if job is None:
+                # Evicted while post-processing; patch the archived rows instead
+                self._update_archived_files(job_id, batch)
+                return
+            if 'files' not in job['report']:
+                return
+            # Built lazily on the first callback; kept off the job dict so it isn't persisted
+            files_by_source = {f['source']: f for f in job['report']['files']}
+            self._files_by_source[job_id] = files_by_source
+        for source_path, updates in batch:
+            file_info = files_by_source.get(source_path)
+            if file_info is not None:
+                file_info.update(updates)
+
+    def _update_archived_files(self, job_id, batch):
+        archive = self._job_archive()
+        if archive is None:
+            return
+        try:
+            for source_path, updates in batch:
+                archive.update_file(job_id, source_path, updates)
+        except sqlite3.Error as e:
+            print(f"Error updating archived job: {e}")
 
+    @Slot(str)
     def _on_job_processed(self, job_id):
-        for job in self.completed_jobs:
-            if job['id'] == job_id:
-                job['status'] = 'Processed'
-                break
-        self.job_list_changed.emit()
+        job = self._completed_job(job_id)
+        if job is not None:
+            job['status'] = 'Processed'
+            self._completed_json.pop(job_id, None)
+        else:
+            archive = self._job_archive()
+            if archive is not None:
+                try:
+                    archive.set_status(job_id, 'Processed')
+                except sqlite3.Error as e:
+                    print(f"Error updating archived job: {e}")
+        self._files_by_source.pop(job_id, None)
+        self.job_status_changed.emit(job_id)
+
+    @Slot()
+    def _on_post_process_worker_finished(self):
+        # finished is emitted as run() returns; wait() just joins the thread before we drop it
+        if self.post_process_worker is not None:
+            self.post_process_worker.wait()
+            self.post_process_worker = None
         self._start_post_processing_if_needed()
\ No newline at end of file
@@ -3,39 +3,101 @@ import sys
 import os
 import json
 from datetime import datetime
+from functools import lru_cache
 import multiprocessing
-import tempfile
-import atexit
-import shutil
+from collections import OrderedDict
+from itertools import chain
 
-import psutil
 import qtawesome as qta
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QPushButton, QLabel, QFrame, QListWidget, QListWidgetItem,
+    QPushButton, QLabel, QFrame, QListView,
     QComboBox, QProgressBar, QMessageBox, QMenu, QInputDialog,
-    QFileDialog, QTextEdit, QStatusBar, QToolBar, QSizePolicy, QSplitter
+    QFileDialog, QPlainTextEdit, QStatusBar, QToolBar, QSizePolicy, QSplitter
 )
-from PySide6.QtCore import QTimer, QPoint, QUrl, Qt, QFile
+from PySide6.QtCore import QTimer, QPoint, QUrl, Qt, QFile, QThread, QMetaObject, QFileSystemWatcher, QRunnable, QThreadPool, QObject, Signal
 from PySide6.QtGui import QAction, QKeyEvent
-from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 
 import resources_rc
 
-from config import APP_NAME, PROJECTS_BASE_DIR
-from utils import get_icon, format_eta
+from config import APP_NAME, PROJECTS_BASE_DIR, get_resource_path
+from utils import get_icon, format_eta, atomic_write_text, json_dumps, json_loads
 from ui_components import (
-    ProjectManagerDialog, SettingsDialog, MetadataDialog, DropFrame, MHLVerifyDialog, JobListItem, ToggleSwitch
+    ProjectManagerDialog, SettingsDialog, MetadataDialog, DropFrame, MHLVerifyDialog, JobQueueModel, JobItemDelegate, ToggleSwitch
 )
-from workers import EjectWorker
 from job_manager import JobManager
-from report_manager import ReportManager
+
+DRIVE_POLL_INTERVAL_MS = 3000
+DRIVE_IDLE_POLL_INTERVAL_MS = 10000
+DRIVE_STABLE_POLLS = 5 # unchanged polls before switching to the idle interval
+DRIVE_EVENT_SETTLE_MS = 500 # let a mount finish before polling after a mount-root change
+SETTINGS_SAVE_DELAY_MS = 250
+PROGRESS_UI_INTERVAL_MS = 33 # at most one progress repaint per ~frame
+MAX_RECENT_PROJECTS = 5
+_DELETE_KEYS = frozenset((Qt.Key_Backspace, Qt.Key_Delete))
+_INVALID_PROJECT_NAME_CHARS = frozenset('/\\:*?"<>|')
+# The same file reports progress many times while it copies
+_file_name = lru_cache(maxsize=256)(os.path.basename)
+
+def _mount_roots():
+    # Directories that gain/lose an entry whenever a removable volume is mounted
+    if sys.platform == "darwin":
+        candidates = ["/Volumes"]
+    elif sys.platform.startswith("linux"):
+        user = os.environ.get("USER")
+        candidates = ["/media", "/mnt"] + ([f"/media/{user}", f"/run/media/{user}"] if user else [])
+    else:
+        candidates = []
+    return [path for path in candidates if os.path.isdir(path)]
+
+class _StateSaveSignals(QObject):
+    # Lives on the GUI thread, so emits from the pool arrive there queued
+    finished = Signal(object, bool) # (path, hash) signature of the written state, success
+
+class _ProjectStateSaver(QRunnable):
+    """Writes an already-serialized project state; skipped if a newer save of the same file was queued."""
+    def __init__(self, window, state_sig, generation, text):
+        super().__init__()
+        self._window = window
+        self._state_sig = state_sig
+        self._generation = generation
+        self._text = text
+    def run(self):
+        state_path = self._state_sig[0]
+        if self._window._state_save_generations.get(state_path) != self._generation:
+            return
+        try:
+            atomic_write_text(state_path, self._text)
+        except Exception as e:
+            print(f"Error saving project state: {e}")
+            self._window._state_save_signals.finished.emit(self._state_sig, False)
+            return
+        self._window._state_save_signals.finished.emit(self._state_sig, True)
+
+_stylesheet_cache = None
+
+def _load_stylesheet():
+    # Prefer the copy compiled into resources_rc; fall back to style.qss on disk
+    global _stylesheet_cache
+    if _stylesheet_cache is None:
+        resource_file = QFile(":/style.qss")
+        if resource_file.open(QFile.ReadOnly | QFile.Text):
+            _stylesheet_cache = bytes(resource_file.readAll()).decode("utf-8")
+            resource_file.close()
+        else:
+            try:
+                with open(get_resource_path("style.qss"), "r", encoding="utf-8") as f:
+                    _stylesheet_cache = f.read()
+            except FileNotFoundError:
+                _stylesheet_cache = ""
+    return _stylesheet_cache
+
 def _load_fonts():
     if sys.platform != "darwin":
         return
 
-    temp_dir = tempfile.mkdtemp(prefix="slate_fonts_")
-    atexit.register(shutil.rmtree, temp_dir)
+    # Extracted once into a per-user cache and reused by later launches
+    font_dir = os.path.join(os.path.expanduser("~"), "Library", "Caches", APP_NAME, "fonts")
 
     font_files_to_extract = {
         ":/fonts/SF-Pro.ttf": "SF-Pro.ttf",
@@ -43,25 +105,37 @@ def _load_fonts():
     }
 
     try:
+        os.makedirs(font_dir, exist_ok=True)
         for resource_path, filename in font_files_to_extract.items():
-            temp_path = os.path.join(temp_dir, filename)
-            resource_file = QFile(resource_path)
-            if resource_file.open(QFile.ReadOnly):
-                font_data = resource_file.readAll()
-                with open(temp_path, "wb") as f:
-                    f.write(font_data)
-                resource_file.close()
-            else:
+            target_path = os.path.join(font_dir, filename)
+            resource_size = QFile(resource_path).size()
+            if not resource_size:
                 raise RuntimeError(f"Could not open resource: {resource_path}")
+            # A size mismatch means a different build shipped a different file
+            if os.path.exists(target_path) and os.path.getsize(target_path) == resource_size:
+                continue
+            # QFile.copy streams straight from the resource and refuses to overwrite, so copy then swap
+            temp_path = target_path + ".tmp"
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            if not QFile.copy(resource_path, temp_path):
+                raise RuntimeError(f"Could not extract resource: {resource_path}")
+            os.replace(temp_path, target_path)
 
-        qta.load_font('sfs', 'SF-Pro.ttf', 'sfs-2-charmap.json', directory=temp_dir)
-        print("SF Symbols font loaded successfully from temporary directory.")
+        qta.load_font('sfs', 'SF-Pro.ttf', 'sfs-2-charmap.json', directory=font_dir)
+        print("SF Symbols font loaded successfully from the font cache.")
 
     except Exception as e:
         print(f"CRITICAL: Could not load SF Symbols font from resources. Error: {e}")
 
 
 class MainWindow(QMainWindow):
+    _YES_NO = QMessageBox.Yes | QMessageBox.No
+    _SOUND_URLS = {
+        "success": QUrl("qrc:/sounds/success.mp3"),
+        "error": QUrl("qrc:/sounds/error.mp3"),
+    }
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
@@ -70,42 +144,90 @@ class MainWindow(QMainWindow):
         _load_fonts()
 
         self.setWindowIcon(get_icon("tray.and.arrow.down.fill", "fa5s.rocket"))
+        self._icon_play = get_icon("play.fill", "fa5s.play", color="white")
+        self._icon_pause = get_icon("pause.fill", "fa5s.pause", color="white")
         
         self.project_path = None
         self.source_metadata = {}
         self.card_counter = 1
         self.naming_preset = {}
         self.global_settings = {}
+        self.recent_projects = OrderedDict() # path -> True, most recent first
+        self._settings_doc = {} # settings.json as loaded; keys this version doesn't use are written back untouched
+        self._settings_mtime = None # mtime of settings.json when last read or written by us
 
         self.eject_worker = None
-        self.job_item_map = {}
+        self._last_state_sig = None # (path, hash) of the last project state known to be on disk
+        self._state_dirty = False # set by anything that changes what _save_project_state writes
+        # State files are written off the GUI thread, one at a time; state path -> latest save number
+        self._state_save_pool = QThreadPool(self)
+        self._state_save_pool.setMaxThreadCount(1)
+        self._state_save_signals = _StateSaveSignals(self)
+        self._state_save_signals.finished.connect(self._on_project_state_saved)
+        self._state_save_generations = {}
+        self._settings_dirty = False
+        self._settings_timer = QTimer(self)
+        self._settings_timer.setSingleShot(True)
+        self._settings_timer.setInterval(SETTINGS_SAVE_DELAY_MS)
+        self._settings_timer.timeout.connect(self._flush_settings)
+        self._last_progress_key = None
+        self._last_file_progress_key = None
+        self._progress_complete = False
+        # Latest progress values waiting for the next UI tick; only the newest of each is shown
+        self._pending_overall = None
+        self._pending_file_progress = None
+        self._progress_ui_timer = QTimer(self)
+        self._progress_ui_timer.setSingleShot(True)
+        self._progress_ui_timer.setInterval(PROGRESS_UI_INTERVAL_MS)
+        self._progress_ui_timer.timeout.connect(self._flush_progress_ui)
         self.job_manager = JobManager(self)
-        self.report_manager = ReportManager(self)
-        self.player = QMediaPlayer()
-        self.audio_output = QAudioOutput()
-        self.player.setAudioOutput(self.audio_output)
+        # Built on first use: QtMultimedia loads its platform backend and report_manager pulls in reportlab
+        self._report_manager = None
+        self._sound_players = {} # sound type -> QMediaPlayer with its clip already loaded
         
         self._setup_ui()
         self._setup_menu()
         self._setup_drive_monitor()
-        self._setup_sounds()
         self._connect_manager_signals()
+        self._apply_stylesheet()
         
         self.load_settings()
 
-    def _setup_sounds(self):
-        self.audio_output.setVolume(0.8)
+    def _apply_stylesheet(self):
+        # Set app-wide once the widget tree exists (and before any dialog opens), so it is
+        # polished in one pass instead of restyling as each child gets parented
+        stylesheet = _load_stylesheet()
+        if stylesheet:
+            QApplication.instance().setStyleSheet(stylesheet)
+        else:
+            print("WARNING: style.qss not found. Using default styles.")
+
+    def _sound_player(self, sound_type):
+        player = self._sound_players.get(sound_type)
+        if player is None:
+            url = self._SOUND_URLS.get(sound_type)
+            if url is None:
+                return None
+            from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
+            player = QMediaPlayer(self)
+            audio_output = QAudioOutput(player)
+            audio_output.setVolume(0.8)
+            player.setAudioOutput(audio_output)
+            player.setSource(url)
+            self._sound_players[sound_type] = player
+        return player
+
+    @property
+    def report_manager(self):
+        if self._report_manager is None:
+            from report_manager import ReportManager
+            self._report_manager = ReportManager(self)
+        return self._report_manager
 
     def _setup_ui(self):
         if sys.platform == "darwin":
             self.setUnifiedTitleAndToolBarOnMac(True)
         
-        try:
-            with open("style.qss", "r") as f:
-                self.setStyleSheet(f.read())
-        except FileNotFoundError:
-            print("WARNING: style.qss not found. Using default styles.")
-
         main_widget = QWidget()
         main_layout = QVBoxLayout(main_widget)
         main_layout.setContentsMargins(0, 0, 0, 0)
@@ -151,7 +273,9 @@ class MainWindow(QMainWindow):
         options_grid_layout.setSpacing(15)
         options_grid_layout.addWidget(QLabel("Checksum:"))
         self.checksum_combo = QComboBox()
-        self.checksum_combo.addItems(["xxHash (Fast)", "MD5 (Compatible)"])
+        checksum_methods = ["xxHash (Fast)", "MD5 (Compatible)"]
+        self.checksum_combo.addItems(checksum_methods)
+        self._checksum_index = {name: i for i, name in enumerate(checksum_methods)}
         options_grid_layout.addWidget(self.checksum_combo)
         options_grid_layout.addStretch(1)
         self.create_source_folder_checkbox = ToggleSwitch()
@@ -180,13 +304,17 @@ class MainWindow(QMainWindow):
         job_queue_frame.setStyleSheet("background-color: #2c2c2e; border-radius: 8px;")
         queue_layout = QVBoxLayout(job_queue_frame)
         queue_layout.setContentsMargins(0, 0, 0, 0)
-        self.job_list = QListWidget()
-        self.job_list.setStyleSheet("""
-            QListWidget { background-color: transparent; border: none; }
-            QListWidget::item { border-bottom: 1px solid #3a3a3c; }
-            QListWidget::item:hover { background-color: #38383a; border-radius: 5px; }
-            QListWidget::item:selected { background-color: #404043; border-radius: 5px; border-bottom: 1px solid transparent; }
-        """)
+        # Model/view: rows are painted by the delegate instead of one widget tree per job
+        self.job_list = QListView()
+        self.job_list.setObjectName("JobQueueView")
+        self.job_list.setMouseTracking(True)
+        self.job_model = JobQueueModel(self)
+        self.job_list.setModel(self.job_model)
+        self.job_delegate = JobItemDelegate(self.job_list)
+        self.job_delegate.remove_requested.connect(self.job_manager.remove_job_by_id)
+        self.job_list.setItemDelegate(self.job_delegate)
+        self.job_list.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.job_list.customContextMenuRequested.connect(self.show_job_context_menu)
         queue_layout.addWidget(self.job_list)
 
         bottom_layout.addWidget(job_queue_frame, 1)
@@ -208,7 +336,7 @@ class MainWindow(QMainWindow):
 
         self.add_to_queue_button = QPushButton(get_icon("plus", "fa5s.plus", color="white"), " Add Job")
         self.add_to_queue_button.setObjectName("PrimaryButton")
-        self.start_queue_button = QPushButton(get_icon("play.fill", "fa5s.play", color="white"), " Start Queue")
+        self.start_queue_button = QPushButton(self._icon_play, " Start Queue")
         self.start_queue_button.setObjectName("PrimaryButton")
         self.cancel_button = QPushButton(get_icon("stop.fill", "fa5s.stop", color="white"), " Cancel")
         self.toolbar.addWidget(self.add_to_queue_button)
@@ -276,6 +404,15 @@ class MainWindow(QMainWindow):
         open_proj_action.triggered.connect(self.open_project)
         file_menu.addAction(open_proj_action)
         self.recent_menu = QMenu("Open Recent", self)
+        # Fixed pool of actions; _populate_recent_menu only rebinds text/data and visibility
+        self._recent_actions = []
+        for _ in range(MAX_RECENT_PROJECTS):
+            action = QAction(self)
+            action.setVisible(False)
+            action.triggered.connect(self._open_recent_project)
+            self.recent_menu.addAction(action)
+            self._recent_actions.append(action)
+        self.recent_menu.setEnabled(False)
         file_menu.addMenu(self.recent_menu)
         close_proj_action = QAction("Close Project", self)
         close_proj_action.triggered.connect(self.show_project_manager)
@@ -297,14 +434,47 @@ class MainWindow(QMainWindow):
         file_menu.addAction(exit_action)
         self.load_template_action.setEnabled(False)
         self.save_template_action.setEnabled(False)
+        # File menu entries that follow _set_controls_enabled
+        self._file_menu_toggle_actions = (settings_action, new_proj_action, open_proj_action,
+                                          self.recent_menu.menuAction(), close_proj_action)
 
     def _setup_drive_monitor(self):
+        from workers import DriveMonitorWorker
+        self.drive_monitor_thread = QThread(self)
+        self.drive_monitor_worker = DriveMonitorWorker()
+        self.drive_monitor_worker.moveToThread(self.drive_monitor_thread)
+        self.drive_monitor_worker.drives_changed.connect(self._apply_drive_changes)
+        self.drive_monitor_thread.finished.connect(self.drive_monitor_worker.deleteLater)
         self.drive_monitor_timer = QTimer(self)
-        self.drive_monitor_timer.setInterval(3000)
+        self.drive_monitor_timer.setInterval(DRIVE_POLL_INTERVAL_MS)
         self.drive_monitor_timer.timeout.connect(self.check_drives)
+        self._stable_drive_polls = 0
+        # Where the OS exposes a mount root, its directory changes drive the polls and the
+        # timer only runs at the idle interval as a safety net; elsewhere we keep polling.
+        self.drive_watcher = QFileSystemWatcher(self)
+        roots = _mount_roots()
+        if roots:
+            self.drive_watcher.addPaths(roots)
+        self._drive_events = bool(self.drive_watcher.directories())
+        if self._drive_events:
+            self.drive_monitor_timer.setInterval(DRIVE_IDLE_POLL_INTERVAL_MS)
+        self._drive_event_timer = QTimer(self)
+        self._drive_event_timer.setSingleShot(True)
+        self._drive_event_timer.setInterval(DRIVE_EVENT_SETTLE_MS)
+        self._drive_event_timer.timeout.connect(self._poll_drives)
+        self.drive_watcher.directoryChanged.connect(self._on_mount_root_changed)
+        self.drive_monitor_thread.start()
     
     def _connect_manager_signals(self):
         self.job_manager.job_list_changed.connect(self.update_job_list)
+        # Job changes cover completed-job history and the card counter bumped on job creation.
+        # Not job_list_changed: it is coalesced, and a save in that window would be skipped
+        self.job_manager.jobs_modified.connect(self._mark_state_dirty)
+        self.job_manager.job_status_changed.connect(self._on_job_status_changed)
+        self.job_manager.job_status_changed.connect(self._mark_state_dirty)
+        self.source_frame.path_list.paths_changed.connect(self._mark_state_dirty)
+        self.dest_frame.path_list.paths_changed.connect(self._mark_state_dirty)
+        self.checksum_combo.currentIndexChanged.connect(self._mark_state_dirty)
         self.job_manager.queue_state_changed.connect(self.on_queue_state_changed)
         self.job_manager.overall_progress_updated.connect(self.update_overall_progress)
         self.job_manager.job_file_progress_updated.connect(self.update_job_file_progress)
@@ -324,55 +494,95 @@ class MainWindow(QMainWindow):
         self.cancel_button.setVisible(is_running)
         self.start_queue_button.setEnabled(bool(job_queue) or is_running)
         if is_running:
+            # Sounds only play once a queue runs; load them now rather than when a job finishes
+            for sound_type in self._SOUND_URLS:
+                self._sound_player(sound_type)
             if self.job_manager.is_paused:
                 self.start_queue_button.setText(" Resume")
-                self.start_queue_button.setIcon(get_icon("play.fill", "fa5s.play", color="white"))
+                self.start_queue_button.setIcon(self._icon_play)
             else:
                 self.start_queue_button.setText(" Pause")
-                self.start_queue_button.setIcon(get_icon("pause.fill", "fa5s.pause", color="white"))
+                self.start_queue_button.setIcon(self._icon_pause)
         else:
             self.start_queue_button.setText(" Start Queue")
-            self.start_queue_button.setIcon(get_icon("play.fill", "fa5s.play", color="white"))
-            self.update_overall_progress(0, "Queue Idle", 0.0, -1)
+            self.start_queue_button.setIcon(self._icon_play)
+            # Applied immediately so a pending tick can't overwrite the idle state afterwards
+            self._pending_overall = self._pending_file_progress = None
+            self._apply_overall_progress(0, "Queue Idle", 0.0, -1)
             self.file_progress_label.setText("Idle")
+            self._last_file_progress_key = None
 
     def update_overall_progress(self, percent, text, speed_mbps, eta_seconds):
+        self._pending_overall = (percent, text, speed_mbps, eta_seconds)
+        if not self._progress_ui_timer.isActive():
+            self._progress_ui_timer.start()
+
+    def update_job_file_progress(self, job_id, percent, text, path, speed_mbps):
+        # The label follows the first running job; other jobs' updates are dropped here
+        active_job = self.job_manager.active_workers[0].job if self.job_manager.active_workers else None
+        if active_job and active_job['id'] == job_id:
+            self._pending_file_progress = (percent, text, path, speed_mbps)
+            if not self._progress_ui_timer.isActive():
+                self._progress_ui_timer.start()
+
+    def _flush_progress_ui(self):
+        # File label first: a completed queue's "Complete" label must win within the same tick
+        if self._pending_file_progress is not None:
+            self._apply_job_file_progress(*self._pending_file_progress)
+            self._pending_file_progress = None
+        if self._pending_overall is not None:
+            self._apply_overall_progress(*self._pending_overall)
+            self._pending_overall = None
+
+    def _apply_overall_progress(self, percent, text, speed_mbps, eta_seconds):
+        # Only the displayed precision matters; identical updates are dropped before any formatting
+        progress_key = (percent, text, round(speed_mbps, 2), eta_seconds if eta_seconds is None else int(eta_seconds))
+        if progress_key == self._last_progress_key:
+            return
+        self._last_progress_key = progress_key
         self.overall_progress_bar.setValue(percent)
         
         is_complete = (percent == 100 and text.lower().startswith("queue complet"))
-        self.overall_progress_bar.setProperty("complete", is_complete)
-        self.overall_progress_bar.style().polish(self.overall_progress_bar)
+        if is_complete != self._progress_complete:
+            # Re-polishing re-evaluates the stylesheet, so only do it when the property flips
+            self._progress_complete = is_complete
+            self.overall_progress_bar.setProperty("complete", is_complete)
+            self.overall_progress_bar.style().polish(self.overall_progress_bar)
 
         if is_complete:
             self.overall_progress_bar.setFormat(text)
             self.file_progress_label.setText("Complete")
+            self._last_file_progress_key = None
         else:
             speed_text = f"{speed_mbps:.2f} MB/s"
             eta_text = f"ETA: {format_eta(eta_seconds)}"
             self.overall_progress_bar.setFormat(f"{percent}% ({speed_text}, {eta_text})")
         
-    def update_job_file_progress(self, job_id, percent, text, path, speed_mbps):
-        active_job = self.job_manager.active_workers[0].job if self.job_manager.active_workers else None
-        if active_job and active_job['id'] == job_id:
-            if speed_mbps > 0:
-                speed_text = f"({speed_mbps:.2f} MB/s)"
-                self.file_progress_label.setText(f"{os.path.basename(path)} - {percent}% {speed_text}")
-            elif path:
-                self.file_progress_label.setText(f"{os.path.basename(path)} - {text}")
-            else:
-                self.file_progress_label.setText("Waiting...")
+    def _apply_job_file_progress(self, percent, text, path, speed_mbps):
+        file_progress_key = (percent, text, path, round(speed_mbps, 2))
+        if file_progress_key == self._last_file_progress_key:
+            return
+        self._last_file_progress_key = file_progress_key
+        if speed_mbps > 0:
+            speed_text = f"({speed_mbps:.2f} MB/s)"
+            self.file_progress_label.setText(f"{_file_name(path)} - {percent}% {speed_text}")
+        elif path:
+            self.file_progress_label.setText(f"{_file_name(path)} - {text}")
+        else:
+            self.file_progress_label.setText("Waiting...")
 
     def play_sound(self, sound_type):
-        if sound_type == "success":
-            self.player.setSource(QUrl("qrc:/sounds/success.mp3"))
-        elif sound_type == "error":
-            self.player.setSource(QUrl("qrc:/sounds/error.mp3"))
-        if self.player.source().isValid():
-            self.player.play()
+        player = self._sound_player(sound_type)
+        if player is None:
+            return
+        # Each clip keeps its own player, so replaying is just a rewind
+        player.setPosition(0)
+        player.play()
     
     def on_eject_requested(self, path):
         if self.eject_worker and self.eject_worker.isRunning():
             return
+        from workers import EjectWorker
         self.eject_worker = EjectWorker(path)
         self.eject_worker.ejection_finished.connect(self.on_ejection_finished)
         self.eject_worker.start()
@@ -385,25 +595,24 @@ class MainWindow(QMainWindow):
         self.eject_worker = None
 
     def keyPressEvent(self, event: QKeyEvent):
+        if event.key() not in _DELETE_KEYS:
+            super().keyPressEvent(event)
+            return
         if self.job_manager.is_running:
             return
-        if event.key() == Qt.Key_Backspace or event.key() == Qt.Key_Delete:
-            focused_list = None
-            if self.source_frame.path_list.hasFocus():
-                focused_list = self.source_frame.path_list
-            elif self.dest_frame.path_list.hasFocus():
-                focused_list = self.dest_frame.path_list
-            elif self.job_list.hasFocus():
-                selected_items = self.job_list.selectedItems()
-                if selected_items:
-                    widget = self.job_list.itemWidget(selected_items[0])
-                    if widget:
-                        self.job_manager.remove_job_by_id(widget.job_id)
-                return
-            if focused_list and focused_list.currentItem():
-                widget = focused_list.itemWidget(focused_list.currentItem())
+        focused = self.focusWidget()
+        if focused is self.job_list:
+            selected = focused.selectionModel().selectedIndexes()
+            if selected:
+                job = self.job_model.job_at(selected[0])
+                if job:
+                    self.job_manager.remove_job_by_id(job['id'])
+        elif focused is self.source_frame.path_list or focused is self.dest_frame.path_list:
+            current_item = focused.currentItem()
+            if current_item:
+                widget = focused.itemWidget(current_item)
                 if widget:
-                    focused_list.remove_path(widget.path)
+                    focused.remove_path(widget.path)
 
     def _set_controls_enabled(self, enabled):
         is_project_loaded = self.project_path is not None
@@ -421,17 +630,13 @@ class MainWindow(QMainWindow):
         self.settings_button.setEnabled(enabled)
         self.mhl_verify_button.setEnabled(enabled and is_project_loaded)
         self._update_report_buttons_state() # Manage session report button state
-        for action in self.menuBar().actions():
-            if action.text() == "&File":
-                for file_action in action.menu().actions():
-                    if file_action.text() in ["Settings...", "New Project...", "Open Project...", "Open Recent", "Close Project"]:
-                        file_action.setEnabled(enabled)
+        for file_action in self._file_menu_toggle_actions:
+            file_action.setEnabled(enabled)
     
     # --- START NEW FEATURE ---
     def _update_report_buttons_state(self):
         """Enable or disable report buttons based on job history."""
-        has_completed_jobs = any(job.get("job_type", "copy") == "copy" for job in self.job_manager.completed_jobs)
-        self.session_report_button.setEnabled(has_completed_jobs and not self.job_manager.is_running)
+        self.session_report_button.setEnabled(self.job_manager.has_completed_copy_jobs and not self.job_manager.is_running)
     # --- END NEW FEATURE ---
 
     def update_folder_creation_mode(self):
@@ -444,34 +649,47 @@ class MainWindow(QMainWindow):
         dialog = MetadataDialog(self.source_metadata.get(path), self)
         if dialog.exec():
             self.source_metadata[path] = dialog.get_data()
+            self._mark_state_dirty()
         
     def check_drives(self):
-        try:
-            current_drives = set(p.mountpoint for p in psutil.disk_partitions())
-        except Exception as e:
-            print(f"Error getting disk partitions: {e}")
-            return
-        new_drives, removed_drives = current_drives - self.mounted_drives, self.mounted_drives - current_drives
+        if not self._drive_events:
+            # Back off once the mount table has been stable for a while
+            self._stable_drive_polls += 1
+            if self._stable_drive_polls == DRIVE_STABLE_POLLS:
+                self.drive_monitor_timer.setInterval(DRIVE_IDLE_POLL_INTERVAL_MS)
+        self._poll_drives()
+
+    def _poll_drives(self):
+        QMetaObject.invokeMethod(self.drive_monitor_worker, "poll", Qt.QueuedConnection)
+
+    def _on_mount_root_changed(self, _path):
+        # Monitoring starts with the first project; a burst of changes collapses into one poll
+        if self.drive_monitor_timer.isActive():
+            self._drive_event_timer.start()
+
+    def _apply_drive_changes(self, new_drives, removed_drives):
+        if not self._drive_events:
+            self._stable_drive_polls = 0
+            self.drive_monitor_timer.setInterval(DRIVE_POLL_INTERVAL_MS)
         if new_drives:
             for drive in new_drives:
-                reply = QMessageBox.question(self, "New Drive Detected", f"New drive '{drive}' detected. Add it as a source?", QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+                reply = QMessageBox.question(self, "New Drive Detected", f"New drive '{drive}' detected. Add it as a source?", self._YES_NO, QMessageBox.Yes)
                 if reply == QMessageBox.Yes:
                     self.source_frame.path_list.add_path(drive)
         if removed_drives:
-            all_paths = self.source_frame.path_list.get_all_paths() + self.dest_frame.path_list.get_all_paths()
-            for drive in removed_drives:
-                for path in all_paths:
-                    if path.startswith(drive):
-                        self.source_frame.path_list.remove_path(path)
-                        self.dest_frame.path_list.remove_path(path)
-        self.mounted_drives = current_drives
+            # Match whole path components so /Volumes/CARD1 doesn't claim /Volumes/CARD10
+            prefixes = tuple(drive if drive.endswith(os.sep) else drive + os.sep for drive in removed_drives)
+            for path_list in (self.source_frame.path_list, self.dest_frame.path_list):
+                for path in path_list.get_all_paths():
+                    if path in removed_drives or path.startswith(prefixes):
+                        path_list.remove_path(path)
 
     def new_project(self):
         if self.project_path:
             self._save_project_state()
         project_name, ok = QInputDialog.getText(self, "New Project", "Enter Project Name:")
         if ok and project_name:
-            if any(char in project_name for char in '/\\:*?"<>|'):
+            if not _INVALID_PROJECT_NAME_CHARS.isdisjoint(project_name):
                 QMessageBox.warning(self, "Invalid Name", "Project name contains invalid characters.")
                 return
             new_project_path = os.path.join(PROJECTS_BASE_DIR, project_name)
@@ -494,56 +712,76 @@ class MainWindow(QMainWindow):
             QMessageBox.warning(self, "Invalid Project", "The selected folder is not a valid project.")
     
     def _load_project(self, path):
-        if self.project_path:
-            self._save_project_state()
+        # Callers save the outgoing project before prompting, so it isn't saved again here
         self.project_path = path
         project_name = os.path.basename(path)
         self.setWindowTitle(f"{APP_NAME} - {project_name}")
         self.queue_title_label.setText(f"<b>Job Queue - {project_name}</b>")
-        self.job_manager.job_queue.clear()
-        self.job_manager.completed_jobs.clear()
+        self.job_manager.clear_job_queue()
+        self.job_manager.load_completed_jobs([])
         self.job_manager.post_process_queue.clear()
         self.card_counter = 1
         self._load_project_state()
         self._set_controls_enabled(True)
         self._add_to_recent_projects(path)
-        try:
-            self.mounted_drives = {p.mountpoint for p in psutil.disk_partitions()}
+        if not self.drive_monitor_timer.isActive():
+            # The first poll records the current mounts as the baseline
+            self.check_drives()
             self.drive_monitor_timer.start()
-        except Exception as e:
-            print(f"Could not start drive monitor: {e}")
         self.show()
 
+    def _set_checksum_method(self, name):
+        # Unknown names (older projects/templates) fall back to the first method
+        self.checksum_combo.setCurrentIndex(self._checksum_index.get(name, 0))
+
+    def _mark_state_dirty(self, *_):
+        self._state_dirty = True
+
     def _save_project_state(self):
-        if not self.project_path:
+        if not self.project_path or not self._state_dirty:
             return
-        def dt_handler(o):
-            if isinstance(o, datetime):
-                return o.isoformat()
         state = {"sources": self.source_frame.path_list.get_all_paths(), "destinations": self.dest_frame.path_list.get_all_paths(),
-                 "checksum_method": self.checksum_combo.currentText(), "completed_jobs": self.job_manager.completed_jobs,
+                 "checksum_method": self.checksum_combo.currentText(),
                  "source_metadata": self.source_metadata, "naming_preset": self.naming_preset, "card_counter": self.card_counter}
         state_path = os.path.join(self.project_path, ".dit_project", "project_state.json")
         try:
-            with open(state_path, 'w') as f:
-                json.dump(state, f, indent=2, default=dt_handler)
+            # Completed jobs are pre-encoded per job by JobManager; splice them in as the last key
+            text = json_dumps(state)
+            text = f'{text[:-1]},"completed_jobs":[{",".join(self.job_manager.completed_jobs_json())}]}}'
+            state_sig = (state_path, hash(text))
+            if state_sig == self._last_state_sig:
+                self._state_dirty = False
+                return
+            # The snapshot is taken here on the GUI thread; only the disk write is deferred
+            generation = self._state_save_generations.get(state_path, 0) + 1
+            self._state_save_generations[state_path] = generation
+            self._state_save_pool.start(_ProjectStateSaver(self, state_sig, generation, text))
+            self._state_dirty = False
         except Exception as e:
             print(f"Error saving project state: {e}")
 
+    def _on_project_state_saved(self, state_sig, success):
+        if success:
+            self._last_state_sig = state_sig
+        else:
+            # Nothing usable reached disk: don't let an identical snapshot be skipped, and retry on the next save
+            self._last_state_sig = None
+            self._state_dirty = True
+
     def _load_project_state(self):
+        # Reopening the same project must not read a file with a write still queued
+        self._state_save_pool.waitForDone()
         state_path = os.path.join(self.project_path, ".dit_project", "project_state.json")
         self.source_frame.path_list.clear()
         self.dest_frame.path_list.clear()
-        self.job_list.clear()
+        self.job_model.clear()
         if os.path.exists(state_path):
             try:
-                with open(state_path, 'r') as f:
-                    state = json.load(f)
-                for path in state.get("sources", []):
-                    self.source_frame.path_list.add_path(path)
-                for path in state.get("destinations", []):
-                    self.dest_frame.path_list.add_path(path)
-                self.checksum_combo.setCurrentText(state.get("checksum_method", "xxHash (Fast)"))
+                with open(state_path, 'rb') as f:
+                    state = json_loads(f.read())
+                self.source_frame.path_list.add_paths(state.get("sources", []))
+                self.dest_frame.path_list.add_paths(state.get("destinations", []))
+                self._set_checksum_method(state.get("checksum_method"))
                 self.source_metadata = state.get("source_metadata", {})
                 self.naming_preset = state.get("naming_preset", {})
                 self.card_counter = state.get("card_counter", 1)
@@ -554,55 +792,31 @@ class MainWindow(QMainWindow):
                             job['report']['start_time'] = datetime.fromisoformat(job['report']['start_time'])
                         if 'end_time' in job['report'] and isinstance(job['report']['end_time'], str):
                              job['report']['end_time'] = datetime.fromisoformat(job['report']['end_time'])
-                self.job_manager.completed_jobs = loaded_jobs
+                self.job_manager.load_completed_jobs(loaded_jobs)
+                # Freshly loaded state matches the file; a missing/unreadable file stays dirty
+                self._state_dirty = False
             except Exception as e:
                 print(f"Error loading project state: {e}")
         self.update_job_list()
         self.update_folder_creation_mode()
 
     def update_job_list(self):
-        current_job_ids = {job['id'] for job in self.job_manager.get_all_jobs()}
-        items_to_remove = []
-        for job_id in list(self.job_item_map.keys()):
-            if job_id not in current_job_ids:
-                items_to_remove.append(job_id)
-            else:
-                job_data = next((j for j in self.job_manager.get_all_jobs() if j['id'] == job_id), None)
-                if job_data:
-                    self.job_item_map[job_id].update_status(job_data)
-        for job_id in items_to_remove:
-            for i in range(self.job_list.count()):
-                item = self.job_list.item(i)
-                if item and self.job_list.itemWidget(item).job_id == job_id:
-                    self.job_list.takeItem(i)
-                    del self.job_item_map[job_id]
-                    break
-        for job in self.job_manager.get_all_jobs():
-            if job['id'] not in self.job_item_map:
-                item = QListWidgetItem(self.job_list)
-                job_widget = JobListItem(job)
-                job_widget.remove_requested.connect(self.job_manager.remove_job_by_id)
-                item.setSizeHint(job_widget.sizeHint())
-                self.job_list.addItem(item)
-                self.job_list.setItemWidget(item, job_widget)
-                self.job_item_map[job['id']] = job_widget
-        self.job_list.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.job_list.customContextMenuRequested.connect(self.show_job_context_menu)
+        self.job_model.set_jobs(self.job_manager.get_all_jobs())
         self._update_report_buttons_state() # Update state whenever job list changes
         
+    def _on_job_status_changed(self, job_id):
+        job = self.job_manager.get_job_by_id(job_id)
+        if job is not None:
+            self.job_model.update_job(job)
+
     def show_job_context_menu(self, pos: QPoint):
-        item = self.job_list.itemAt(pos)
-        if not item:
-            return
-        widget = self.job_list.itemWidget(item)
-        if not widget:
-            return
-        job_data = next((j for j in self.job_manager.get_all_jobs() if j['id'] == widget.job_id), None)
+        job_data = self.job_model.job_at(self.job_list.indexAt(pos))
         if not job_data:
             return
         menu = QMenu(self)
         menu.setAttribute(Qt.WA_DeleteOnClose)
-        if job_data in self.job_manager.completed_jobs and 'report' in job_data:
+        report = job_data.get('report', {})
+        if job_data['id'] in self.job_manager.completed_jobs and 'files' in report and 'end_time' in report:
             reports_submenu = QMenu("Save Report", self)
             reports_submenu.addAction("Transfer Report (PDF)...", lambda: self.report_manager.save_pdf_report(job_data['report']))
             reports_submenu.addAction("Contact Sheet (PDF)...", lambda: self.report_manager.save_contact_sheet(job_data['report']))
@@ -618,32 +832,40 @@ class MainWindow(QMainWindow):
             menu.exec(self.job_list.mapToGlobal(pos))
             
     def _show_ejection_dialog(self, sources):
-        source_names = "\n".join([f"- {os.path.basename(p)}" for p in sources])
-        reply = QMessageBox.question(self, "Eject Sources?", f"The following sources were verified successfully and can be ejected. Eject them now?\n\n{source_names}", QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        source_names = "\n".join(f"- {_file_name(p)}" for p in sources)
+        reply = QMessageBox.question(self, "Eject Sources?", f"The following sources were verified successfully and can be ejected. Eject them now?\n\n{source_names}", self._YES_NO, QMessageBox.Yes)
         if reply == QMessageBox.Yes:
             for path in sources:
                 self.on_eject_requested(path)
 
     def show_mhl_verify_report(self, report_data):
+        if not report_data['failed_count'] and not report_data['missing_count']:
+            QMessageBox.information(self, "MHL Verification", "All files verified successfully.")
+            return
         msg_box = QMessageBox(self)
         msg_box.setWindowTitle("MHL Verification Issues")
         msg_box.setIcon(QMessageBox.Warning)
         summary = (f"Verification completed with {report_data['failed_count']} failed checksum(s) " f"and {report_data['missing_count']} missing file(s).")
-        details = ""
-        failed_files = [f for f in report_data['files'] if f['status'] == 'FAILED']
-        missing_files = [f for f in report_data['files'] if f['status'] == 'Missing']
+        failed_files, missing_files = [], []
+        for f in report_data['files']:
+            if f['status'] == 'FAILED':
+                failed_files.append(f)
+            elif f['status'] == 'Missing':
+                missing_files.append(f)
+        # Collected and joined once; += on a growing string is quadratic for large reports
+        parts = []
         if failed_files:
-            details += "<b>Failed Checksums:</b>\n"
-            for f in failed_files:
-                details += f"• {os.path.basename(f['path'])}\n"
+            parts.append("Failed Checksums:\n")
+            parts.extend(f"• {os.path.basename(f['path'])}\n" for f in failed_files)
         if missing_files:
-            details += "\n<b>Missing Files:</b>\n"
-            for f in missing_files:
-                details += f"• {os.path.basename(f['path'])}\n"
+            parts.append("\nMissing Files:\n")
+            parts.extend(f"• {os.path.basename(f['path'])}\n" for f in missing_files)
+        details = "".join(parts)
         msg_box.setText(summary)
         msg_box.setInformativeText("See details below. A full PDF report can also be saved.")
-        text_edit = QTextEdit()
-        text_edit.setHtml(details)
+        # Plain text lays out only the visible blocks; rich text would parse the whole report
+        text_edit = QPlainTextEdit()
+        text_edit.setPlainText(details)
         text_edit.setReadOnly(True)
         text_edit.setMinimumHeight(150)
         grid_layout = msg_box.layout()
@@ -654,47 +876,88 @@ class MainWindow(QMainWindow):
         if not self.job_manager.completed_jobs:
             QMessageBox.information(self, "No Jobs", "There are no completed jobs to report.")
             return
-        copy_jobs = [j for j in self.job_manager.completed_jobs if j.get("job_type", "copy") == "copy" and 'report' in j]
+        # Only full transfer reports can be merged; skip anything without the session fields
+        copy_jobs = [j for j in self.job_manager.session_copy_jobs()
+                     if 'sources' in j['report'] and 'start_time' in j['report'] and 'end_time' in j['report']]
         if not copy_jobs:
             QMessageBox.information(self, "No Copy Jobs", "Session reports can only be generated for copy jobs.")
             return
         
-        all_files = []
+        # One pass over the jobs; dicts dedupe sources/destinations while keeping first-seen order
+        sources, destinations, total_size = {}, {}, 0
         for j in copy_jobs:
-            all_files.extend(j['report']['files'])
-        
+            report = j['report']
+            sources.update(dict.fromkeys(report['sources']))
+            destinations.update(dict.fromkeys(report['destinations']))
+            total_size += report['total_size']
+
         consolidated_report = {
             'job_id': f"SESSION_{datetime.now().strftime('%Y%m%d_%H%M%S')}",
             'start_time': copy_jobs[0]['report']['start_time'],
             'end_time': copy_jobs[-1]['report']['end_time'],
-            'sources': list(set(s for j in copy_jobs for s in j['report']['sources'])),
-            'destinations': list(set(d for j in copy_jobs for d in j['report']['destinations'])),
+            'sources': list(sources),
+            'destinations': list(destinations),
             'checksum_method': copy_jobs[0]['report']['checksum_method'],
-            'files': all_files,
+            # The PDF builder walks the files once, so stream them from the jobs instead of copying every record
+            'files': chain.from_iterable(j['report']['files'] for j in copy_jobs),
             'status': 'Session Complete',
-            'total_size': sum(j['report']['total_size'] for j in copy_jobs)
+            'total_size': total_size
         }
         self.report_manager.save_pdf_report(consolidated_report)
 
     def get_settings_path(self): return os.path.join(PROJECTS_BASE_DIR, "settings.json")
     
     def save_settings(self):
-        settings = {"global": self.global_settings, "recent_projects": getattr(self, "recent_projects", [])}
+        # Coalesce bursts of changes (recent projects, dialogs, project switches) into one write
+        self._settings_dirty = True
+        self._settings_timer.start()
+
+    def _flush_settings(self):
+        self._settings_timer.stop()
+        if not self._settings_dirty:
+            return
+        self._settings_dirty = False
+        settings = self._settings_doc
+        settings["global"] = self.global_settings
+        settings["recent_projects"] = list(self.recent_projects)
         os.makedirs(PROJECTS_BASE_DIR, exist_ok=True)
-        with open(self.get_settings_path(), "w") as f:
-            json.dump(settings, f, indent=2)
-        
+        settings_path = self.get_settings_path()
+        atomic_write_text(settings_path, json_dumps(settings, indent=True))
+        self._settings_mtime = os.path.getmtime(settings_path)
+
+    def _apply_settings(self, settings, mtime):
+        self._settings_doc = settings
+        self._settings_mtime = mtime
+        self.global_settings = settings.get("global", {})
+        self.job_manager.set_max_concurrent_jobs(self.global_settings.get("concurrent_jobs", 1))
+        self.recent_projects = OrderedDict.fromkeys(settings.get("recent_projects", []), True)
+        self._populate_recent_menu()
+
+    def reload_settings(self):
+        # Re-parse settings.json only if it changed on disk since we last read or wrote it
+        if self._settings_dirty:
+            return False # our pending write wins
+        settings_path = self.get_settings_path()
+        try:
+            mtime = os.path.getmtime(settings_path)
+            if mtime == self._settings_mtime:
+                return False
+            with open(settings_path, "rb") as f:
+                settings = json_loads(f.read())
+        except (OSError, json.JSONDecodeError):
+            return False
+        self._apply_settings(settings, mtime)
+        return True
+
     def load_settings(self):
         settings_path = self.get_settings_path()
         if os.path.exists(settings_path):
             try:
-                with open(settings_path, "r") as f:
-                    settings = json.load(f)
-                self.global_settings = settings.get("global", {})
-                self.job_manager.set_max_concurrent_jobs(self.global_settings.get("concurrent_jobs", 1))
-                self.recent_projects = settings.get("recent_projects", [])
-                self._populate_recent_menu()
-                
+                mtime = os.path.getmtime(settings_path)
+                with open(settings_path, "rb") as f:
+                    settings = json_loads(f.read())
+                self._apply_settings(settings, mtime)
+
                 last_project = self.global_settings.get("last_project")
                 if last_project and os.path.exists(last_project):
                     self._load_project(last_project)
@@ -707,6 +970,7 @@ class MainWindow(QMainWindow):
             self.show_project_manager()
 
     def show_settings_dialog(self):
+        self.reload_settings()
         is_project_loaded = self.project_path is not None
         dialog = SettingsDialog(self.global_settings, self.naming_preset, is_project_loaded, self)
         if dialog.exec():
@@ -716,6 +980,7 @@ class MainWindow(QMainWindow):
             self.save_settings()
             if is_project_loaded:
                 self.naming_preset = updated_settings["naming_preset"]
+                self._mark_state_dirty()
                 self.update_folder_creation_mode()
                 self._save_project_state()
 
@@ -726,34 +991,36 @@ class MainWindow(QMainWindow):
             self.save_settings()
             self.project_path = None
         self.hide()
-        recent_projects = getattr(self, "recent_projects", [])
+        recent_projects = list(self.recent_projects)
         dialog = ProjectManagerDialog(recent_projects, self)
         dialog.project_selected.connect(self._load_project)
         dialog.new_project_requested.connect(self.new_project)
         if not dialog.exec():
              if not self.project_path:
+                self._flush_settings()
+                self._state_save_pool.waitForDone()
                 sys.exit()
                 
     def _add_to_recent_projects(self, path):
-        if not hasattr(self, "recent_projects"):
-            self.recent_projects = []
-        if path in self.recent_projects:
-            self.recent_projects.remove(path)
-        self.recent_projects.insert(0, path)
-        self.recent_projects = self.recent_projects[:5]
+        # Most recent first, matching the order stored in settings.json
+        self.recent_projects[path] = True
+        self.recent_projects.move_to_end(path, last=False)
+        while len(self.recent_projects) > MAX_RECENT_PROJECTS:
+            self.recent_projects.popitem(last=True)
         self.global_settings["last_project"] = path
         self._populate_recent_menu()
         self.save_settings()
         
     def _populate_recent_menu(self):
-        self.recent_menu.clear()
-        if hasattr(self, "recent_projects") and self.recent_projects:
-            for path in self.recent_projects:
-                action = QAction(os.path.basename(path), self)
-                action.setData(path)
-                action.triggered.connect(self._open_recent_project)
-                self.recent_menu.addAction(action)
-        self.recent_menu.setEnabled(bool(self.recent_menu.actions()))
+        paths = list(self.recent_projects)[:MAX_RECENT_PROJECTS]
+        for i, action in enumerate(self._recent_actions):
+            if i < len(paths):
+                action.setText(_file_name(paths[i]))
+                action.setData(paths[i])
+                action.setVisible(True)
+            else:
+                action.setVisible(False)
+        self.recent_menu.setEnabled(bool(paths))
         
     def _open_recent_project(self):
         if self.project_path:
@@ -764,9 +1031,11 @@ class MainWindow(QMainWindow):
             if os.path.exists(path):
                 self._load_project(path)
             else:
-                QMessageBox.warning(self, "Project Not Found", "The project path could not be found.")
-                self.recent_projects.remove(path)
+                # Prune and persist first so the menu is already consistent while the warning is up
+                self.recent_projects.pop(path, None)
                 self._populate_recent_menu()
+                self.save_settings()
+                QTimer.singleShot(0, lambda: QMessageBox.warning(self, "Project Not Found", "The project path could not be found."))
 
     def show_mhl_verify_dialog(self):
         dialog = MHLVerifyDialog(self)
@@ -778,6 +1047,28 @@ class MainWindow(QMainWindow):
         job = {"id": job_id, "job_type": "mhl_verify", "mhl_file": mhl_path, "target_dir": target_dir, "status": "Queued"}
         self.job_manager.add_job_to_queue(job)
 
+    def load_job_template(self):
+        file_path, _ = QFileDialog.getOpenFileName(self, "Load Job Template", PROJECTS_BASE_DIR, "DIT Templates (*.dittemplate)")
+        if not file_path:
+            return
+        try:
+            with open(file_path, 'rb') as f:
+                template_data = json_loads(f.read())
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not load template: {e}")
+            return
+        if "destinations" in template_data:
+            self.dest_frame.path_list.clear()
+            self.dest_frame.path_list.add_paths(template_data["destinations"])
+        if "checksum_method" in template_data:
+            self._set_checksum_method(template_data["checksum_method"])
+        for key, checkbox in (("create_source_folder", self.create_source_folder_checkbox), ("eject_on_completion", self.eject_checkbox),
+                              ("skip_existing", self.skip_existing_checkbox), ("resume_partial", self.resume_checkbox)):
+            if key in template_data:
+                checkbox.setChecked(bool(template_data[key]))
+        # A naming preset template still overrides the source-folder option
+        self.update_folder_creation_mode()
+
     def save_job_template(self):
         default_name = f"{os.path.basename(self.project_path or 'Untitled')}_Template.dittemplate"
         file_path, _ = QFileDialog.getSaveFileName(self, "Save Job Template", default_name, "DIT Templates (*.dittemplate)")
@@ -785,8 +1076,8 @@ class MainWindow(QMainWindow):
             return
         template_data = { "destinations": self.dest_frame.path_list.get_all_paths(), "checksum_method": self.checksum_combo.currentText(), "create_source_folder": self.create_source_folder_checkbox.isChecked(), "eject_on_completion": self.eject_checkbox.isChecked(), "skip_existing": self.skip_existing_checkbox.isChecked(), "resume_partial": self.resume_checkbox.isChecked() }
         try:
-            with open(file_path, 'w') as f:
-                json.dump(template_data, f, indent=2)
+            with open(file_path, 'w', encoding="utf-8") as f:
+                f.write(json_dumps(template_data, indent=True))
             QMessageBox.information(self, "Success", "Job template saved successfully.")
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Could not save template: {e}")
@@ -795,14 +1086,21 @@ class MainWindow(QMainWindow):
         if self.project_path:
             self._save_project_state()
         if self.job_manager.is_running:
-            reply = QMessageBox.question(self, "Exit Confirmation", "A transfer is in progress. Are you sure you want to exit?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+            reply = QMessageBox.question(self, "Exit Confirmation", "A transfer is in progress. Are you sure you want to exit?", self._YES_NO, QMessageBox.No)
             if reply == QMessageBox.Yes:
-                self.job_manager.cancel_queue()
+                self.job_manager.cancel_all_jobs()
                 event.accept()
             else:
                 event.ignore()
         else:
             event.accept()
+        if event.isAccepted():
+            self._flush_settings()
+            self._state_save_pool.waitForDone()
+            self.drive_monitor_timer.stop()
+            self._drive_event_timer.stop()
+            self.drive_monitor_thread.quit()
+            self.drive_monitor_thread.wait()
 
 if __name__ == '__main__':
     multiprocessing.freeze_support()
@@ -1,7 +1,7 @@
 # models.py
 from __future__ import annotations
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
 from enum import Enum, auto
 from typing import Optional, Any
 
@@ -18,12 +18,13 @@ class JobStatus(Enum):
     POST_PROCESSING = auto()
     PROCESSED = auto() # Indicates post-processing is complete
 
-@dataclass
+@dataclass(slots=True)
 class Job:
     """
     A structured data class representing a single job in the queue.
     Using a dataclass provides type hints, auto-generated __init__, and a
     single, clear definition for what constitutes a "Job".
+    Slotted, so instances carry no per-object __dict__.
     """
     # Core Attributes
     id: str = field(default_factory=lambda: f"Job_{uuid.uuid4().hex[:8]}")
@@ -53,7 +54,7 @@ class Job:
 
     def to_dict(self) -> dict:
         """Serializes the Job object to a dictionary for JSON storage."""
-        state = self.__dict__.copy()
+        state = {f.name: getattr(self, f.name) for f in fields(self)}
         state['status'] = self.status.name  # Store enum by its string name
         return state
 
@@ -66,7 +67,6 @@ class Job:
             # Handle legacy or invalid status strings gracefully
             state['status'] = JobStatus.QUEUED
         
-        # Create an empty Job instance and update its state
-        job = Job()
-        job.__dict__.update(state)
-        return job
\ No newline at end of file
+        # Slotted instances can't take arbitrary attributes; ignore unknown keys
+        known = {f.name for f in fields(Job)}
+        return Job(**{k: v for k, v in state.items() if k in known})
\ No newline at end of file
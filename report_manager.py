@@ -3,6 +3,7 @@ import os
 import csv
 import platform
 import subprocess
+from functools import partial
 from xml.etree.ElementTree import Element, SubElement, tostring
 from xml.dom import minidom
 
@@ -15,7 +16,6 @@ from reportlab.lib.units import inch
 
 from config import APP_NAME, APP_VERSION, FFMPEG_PATH, FFPROBE_PATH
 from utils import format_bytes
-from workers import PostProcessWorker, ReportWorker
 
 class ContactSheetItem(Flowable):
     def __init__(self, image_path, filename, width, height):
@@ -48,30 +48,29 @@ class ReportManager:
         if 'mhl_file' in report:
             self._generate_report(self._build_mhl_verify_pdf, report, "Report")
         else:
-            self._generate_report(self._build_copy_pdf_interactive, report, "Report")
+            self._generate_report(self._build_copy_pdf, report, "Report", ask_shoot_day=True)
             
     def save_contact_sheet(self, report):
         self._generate_report(self._build_contact_sheet_pdf, report, "ContactSheet")
 
-    def _generate_report(self, generator_func, report, report_suffix):
+    def _generate_report(self, generator_func, report, report_suffix, ask_shoot_day=False):
         default_name = f"{os.path.basename(self.window.project_path)}_{report['job_id']}_{report_suffix}.pdf"
         dialog_title = f"Save {report_suffix.replace('_', ' ')}"
         file_path, _ = QFileDialog.getSaveFileName(self.window, dialog_title, default_name, "PDF Files (*.pdf)")
         if not file_path:
             return
+        if ask_shoot_day:
+            # Dialogs must run on the GUI thread, so ask before handing the build to ReportWorker
+            shoot_day, ok = QInputDialog.getText(self.window, "Shoot Day", "Enter Shoot Day / Date (for report):")
+            generator_func = partial(generator_func, shoot_day=shoot_day if ok else "")
 
         self.window.show_status_message(f"Generating {report_suffix} for {report['job_id']}...", 0)
         
+        from workers import ReportWorker
         self.report_worker = ReportWorker(generator_func, report, file_path)
         self.report_worker.finished.connect(self.on_report_finished)
         self.report_worker.start()
         
-    def _build_copy_pdf_interactive(self, report, file_path):
-        shoot_day, ok = QInputDialog.getText(self.window, "Shoot Day", "Enter Shoot Day / Date (for report):")
-        if not ok:
-            shoot_day = ""
-        self._build_copy_pdf(report, file_path, shoot_day)
-
     def on_report_finished(self, success, file_path, error_message):
         self.window.clear_status_message()
         if success:
@@ -226,6 +225,7 @@ class ReportManager:
                             pass
                 elif thumb_mode == "filmstrip":
                     verified_dest = next((d['path'] for d in file['destinations'] if d.get('verified')), None)
+                    from workers import PostProcessWorker
                     worker = PostProcessWorker(None, self.window.project_path)
                     if verified_dest and worker._is_video_file(verified_dest):
                         filmstrip_paths = [file.get('thumbnail')] + self._generate_additional_thumbs(verified_dest, 4)
@@ -1,3162 +0,0 @@
-# Resource object code (Python 3)
-# Created by: object code
-# Created by: The Resource Compiler for Qt version 6.9.2
-# WARNING! All changes made in this file will be lost!
-
-from PySide6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x5cm\
-I\
-D3\x03\x00\x00\x00\x0088PRIV\x00\x00\x14\
-.\x00\x00XMP\x00<?xpacket\
- begin=\x22\xef\xbb\xbf\x22 id=\
-\x22W5M0MpCehiHzreS\
-zNTczkc9d\x22?>\x0a<x:\
-xmpmeta xmlns:x=\
-\x22adobe:ns:meta/\x22\
- x:xmptk=\x22Adobe \
-XMP Core 9.1-c00\
-2 79.a1cd12f, 20\
-24/11/11-19:08:4\
-6        \x22>\x0a <rd\
-f:RDF xmlns:rdf=\
-\x22http://www.w3.o\
-rg/1999/02/22-rd\
-f-syntax-ns#\x22>\x0a \
- <rdf:Descriptio\
-n rdf:about=\x22\x22\x0a \
-   xmlns:xmp=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/\x22\x0a    \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22\x0a  \
-  xmlns:stEvt=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/sType\
-/ResourceEvent#\x22\
-\x0a    xmlns:stRef\
-=\x22http://ns.adob\
-e.com/xap/1.0/sT\
-ype/ResourceRef#\
-\x22\x0a    xmlns:dc=\x22\
-http://purl.org/\
-dc/elements/1.1/\
-\x22\x0a    xmlns:xmpD\
-M=\x22http://ns.ado\
-be.com/xmp/1.0/D\
-ynamicMedia/\x22\x0a  \
- xmp:MetadataDat\
-e=\x222025-09-16T09\
-:51:58+01:00\x22\x0a  \
- xmp:ModifyDate=\
-\x222025-09-16T09:5\
-1:58+01:00\x22\x0a   x\
-mpMM:InstanceID=\
-\x22xmp.iid:3b18a60\
-c-cad1-43b3-a7a6\
--a0ee126706c0\x22\x0a \
-  xmpMM:Document\
-ID=\x22xmp.did:3b18\
-a60c-cad1-43b3-a\
-7a6-a0ee126706c0\
-\x22\x0a   xmpMM:Origi\
-nalDocumentID=\x22x\
-mp.did:17321faa-\
-686a-40ba-88f8-5\
-291b4740fdc\x22\x0a   \
-dc:format=\x22audio\
-/mpeg\x22>\x0a   <xmpM\
-M:History>\x0a    <\
-rdf:Seq>\x0a     <r\
-df:li\x0a      stEv\
-t:action=\x22saved\x22\
-\x0a      stEvt:ins\
-tanceID=\x22xmp.iid\
-:17321faa-686a-4\
-0ba-88f8-5291b47\
-40fdc\x22\x0a      stE\
-vt:when=\x222025-09\
--10T18:25:23+01:\
-00\x22\x0a      stEvt:\
-softwareAgent=\x22A\
-dobe Audition 25\
-.3 (Macintosh)\x22\x0a\
-      stEvt:chan\
-ged=\x22/metadata\x22/\
->\x0a     <rdf:li\x0a \
-     stEvt:actio\
-n=\x22saved\x22\x0a      \
-stEvt:instanceID\
-=\x22xmp.iid:6018c9\
-15-b3a9-474d-a69\
-4-2364d4b6dc31\x22\x0a\
-      stEvt:when\
-=\x222025-09-10T18:\
-25:23+01:00\x22\x0a   \
-   stEvt:softwar\
-eAgent=\x22Adobe Au\
-dition 25.3 (Mac\
-intosh)\x22\x0a      s\
-tEvt:changed=\x22/\x22\
-/>\x0a     <rdf:li\x0a\
-      stEvt:acti\
-on=\x22saved\x22\x0a     \
- stEvt:instanceI\
-D=\x22xmp.iid:60da5\
-4c2-f570-43f3-85\
-4b-fb01cfca3af8\x22\
-\x0a      stEvt:whe\
-n=\x222025-09-16T09\
-:51:58+01:00\x22\x0a  \
-    stEvt:softwa\
-reAgent=\x22Adobe A\
-udition 25.3 (Ma\
-cintosh)\x22\x0a      \
-stEvt:changed=\x22/\
-metadata\x22/>\x0a    \
- <rdf:li\x0a      s\
-tEvt:action=\x22con\
-verted\x22\x0a      st\
-Evt:parameters=\x22\
-from audio/x-wav\
- to audio/mpeg\x22/\
->\x0a     <rdf:li\x0a \
-     stEvt:actio\
-n=\x22saved\x22\x0a      \
-stEvt:instanceID\
-=\x22xmp.iid:1caf37\
-71-2b8c-44d9-be8\
-1-3bcce02ab99e\x22\x0a\
-      stEvt:when\
-=\x222025-09-16T09:\
-51:58+01:00\x22\x0a   \
-   stEvt:softwar\
-eAgent=\x22Adobe Au\
-dition 25.3 (Mac\
-intosh)\x22/>\x0a     \
-<rdf:li\x0a      st\
-Evt:action=\x22conv\
-erted\x22\x0a      stE\
-vt:parameters=\x22f\
-rom audio/x-wav \
-to audio/mpeg\x22/>\
-\x0a     <rdf:li\x0a  \
-    stEvt:action\
-=\x22saved\x22\x0a      s\
-tEvt:instanceID=\
-\x22xmp.iid:3b18a60\
-c-cad1-43b3-a7a6\
--a0ee126706c0\x22\x0a \
-     stEvt:when=\
-\x222025-09-16T09:5\
-1:58+01:00\x22\x0a    \
-  stEvt:software\
-Agent=\x22Adobe Aud\
-ition 25.3 (Maci\
-ntosh)\x22\x0a      st\
-Evt:changed=\x22/\x22/\
->\x0a    </rdf:Seq>\
-\x0a   </xmpMM:Hist\
-ory>\x0a   <xmpMM:D\
-erivedFrom\x0a    s\
-tRef:instanceID=\
-\x22xmp.iid:1caf377\
-1-2b8c-44d9-be81\
--3bcce02ab99e\x22\x0a \
-   stRef:documen\
-tID=\x22xmp.did:1ca\
-f3771-2b8c-44d9-\
-be81-3bcce02ab99\
-e\x22\x0a    stRef:ori\
-ginalDocumentID=\
-\x22xmp.did:17321fa\
-a-686a-40ba-88f8\
--5291b4740fdc\x22/>\
-\x0a   <xmpDM:Track\
-s>\x0a    <rdf:Bag>\
-\x0a     <rdf:li\x0a  \
-    xmpDM:trackN\
-ame=\x22CuePoint Ma\
-rkers\x22\x0a      xmp\
-DM:trackType=\x22Cu\
-e\x22\x0a      xmpDM:f\
-rameRate=\x22f44100\
-\x22/>\x0a     <rdf:li\
-\x0a      xmpDM:tra\
-ckName=\x22CD Track\
- Markers\x22\x0a      \
-xmpDM:trackType=\
-\x22Track\x22\x0a      xm\
-pDM:frameRate=\x22f\
-44100\x22/>\x0a     <r\
-df:li\x0a      xmpD\
-M:trackName=\x22Sub\
-clip Markers\x22\x0a  \
-    xmpDM:trackT\
-ype=\x22InOut\x22\x0a    \
-  xmpDM:frameRat\
-e=\x22f44100\x22/>\x0a   \
- </rdf:Bag>\x0a   <\
-/xmpDM:Tracks>\x0a \
- </rdf:Descripti\
-on>\x0a </rdf:RDF>\x0a\
-</x:xmpmeta>\x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-            \x0a<?x\
-packet end=\x22w\x22?>\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xfb\xb0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00Info\x00\x00\x00\x0f\x00\x00\x00\
-\x19\x00\x00?\xab\x00\x0a\x0a\x0a\x14\x14\x14\x14\x1e\x1e\x1e\
-\x1e((((3333====GGG\
-GQQQQ\x5c\x5c\x5c\x5cffffppp\
-pzzzz\x85\x85\x85\x85\x8f\x8f\x8f\x8f\x99\x99\x99\
-\x99\xa3\xa3\xa3\xa3\xae\xae\xae\xae\xb8\xb8\xb8\xb8\xc2\xc2\xc2\
-\xc2\xcc\xcc\xcc\xcc\xd7\xd7\xd7\xd7\xe1\xe1\xe1\xe1\xeb\xeb\xeb\
-\xeb\xf5\xf5\xf5\xf5\xff\xff\xff\xff\x00\x00\x009LAM\
-E3.100\x01\xba\x00\x00\x00\x00\x00\x00\x00\x00\
-4\xc0$\x06\x99M\x00\x00\xc0\x00\x00?\xab\x93R\xb1\
-\x92\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xff\xfb\xb0d\x00\x00\x05Mx:%\x05 \
-\x02P)'\x90\xa0\x08\x00\x19\xa9s+\xf9\xca\x80\x09\
-\x81\x0a\xa2\xa34`\x00\x80\x06\x00\x00<\x80\x00$D\
-\x00\x03\x18\xe1\x08B\x19\xe74\x08\x10 @\x81\x04<\
- \x81\x02\x04\x0cg\x84 \x81\x02\x04\x08\x10#F\x8d\
-\x1a4s\xdf\xff\xfes\x9c\xe1\xees\x9e\xd2\x01X\xad\
-\x1bt\xa2\x04\x0c7=\xf5\x08B\x08\xd1\xa3oj\x10\
-\xf0\xcf\xe9D\x08\x18\x9c\xe7\xff\xb9\xa3\x14\x0a\x09\x10 \
-@\x81\x02\x02th\xd1\xb7>\xa1\x00&+G\xaa \
-@\xc6AD\x08\x10B\xe6\x8d\x02\x04\x10\x84 \x81\x00\
-\xacVN\x8f`\x81\x02\x04m\xec!\x0c\xfes\x9a4\
-h\xe6\x90\xa0\x01\x81\xb0\xd9;s\xfep\x87\xfe\x0a1\
-\x0f\xe7=\xf0\x84'=\xf0\x84\x14a\x1a4h\xd1\xcc\
-\x7f\xf9\x0e|\x84l\x84!\x1b\xe8B\x10\x84\xa9\x09\xff\
-\xfa\xb9\x08B\x10\x94!\xcew\xf3\x90\x84\xff\xc9\xceB\
-7\x90\x87;\xfa\x9c\x80\x04!\x1b!\xces\xe8B\x01\
-\x9c?\x88\xde q@|\x1f\xff\x89\xc1\xf0p\x10\x04\
-5\x83\xe0\xf8>\x0e\x02\x0e\xfd2\x81\x85\x82\x05\xc1\xf0\
-}\x04\x15I\x94\xd5\xc5\xa4Y\x8bb:\x94\x08C!\
-\x9b\xb4\xc6%7\x9a\x85&gJ8\xf5Y\xf8o\x0e\
-\x82\x832\xf0\xac\xcd\x03Cr\x1d\x1f\xb8p\xcf'S\
-*\x87L~-\x168\x15\x13\x06\x85\xf04)\xac\x0c\
-@\x08\x01p\x19\xa3&\x06s\x0f\x81\x97Q\xe0i\x12\
-\xb8a\x11Z\x07\xb3t\xd6'`1\x08t\x06\x84a\
-h\x80\x84\x02\x18\x5c=P\xfc\xde\x9b\xc0\xc2\xe0p\xf5\
-\x81\xb1\xc0\x18\x05\x8b\xc1\x00\xc8Bd\x81\x97?\x0b\xe8\
-!\xe3\x98y\x87X\xec$M\x88 \xd0/\xfd\xe4\xf9\
-te\xc7\x19\x1e.r&\xc6\x89\x99\xa4\x89\x9f\xfc\x81\
-\x90t\x87<\xae\x5c\x22i\x17\x0a\xe8\x98\x9b\xb1\xaa\xd8\
-\xf7\xff7R\x0f\xe9\xad3\xd4\x0d\x17R\xd3\x7f\xff\xf4\
-\xd6\x9b\x99\x9b\xcc\xdd\x03|\x0f\x1e\xcb\xcd\xd3\x94\x00\x04\
- A\x08 \x03}Q3\x0e\x14\xc0\xe94\xe3\xff\xd1\
-\x1e\x1dM{\x9d\xf6\xbf\x17\xb7)\xbd\x03\x01\xd3\xed}\
-&L\x8f7!\xfe\x93\xa84\xa9\xd5\xb4\x1e\x01\x8ft\
-\xfc\xf1\x97cV(\xb6\xeby\x01wP\xe58\x5cp\
-\xe7\xad\xa3\x5c\xd5\xd9V\xdd\xc4\xac6\xf5u\xf6\x93\xe2\
-\xdaK=\xa4\xfd)\x9dg\xf4Y\xff\xf2/jU\x00\
-\x00%\x12\x0a\xc6c\xd1`\xf8j(\x18\x03\x19QM\
-1*\x19\xa3\x0a\x82\x0b5t\x06c\x07a(5,\
-\x07\xf3\x07\x80W\xff\xfb\xb2d\x13\x00\x06\x1cWO\xee\
-z\x80\x00d\x069\xcd\xce \x00\x10\x98\xb3\x12\xfd\xf1\
-\x80\x01\xfa\x90\xe2\xf7\xbc`\x010F\x04\x10pF0\
-#\x04\x00\x0c\xf3\x020\x840\x0d\x05\x91\xa0\x0f]\x9f\
-\xe0!h\x1a\x22B\xcd'06g\xc09\xd0\x01A\
-\x1f$\x04\xb9\xc0)\xd0\x19\xb3\x80\x08\x5c\x12 J\xa2\
-\x82\xfc\x04\x94\x03\x0e,\x0c`\xa0\xa0\x10,X\xc92\
-\x91y?\x88\x14.t=!B\x89\xb4R\x07\x12\xa9\
-\x7f\xc1\xba\xe2\x97\x0f0}\xc3\x13\x06E\x14\x91\x89\x8a\
-\x07QR\xff\x8aHg\xc5\x98L\x0e\xf1\xc08Fh\
-\x8a\xeaJ\xa5U\xff $\xa16Y'\x09\xf3b\xa9\
-\xb1\x16(\xff\xff\xfeX)\x13dP\xd0\xb6T'K\
-\xc6$\xc9\xc33\xa5\xc0\x00\x00\x01@\x00\x00@\x22\xd1\
-\xf0\xf8\x0e\x00\x19\x05\xa28\x88f\xb3\x0c2p;\xa2\
-\x12\x07\xf0p=\x1c\xca\xc4`\x10'\xfcr(\xb8\xd8\
-\x8bP,Pt\x02\xfe{\xd8L\xa1\xd7\xfdi\x8b\x8b\
-\x0d\x1d\xff\xd7\xdeM47\xff\xd2U\xd3\x88,*\x84\
-\xa7\xff\xf6zRnqG\x13\xa8\xcf\x5c\xd0a\xa1 \
-0\x14\x91\xef\xfd\x01P\xa8\x05B \x06\xdc\x8d\xa4A\
-\x83R\x1f\xd1\x8b\xb2Gq\xa1O@\xf1\xa41\xc4\x09\
-\x9aTQ\x09\x8f\xe0%)\x82\x94\x05\xe1\x81\xea\x09\x11\
-\x82b\x08q\x81\x5c\x05\x99\x80\xd8\x01\x89\x80\x10\x00!\
-\x80*\x00\x075\xfa\xf3\xf2\xf2#<\xf1\xa1\x93?\xba\
-\xbf\xeal\xb1\x8ce\x06<r1\xba\x0c\xeb:y\x13\
-\xee\xb9\x89\x17\x9c:\x0e\x896$\x03!\xcdHQ\xe2\
-\xbb\x19(\x08\x0d\x1d6\x80\xb9\xd7H\x0a\xb9\xac\xfaX\
-um\xd8z\xae\xed\x87\x14\xf47[W\xb3\xd0\xea\x80\
-\x00\x07\x1br\xdb#h\x98|\x07y\x82\x80\x19\x18\xd9\
-\xae\x91\xdc\xb4\x84\x99d\x10\x19\x8cp\x85\x98;\x00\x19\
-\x80\x18\x0a\x18\x12\x81a\x80\xb0\x07\x84\x00\x0b\xca\xcfT\
-\xb6\x91\xcaw\xa1\xe4M}\xe7\x12$\x94\x1cHu8\
-\x90\x08\x05e\x80H\xa1\x06\x05\x05\x1bG\x03n\xdfy\
-\xcb\xb9\xbc\xc4\x16\xb4sP\x8e,\xfa\x83[\x88\xbb\x8a\
-\xc3q\x0e\x01{fq\x9b\xb9j\xd4\x93x\xca\xd3\xad\
-\xc7:Gq\xe7\x7f\xbf\xfe\xd7cy\xfe\xbf\xf6\x00\x09\
-j[\x1a$\x03\x064\x0eS\x05\xfcT\x13(L\x16\
-c\xb8\x15\xf4C\x03\x18I\xa3\x0e\xb0\x0cC\x04,\x09\
-\x13\x00\xe4\x093\x02\x8c\x04S\x00\x94\x05\xb0P\x0b\xe0\
-`\x00\xd0\xc3\x9d\xfd\xeb\x90\xffo)\xbc\x91Hb\xae\
-\xe1\x18\x9e\x1a#C\x14Z\xff\xfb\xb2d%\x00\x03\x10\
-#\xc5\xd5|`\x00k\xc3\x88r\xaf\x8c\x00\x14\x5c\xfd\
-\x12\xd9\xf9\x00\x02\x10\x0b\xe1\xd7<0\x01\x0ay\x0d$\
--`\xa3y\x16\x9e\x14sG+\xff\xd4\xe5\xff\xf7\xb3\
-\xff\x1d\xa9\x0a.@\x03\x03T\x04\x13\x03\x04$3\x0c\
-\xfc:\x03S\xfcs\x03\x04\x5c\x14\x83\x02@\x08\xd3\x02\
-D\x02s\x00D\x02\xd1`\x0a\xc7@\x01\x12\x00\x1ds\
-\xcf\x7f\xef\xfc\xf3\x9e\x7f\xf6\x1f\xfe\xd1\xebl\xae\xb0\x19\
-\xb1\xccL((\x12\x0e\x1a\x0f\xcd<D\x06\xa9LU\
-\x9b\x7fW\xd9\x16\xdb\x1b~\xe8\xa4Q\xc7(\xdf\xbe\xb5\
-3\x8e\xf8\xb3g\xcaF\x11%\xb0\x02\xe0\xfb\x92\x96 \
-\x02I\x08\x00\x00\x00\x03\x1ai\xe8\x93\x9c \x9aC\x18\
-\xf8O\xf3\xcc\xd8\x1es\x0e\x11_\x03\x83(\xb3\xf3\x0d\
-\xe0\x11^\x18\x8e\x00\xbeh\xc1\x1a\x04\xd08\x05\xed\xeb\
-\x9e`\x1d\x00 `\x0c\x80\x22\x9f\x00?\x0cs_\x0b\
-\xe8\x17`\x9c\xedk\xb2\x85\x90#\xc1\xd68\xd7\xb6\xfc\
-T\xc7`\xb9\xc6L\x86+}kZ\xe9\x9a\x16\x8f\x97\
-\x09\xc4\xd6\xb5m^\xcbZ\xd36E\xcd\xd0F\xbdN\
-\xbajw_\xee\xc7\xba\xcd\xd4eM\x1a\x22\x05\x05\x05\
-.\x1c\x5c\x80EGo\x07R\xcb\x5c\x91\x84o\xc3\xc5\
-T\xc9\x91\xaaB\xc71-\xfe,m\x94\x1bw\xf1S\
-\x04\xd7h\x10\x00\x00\x00\x18\xb2[\xe9\xa8\x02\x0d\x19\x09\
-7\xa9\xf5\x10\xe0\x18\xd5\x1e1\xf6\xd0\xb3\x988\x04\xce\
-\xca\xc4\xbb\xccP\x02\x02_\xae\xff*rMF\x1c4\
-\x91L\x92\xc3\xcf\xdd\xc5\x1f\xc1\xfb\xad\x97\xa2\x06\xa6>\
-w\x0a\x1d\xb6\xc4\xcb \xbd\x10\xd5\xe7\xfe\xcf\x11X\x1b\
-\xb3{\x83\x8b:z\x8c\xbe\x5c=\xfe2\xf7Y6\xe6\
-\x95\xe4\xbf\x13V\xfd0\xb0)\xf0\xeb6\xcf2~\xef\
-\x08}\xc7\xe8\x9d\x8c\xff\xff\xff\xff\x8b_\xed\xf7\xff\xff\
-\xff\xff\x97\xad\xab\x88]\x00\x09A\x82\x08\x05\x02\x93\x12\
-D\x00\x0c\xb9\xc9\x90\xc2PlLL\xd5\xa0\xc5\xb7\x9a\
-\x8c\x0a\x03\xa0\xf4\xc5\x04\xcc \x03\x98\xc5\xdc0\xccz\
-\x07\x18\xc1h\x07M\xa0\x03\x18\xc0X\x0eL\x02A\xe8\
-\xc2H\x12\x0c0\x02\x94\xc2X#L\x0d\x00<\xc0X\
-\x05O\x1c\xf3\x86\xcc\x942\x01T\xa9]\x1d\x13\xe6\xe8\
-\x01\x876e\x8b\x80B\x19\x11\x0fK\x84\xce\x8c\xf8s\
-h\xa0\xcf\x14\x05\x180\xe1\xa3j\x98\xb2L\xeaS-\
-\x9a\x1eTd\x0e\x19\xe0\xc6\xcd\x19\x99\x1a\xb0\xa8\xfa\xb0\
-\xb6Y\xcc\xa63\x19\xad\x90(\xd9wL\x89\x932\x0c\
-\xd4\x181@\x13\x15\xdaq\xa3T\xce\xff\xfb\xb2dR\
-\x00\x08\xe8\x5cK\xd6{@\x00\x85\x85\x19f\xce\xbc\x00\
-\x0a\xf8C\x18]\xf1\x00\x01\xa9\x19$\xcf\xba\xc0\x01U\
-Z\xd4\xd4\xd8\xf1K\x12P\xc4\x0c\x05\x142\xa1\xd0\xde\
-.\xa0O\xeb\xf3fR\xe4\xb0\xda\xd5iiu\xdcV\
-\x99r\xd1\xcc\xb7\x8e\xa7\xaeDTZ\x91\xa8\xb6\xe3M\
-y\x9dR\xd9\xadZ\x9a\x9b\x7f[\x1cqq\xef\xe1\x0d\
-\xb9o\xdb\xf1{8\xc3\xf9K\x0e\xbf\xb9w\x1a\xd1\xa8\
-\xd6<\xff\xdf\xff\xff\xff\xfd\x8b}\xfa\xf4\xf6\xecs\xf0\
-\xc3\x0by\xe5\xbaZ]~\xf5\x951%\x9d\xff\x07\xc1\
-\x035\xff\x84\x81\xa8T\x15\x00\x02B\x04\x00@\x00D\
-\x9a\x19\xf80\x98\x12\xab\x18\xcaA\x19j\x0d\x9dO)\
-\x98\x1c\x03,s\x1a\x00\x070\xd02L \xbck\xf1\
-w\xee*`\xe86$\x07\xaa%\x80\xa2\x01,Q\xc7\
-V21f\xc0\xdc\x05\xf8\xaeD\x8fJB\x83\x15\xe8\
-\xc4I\x19\x0f\xdf\xbf\xbe\xaf\xf3\x07\x16,\x0b\xb4-\x85\
-Gw\x94\xa6\xe9okf\xbd\x9f\x11,\xf2\x91\xee\xf0\
-\xf9\xd0TE8\x1e>\x0880\x1f\x83D\xa0\x13\xe1\
-\x90\xc3!\xf0\xc40\x7f\x11h\xfes?^\xa1\x0e\x00\
-0*\x01\x010I\x02\x9b1U\x88\x913\x5c\x8c\xa8\
-1\x9f\x89q>\x8e\x89\xac0\xf0\x03\xd30\x9a\x02W\
-0\x92\x01\xed0RAd0<\xc0\x9a0#\xc0<\
-0\x13\x80V.*\xc5k\xb7\xa9\x84\xb6\x89\x96\xc4\x00\
-Q\xc5\x19\xd9\xe2B\x8e\x7fQ\xe3u\x88\xc3\x22A\x5c\
-\xe8\xdb\xff\xff\xfa\x00NJ\x0010S0\xc031\
-p\xaf0\xa5n2\xf3a<:\xda4\x0c~1\x5c\
-2&\x03\xdc4\x00\xbf)\xe8\xd7\xa9\xda\xca\x80\xa2\xa8\
-\x12T\xc9\x88\x92$\x89$\xd3\xdb2rb\xb7\xb1r\
-\xe7k\xd3k.\x5c\xb9\xdcir\xeb}kk|\xcd\
-V\xad[m\xadV\xd7\xb2\xdbZ\xcc\xe5\x97=Y\xb5\
-\xado\x99\x9c\xb7\xcc\xd6\xae\xdb\xc1E;\xd0\xf0h\xc5\
-\x00J\x02\x88\x00\x08\xc0|0(A+0j\x04\x22\
-2\x00\x12\x171\xa4\x14@<v\x90\xbd1\x07\x03\x1c\
-0n\xc1m8#\xd0\xd3\x89\x83G\x99L\xd8D4\
-9\xf8X_\x14\xb7\x86\xf7\xff\xfc\xff\xff\xfa\x09J\x01\
-\xc1\x00Q\xb9\x02\xefU\xa6ZN-\xe7\xfe\xfe~\x99\
-\x84\x022s\x06\xa3y\xe45\x84\x0aF\xb2]B\xd1\
-\x89\xf0\xcb\xf6\xbbOZk\xe9\xe9\xf5\xfd_\xdc\xee\x95\
-\xbbW\xee\xeb0\x00\x03\x00\xad\x0c\x93\xc10f\x05\xa8\
-18\x9651\x7f#\x5c<\xfd\x15I0\xe4\xff\xfb\
-\xb2DG\x08\xd3\xa0\x1e\xc4\xbb\xfcI\xe0\x8f\xe3\xc8b\
-s\xfc\x04\x11`w\x0a/\xed\xa6\x82\xa8<\xe0\xc1\xf5\
-\x8e\xd1\x04H0m\xc1\xf19\x04\xd8\xd9\x0a\xa3c\x99\
-M@85\xbaHX\xcf\x08\xb7\xcc\xff\xf7\xfd\xcf\x1d\
-\xeb\xdf\x07\x04\xc2 \xf7\xf1\xd0\xa7\xf7N\xfd\x9e\xdd\xa9\
-_[\xcb\xf7\xfc\xef9\xf1\xd8D\xb1\xc3~\xe4\x11c\
-\xabx\x9a\xa5\xb6\xc1\xc2\xaa:\xf3\x08\x14j\x10\x82/\
-\x96E\x99\x8b\x12I\x9b\x13\x1b\x0dm\x14J\xc2D\x8f\
-^M\x89\x13F\x9fp>>X\x84*\x5c\xa3\xa7\x12\
-\x14\x0d\xbe\xbaUZ\x92.\xc0\x18\x19\xa0a\x18\x1e\xc0\
-r\x98J\xe0G\x1b1\xa8c\x18Ox\xd6\x1a\x8b\xc7\
-*\x98Q\xe1\xb7\x18\x11@\xba\x99\x05!\xb3\x04\x1c\x88\
-\x91\xbe\x0f\x9b\xa9\xb1\x14\x14T\xfa=J\xd4\x95\x87\xe1\
-t<\x05\xf8OK\x0cG\x09\xf4\x9c\xeb\xa6\xee\xcdf\
-w\xa9\x88$\xc2\xa2\x894\xfcyb\x9406%H\
-2\xf0\xe2H\x1c\xbc\x85\xd3%\xc0*8\x98e\x86\x83\
--\x039\xa9u\xad\xd6qS\xe2I\xe03\x15\x03f\
-H\x04@\xb7\xe29\x82)\xac)S\xd8\xa8\xb3\x91@\
-\xf1UX`Z\x81t`\x96\x01\xaaaQ\x81\xf2k\
-\xc3\xa6\xf0b\x9c\xf3xd\xdf\x9c\xbab%\x86\xf0`\
-\x9f\x02\xd6`\x19\x80\xfc`&\x00*`F\x80\x88`\
-?\x00\x8e\x0a\x03\xa8X\x09\xa8w\xbc\xdf\xe7\xfb\xc3\xbc\
-\xcb\x98\xbcKe\x0b\x12\x09[`J\xad&\x8e\xee7\
-\xfbo\xe3\xe9\xd6%\x1e\x04 M\x1eO\xb6\xe3\x7fK\
-WC??815Z\x894,\x18\xb4H[\x02\
-\x9e\x88\xb5\x08\x8a\xad\xed\x8e\x95\xcb>{!\x04E\x9d\
-\x1e\x1aE\xff\xd8\xa3!\x8eJw)\x06\xbeFL\xa5\
-\x8f;\xc8O\x0a$\xf3#\x99\x9f\x14\xe4e$\xcbh\
-}3\xadMhrHW\x87d\xd4\x19J\x007\xe0\
-\x00`\x18\x80\xa8`\x01\x80\xf2`\xb0\x02\x8ao\x1b\x18\
-.b5\xe00w\x08\x92\x8ebP\x84\x1c`\xb8\x01\
-z}G\x18\x07\xe7\x06\x91\xc0\x9epk\x89b\x96\xed\
-\xe7\x9e{\xfe\xd6\xcd\x0c\x9eM\x0a\xbb'\xae\xd3\xd4|\
-\xd9\x94\xf1b\x88\xe4\xee\xbbhL\x00\xc7\xd7@\x86\x99\
-sx~`\xa8\xc65f^\x80oD\x06.\xd61\
-\xd5\x17J\xac\x08d\xf0\x12c\x9a\xe3\xbb\x05\xd89\xb3\
-M\x15r\x1c\xb7\x0b\xb5\xa4\x0c\x14\xa4H\xd2\x0dIi\
-\xb5\xb6/3\xb8N\x1e\xc5\x1c\x04\xaa\x0e\x01\xb3\x06 \
-\xe788\x06\xe3\x11m\xb07\x08C\x93\x0d\xd2\x00\xa8\
-\x98\xff\xfb\xb2dR\x09\xd4Z!\xc2\xb3\xfaI\xa0\x7f\
-+\xe8A{c&P\xfd\xab\x0aO\xecf\x89\xff#\
-a\x05\xed\x8c\x99a\x00\x18`x\x9c\x98T\x144\x9b\
-?\xe6\x85\x9fX\xe9\x13e\x9a6#k7\xd5\x09\xe6\
-/-YX\x83\x88\x1cl\xb2\xdc\xfad\xd0\xf9\xc3\x90\
-\xfc\xb9\xe6\xba\x10\x196p\xf3S\xca\x7f\xcez\x9eE\
-\xce\xcd\xe9\xe5\xe5\xbc'\xcaC\xad\xf7\xb7$\xe3\xca\xf3\
-\xca\x9f\xf0\xcc\xa1\xf4\xd1\x8c\x1f}\x89\xa0\xa5\xd0>\xf4\
-\x12\xfe\xd1\x02\xaa\x825\x8b\xff\xbac\x8c\xa1\x81Z\x04\
-\xd1\x82\x04\x07)\x84*\x1e\xf1\xac~/y\x91\xee\xbf\
-\xe1\xef\xd6\x12\x91\x89\xae\x00\xc9\x83\x80\x01\xe1\xe8\xb7\x9a\
-\x1b\xc9\x844\x0e\xaa\x83\x1fD\x80\xab\xa1\xe5\x92\xdf\xfb\
-\x97\xe6\xe0\xd5\xa0w\x14\x9c\xdf\xa7\x22j\xef\xec\xef\xfb\
-Is3\xff\x22?\xf8\xed\xd3\x97\x1f\xf2\x22\xb9Jm\
-;\xfb\xee\xd3K\xdbK\xcb^K\xa7\xe4s\xa6F\xdf\
-\x83=\x0eK{\xe4I\x91R<mH\xcbu/\xe4\
-{\xdd\xe7\xc2\xcbme\x94E\xc7^\xbf\xbc\xa9-\xf9\
-\xffL\x0a\x98`:\x05F\x04@\xae`\x82-\x86\x95\
-\xe8\x8ac\x1b|\xc7\x0f\xa5&~\xb0\xc6xR\x0e\x02\
-P\x100\x11hK\xb6\xa77\xbd.\xd2\xfd\xfd)\xd3\
-\xcfD\xf3b\x80\xa4&64G\xcf)\xe5\xe9\x0d:\
-P\x88\xef\xb9^\xb2\xa3B%\xb4\xe5\xca\xb1\xa3\xf6\x9b\
-\xa7\xecE\x91\x9b\x1b\x1d\xeb\xab\x02r,\xb8\x0d\xed\xc3\
-\xffa\x22\xbd8\xfc\x8c\xb4H\xbfGt\xe8\xfa\xc6>\
-\xba?\x0f>\xc1 \xcd\xff\x0e\xd6=\x1b\x7f\xd3\xee\x18\
-]\x1b\x1de\x00\x03\x00X\x07S\x00x\x12\x03\x01\x8c\
-Js>\x18\xe2C\x16\xb4\xb5\x93\xcd\xdc\x91c\x0e$\
-\x1e\xb3\x05`\x0f#\xc3\xab6\xb6\xf3XJ3\xb3s\
-:w\x1a\x04\xa7\x8d\x87\xc8\xed_w\xee\xe3\xb4\x10J\
-,\xf2\x0e#:\x07\xab\xf3,\xba\xa6\xa6+\x19\xfdC\
-\xd2Afc\xac\xa7L\x92\xc2\xb6S\xdb\xed\xbf\xbe\x94\
-=\xcf.\xa71\x91\x9e\xbdm\xbc\xc6\x9f\xa6\xed\xe4\xda\
-m\xf3F\xefR\xcf\x8a[\x11\xf4\xdb\xdb\xc8\xbb\xba\xd6\
-\xef{ik\xb9d\xb19\xf01\x0b\xe3$\x02%\x98\
-\x0c\x00\xb1\x82\x98\x82\x98\xaa%!\x8fk\xcd\x1f\x1c\x80\
-\xe8q1\x03\x82\xe0\xe1\x1c\x12H\xc0\x84\x80\x92\x92\xf3\
-np1w.\x99\xeb\x9e\xc7\x22\xe7Lr\xa0\xb7\xc6\
-@fR\xe9\x95j\xd5sv9\x0d\xd2\x8a?C\xb0\
-\xe1\x95#h\xdf\x99\xb2\xb6\xe5\xa73f\xf4>NJ\
-g\x9c\x0a|\xff\xfb\xb2dp\x8d\xd4K\x16\xc2\x13\xfb\
-1\xa2\x86\xae81{#4Y\xd9\xe8\xfc\x0f\xf1&\
-\x82+\xb3`\xc9\xe3\x0d\xb1\x13\xd6Gfr#\xedT\
-\x1a.\xf5K;N\xd8\x87\x1c\xc8\xc9g\x22\x91\x0f\xf9\
-\x11Dy\x92*\xfa\x96\x995'\x969\xf0\xe5\xab \
-)\xe1\xbd\x053c\xd70\x07\x00\x170\x09\xc0e0\
-:\x85\xb80v\xdb\xb71E\xf7\xed>\x96\xd4D0\
-\x8b\xc4-0D\x81\xda6\xcc4\xd5\xe7\xd3^\x0e\x0d\
-:\x195Rly@\xf9\xb9=X\xba(\xcd\x89\xb9\
-\xa9*^\x07\x91\xc6%\xbc\xa3K>\x96\xda\x8b>>\
-ry\xa8\xcf\x11\xab\xb8\x90\xf2ZP\x9d\x93I\x22X\
-A\x18\xa4\xd1\xb4\x5c\xbc3\x0b\xb1K\xb0\xce\xe7m\x97\
-Mu\xa787(-\xa9\x9b#']\xd2b\xa5\x12\
-y1MA\xfd\xf1\xb41\xcdN\x14\x8c\xfb\xbaKI\
-\xed\xad4\x98/\x13\x9d\xa8\x10\xf8.\xb4%\xe3j@\
-a\x99\x8e@\xaa\x15\x11]\xb0J\x9e\x1a\x94$\xb6\x1d\
-k\xc6\x0e\x15s\xfa\x82\x08\x15]\xb6z6\xcb\xc9\xb8\
-\x16Vm\xe2\x14\xd21\xaa\xbd8\xbb\x12]\xcf\x1bQ\
-Dr\xf1'\x9b\xa9`gH2` \x0f\x06c\xc7\
-fb\x82\x03\xa7\x91\xa3da\xa2\x07\xa6\x07\x80$`\
-*\x01 P\x03.\x02_\x85\x80\x1esy\xe7\x1e;\
-d<\xd5\xee\xef(\x946/M\x9d\x87Mzt\xc4\
-\x14?\x99\xd6\x11\x0aB\xec9z\xd6\xfdr\x9a1\xd5\
-R\x7f\x97s.\xa1\x1c\xb5\xd0\x22\xba\xf5\xe3djF\
-Y4y\x5c\xd6\x94\xe4\xec\xb9g%{\x1e\x88J\xb3\
-.F\x90\xbf\xb5s#i\x862:hRHg\xb1\
-H\x1d\xd5\x10\xb9\xce[\xbc\xb7\x19\xa8B\x06\xc0\xee\x9c\
-\xb5@\x0c\x06\x000A\x80\xb7\x18*\xe2&\x9aD\xeb\
-b\x18*Y,\x99\xf2F\x91\x18\x5c\x81x\x98\x15`\
-\xa2\x18\x01 F\x81\x80\xab?\x86\xcfJ@\xd9\x83\xdc\
-b\xdf=\x86\x19]\xa5\xd5\xbb\x175\x969Rj\xe7\
-\xef\x1eX\xadr_!\xa4\xb1P\xa31\x14o\xb1N\
-\xf4\x8b9L\x9c;Y\xc6\x90z'\xaan[\xe4\x14\
-`\xd7\x89\x9cK\x11`\xec\xd7x\x09\xf12q\xcdF\
-HIxP\xd2d6\x7f'\xd8\xc3\xa1>u\x1bF\
-\xb5\x16\x83\xe9S\x0a*o\xda$\x12&\xa9-r\xb3\
-\x8e\xd3\xd1\xae\x8b\xa0y\x89!\xa4\xd2\xd2s\x10UN\
-\x8fzd9|\x9f%\xaa\xe7\xae\xea\xcd\x848\xc3\xae\
-b\xa2\x0c^\xd4\x09F\x08\x16\x83\xe8\xd0\xbcF\xcd\xe7\
-\xf70\x18\x80\x00\xaa\xee\xff\xfb\xb2dc\x0d\x06\x15x\
-?\x8b\xfa2rR\x848\xaaw\x03&\x18\xd9\xdc\xfc\
-\x0f\xed&\x89j\x03\xa1\xc8\xfe\xe0\x08X\xc8\x04J\xd6\
-\x10\x04\x0b\x9a\xeez\x18\xb7\x07\x9d\xd6b\x1cj]\xc5\
-N\xe5\xb4\xc7]\x9c\xd1v\xe7\xf9\x1f\xcd\x22!\x9fJ\
-A,\xc4\x82\x98\xc5\xb8*\x16\x00\xb8u\x96\x91a\xce\
-b\x0d\x05L\x86\x0c\x82`\xff\xa2\xb1\xb4\xecg\xfd\xba\
-\x86z\xfc\x7f\xf4\xdd\xf4\x7f\x8d\xf5\x18\x18@L\x98&\
-`M\x18U\x00\xa0\x9b\x09FO\x99%\x13\xd8\x9eH\
-\x82\xea\x18\xa1\x80\xa6\x988\xa0'\x1d\xf1\xb1\x8e5\x18\
-\x93Y\x90\xac\x18\xf3 q\xeeJ\xb8\xcd\xc3U\xa6\xf1\
-\x04\xad\x0e\x9b\xee}Ns\x8e!\xb5N1\xae\xb7\x9e\
-\xc7\xca\x93Y\xf0DDq\xbd\x9e\xd6d\xa2\x87 \x9c\
-\x94\xde\xff(\xa8H\x81\xca9\xc4dk\xc6O\xdcY\
-v\xec\x85&\xe9\x87L\xc9\x04Q\x94\x1dY\x14\x90N\
-P\xb5\xe2\x9eH\xf7'd\xc2V\xdc%9#\xa5\xd5\
-i\xac\xb2=M2\x9e\xe7\x8a\xd5\xac\x9a\xb6\xd3\x09\xb0\
-\xbcS\xba\x22\xc9b\xeaec\xd1@\xd6(\x83R\x94\
-\x9e\x95\xce8\x94W\xc5\xfc\x0c4\xd9\xa4/\xa6,X\
-U'\xacM\xe0\x93W\xa5\xb32s\x9a4\x99RK\
-\xd1\x5c\x80\x01\x1d\x00\x5c`prF\x04\x18y\xc2\x98\
-\xa6u\x1c\xbe\x84\xe7\xaeF\xf6\xc0\xd0\x9a'-\xd7K\
-\xd4\xf0\xa1\xa64\xb0\x15\xe4D\xc0p\x92\x04\x82\x8f\x0d\
-\x1c\x8a\x10p]\xcd@\xac\x8fR{\xcdnK7;\
-\xc5c\x94\xa8|\xd5\xf6[\x22\xae\x95F\xf1\x85i\xdc\
-\xb4\xe3\xc7\x0b\xa9\xf6<r\x871S\x8a \x06@\x08\
-$\x01\x0c\xc0]\x06\x80\xcds\x02\xf8\xc3\x1c!\x04\xdf\
-B\x0b\x8c\xc2Z\x01\xe8\xc0\xcd\x01\x04\xef<3\xcb\x8c\
-ZP!\xa0\x0b\xa8\xcdF&.#\x9c4\x0ez\x88\
-\x99\xc36zf\x880\x84\x10\xe2}\x016\xbf\x91\xcb\
-\x91_\x90\xb4\xedv\x8b*p\xeb\x8a\xd0\x819\x08\xa1\
-\x839\xb3\xc7\xc2-\x5c\xdfZ\xe0\xa0\xc7V\x04u\x11\
-\xd2~\x0a\xd8\xa0\xa2\x8b2\xb6\x1a\x08k\xe6\xed\x01[\
-\x82\xdd\x1f\xa4f\xd3\x86\x0d\xe01\x989\x83\x8a\xfa<\
-DP\xac\xb5<28\xa3\xeb\xd68\x04\x11\xbaf$\
-;s\xf7\xae\xe8\x00\x04%\xc4@\x04Y\x89\x90\x84\x06\
-\x9d\x8e&\x17I\xe7/\x0a\x80a%IH(%2\
-\xa0\x10w\xef\xaeR\x7f!LZD\xba\x18\xaa:\x15\
-W`\x19z\x17\x12\xadN\xd4-\xc9X\xaa\x10?o\
-\xde]\xff\xfd-I\xb9>(\xdd\xff\xfb\xb2do\x0d\
-\x84\xc5rA\x0b\xfa\x19\xa2O\x03\xc8\x8at\xa3V\x13\
-9\xb9\x04/\xf0d\xc9S\x11\x22\x1d\xd0\x99\xa0\x0a\xfb\
-/\xdd\xf5W\x7f\x8f\xb7[\x0c\x01`\x01\xcc\x03\x90\x08\
-\x8c\x09@f\xcc\x87\x81\x0a\x8c1b7\x0dd\xe1+\
-\xce\xcc\xde49\x84\xc8\xc3\xc3\x10\x08\x8c2\x110`\
-\x10\xc2bE_b\x88[\xe1\xdbl%Sm\xc4\xf9\
-\x04\xa4\x00B\xd9\xcd\xa01\x068\xbd-\xf3%:F\
-z\x17\x1a\xb8\x93\x84\xb5b\xee\x93x\xb1\xea\xaf\x9er\
-:\x83\xbb\x0a%\x84\xf6|]hD\x0d\x03\xb1m\x9b\
-8G\x5c\xf1X@\xa5\xe6\xc8Z\xf9EB\xcaTA\
-M\xd2:Q\x5c\xeb.a\x0a\xd7\x08\x8d\x92\x93J\x1d\
-\xbc'W\x5cw( J\x8d\xc5\xb3\xf19d\x97\x5c\
-\xa4\x81.2\x00\x01\xd9\x5c\xc2 \x84\xc6b\xf8\xc4\xa4\
-4\xec\xc0,\x98DO7R!\x1f\xa0\x92oy\xf2\
-\xfa\xc7\x88\x95\x04\xec\xee\xd0\xa4\x00\xeaJ\x8d<\xb5~\
-\xcd\xde\xb3\xb5\x19\xdc\xc1\xccz\xf3\xad\xd5\xcb\xf4\xafB\
-uu\xf1Y\x7f\xd9\xca\x98\xee6\x13u\x98\xeai\xef\
-\xbd\xbbk5\x8aKU0\x1d\x04\x03\x00 \x8f0\x00\
-!\xe3>w\x8f0\x90\xfbc\x9f%\x0f\x11\x88\x81\x80\
-x8\x9bY\x1bB\x0b\x86V\xb1\xaa\x221^sz\
-\x15\xa9\xb3\x99%\xd9r:\xacq\xca\x94P\x8e\x08\x82\
-\x84\x86u\xc7\x10T\xed\xe1\x1a\x12\xe16B\x18\xce\xf5\
-\xc1oCfZ\x90r11oh\x12*\xc0ac\
-fF\xcdi\x12V\xce\x8a\x1c\xf1\xba\x0d\xec\x878\xea\
-Z\xe0\x9c\x10\xb2\x13\x1eV\xbd\x16\xe7m!\x84\x15\xb1\
-\xac\xea\xc0Y\xa26D\xe3E\xdd\xc6S\x22'=\xe3\
-\x19\x8b\x1fX\xf6\x83\x18O\x8b\x98\xa2\x0ca4E@\
-\x04\x11\x93\x8d\x10\x00\xa8\xe9\x85\x81F$M\x98\xa0\xd4\
-~B\x188 \xba\xda\xe3\xf9OI*\xfe+;\xe7\
->9>H\x8f\xa4+\xb5Q\xcc\x9e\x10$\x11\x86\x81\
-\xa7\x84\xce\x95/s\x5c\xe4E\xac6\x8fm\x83\x17\xef\
-\xff1G\xbb]\x9a\xdc\xcf\x7f\xd1\xdem]\xdbx\xa7\
-Y\x0c\x04@\x10\x98\x15\x0c\x1e\xc3l\xcb]h\x8co\
-w\x08\xe2l\xc4\xccDBP\xc1 \x0aC\xa4\x91\xa0\
-!\x01\x82\x18t\xf2\xce\xd9\xb21\x90\xb6\x9d\xd5\x15\xf4\
-\xd6\x8d\xec\xdb\xec\xf5?\x11\xc4G\x84\x03\x87\xdfMW\
-/\x97\xca\x8c\x99\xf9:\xd7\x09'\x0f\x17\xcb\x88lA\
-wrfb\x92\xde\xa6[\x15\xe7e\x8dn\xe7\xdes\
-_/\x1e\x9d\x1bxg\xed\xb4[\xe1\x18Q\xff\xfb\xb2\
-d\xab\x0d\x84\xc4v\xc0\x83\xd9\x19\xa2Q#\xa8\x9ap\
-#h\x14=\xe9\x02/`\xc6\x81#\x90\xe2\xe9\xb1\x0d\
-(\xa5\xceui\xba\xd8\x849\xc6\x1e\xb8\xbd\xe5DS\
-\xb5w,\xb7\x9f\xffI\xf1\xa8\x99\x9f\xbf1\xa5\xcb\xa4\
-\xa7\xb6r\xb3\x15\x99\x19\x8c\x9fv\xc7n\xf5x\xf5y\
-\xda1\x0bs\xeb\x0a\xc5y\xdb\x1a$\xaa\xd4\xb09\xaa\
-\x9b\x10Y\x1dAk0\x89\xca,\x0e\xc0O\xd3]\xd3\
-\xb5\xa6u\x1a\x94sc\x088$th\xa9\xe0\xec\xce\
-\xbb\x90=H6\x85\x9bT5^\x81}\x97L\xd3w\
-og\xde\x8f\x95C\xdb\xdbd\xad=T*\x93R*\
-@\x0c\x00\x10\x03\x02\xc0\x12\x98\x07\x80I\x18\xe7\x82\xc9\
-\x98<%~\x1aJ`h\x9e\x1cX\x18\xe9\x01\x12\xc2\
-\xa0\xd1\x90`\xa0$t&\xd3\xb2\x82\xdb\x0dU=a\
-Mb\xdd?\x17\x16J\x1f-t\xc3\xe6\x07\xdbM\xc9\
-S\xfdtq\x9fF\x82\xbb\xba\x9d?\x88c\x8b\xd2{\
-\xf25\x03\xe8g\x8cE\xd3[Vg+rEn{\
-\xe5\xae\x8bu(:WRYL\xcb\xa8+\xe5\x0f\xfb\
-5\xaeQ\x85|l\xf2\x0aO\xc9\x1c)\xb6\x93\xe6f\
-\x99\xe78\x92\x0ei\xb72\x952\x96\xc9\xae\x947\xef\
-]\xc9\xaeVll\x1d\x8b.\x93Q\xc6g/\x89\x9e\
-J\x07U\xe8\xee\x10\x8c\xa6\xf7\xf6\x94\x93\x18\xcc\x9c\xd2\
-$\xa6\xb6\xc79\x0a\xc1\xe0\xc1\x0a\x00\x12\xe2 \x00+\
-M\xba\xa6\xaa\x1c\x92\xce\x8c\xd2;A\xe7\xd4\x13\x0eQ\
-\xcd\xb5\xbd\xfa\x99\x9d\xbeK\x02<5\x01\xcd\x0c\x0dC\
-\x09\x04\x08\x18a\x0c\xb3a\x83\x8dZ\x8b\xb1\x05\xd72\
-\xd7\xfd\x12)D\xc7z\xc6\xb0\xe5/O\xec\x1bb-\
-\xda:J\xf7\xb1\xc9\x16\xadH\xd0[\x5c\xc2N\xbc\x98\
-\xfb\xc7%ZF\x03\x00D\x00\x00\x80\x1bL\x09\xb0\x1a\
-\x0cl\x10\x95\x8c(\x90T\x8d\x0a\xb0\x87\x8c\x13\xb0\x16\
-L\x06\xc0\x09\x0e\xd7L\xb4\xc0\x04\x03C\x0a&\xfc]\
-\xd8M\x87\xa9%\xf6JJ\x9b\xbcS\xac\xab?< \
-\x93jBQ\x8e\x11\x81\xe7\x03\xe8\xabm\x95\xa2}M\
-\xa9+(\xc6\xdb\xb3\xcb\x08mY\x1a\xb8&\x93\xa5u\
-\xd0\xe5/,E\x8bS\xef\xb5(\xb7+\x9c\xda\x8c'\
-=\xba\xebR\xd0|XfL\xd6\xa2Y=\xeaNy\
-jmn?\xc9\x1e\xde1\xd1M%\xdf\x1d8\xb5-\
-\x04\x07\xb5)*\xb30Bs<\xeb3qd\xde\xbb\
-4\x8e\xcb%\xd4\xd6\x96l\xc3S\x8a,\xf9\x90\xd8\xad\
-\xb1[Ql\xa5,zr\x93O\xb6\xe9SZ\x81#\
-\xff\xfb\xb2d\xe8\x0d\x95\xd1v\xbf\x8b\xfcI2Z#\
-\x98wpC8\x17\xd9\xe4\xfeO\xe5&\x89|\x0d\xa1\
-\x89\xc0\x8d\x98rkd\xad#N\xc8\x84\x04h\xf0\xa9\
-\x88\xdd\xc7I\x04\x8d\x03\x9b\xd9\xfb\xb5\xb1\xaf\xdc\xdf*\
-&\xadIL\x9dT\xf5\xda\x892\x15\xa2\xe2\xd00Y\
-\x01\xd6\x0a\xefp}\x83O\xbd\xa5\x1d8L6t\xfa\
-/p\xb5\x83m\xed[\xd8\xcf\x01\xad\x87\x9a\x14\xd0Q\
-5\xa5\x88\xcc\xcc\xb1h\x14\x13N2\xd4\xe7\x17\xdaX\
-\x9a\xce\xa4\xf1\xf2\xca\x00di\xc9\x12$\x92\xf6\x88@\
-H\xc0\x18#L\xca\x84`\xc1\x84\xf7M\x8d\xc6X\xc0\
-\xec\x10\xcc\x02\x00H\xc0\x1c\x02K^\x18\x01\x85\xfb.\
-\x0c'T\x97~\xf6X\xeb\xb7\x9a\xdf\xbe\xa6\xf6f\x84\
-\xee\x08\x92dX\xe9\xf1\xf6\x83\xe4\x1b\x1am\x19Q\x01\
-\x10\x85q \xa5\xa1\xb0\xb9\xf3\xa8X\xbaY\xf2\x85]\
-]4\x87i\x124\xe3$\xe5\xa7\x0eG\x09)\xb8\xbf\
-c\x8b\xdd\x05\xa4X\x11u}\x04\xc9\x89S\xb9wz\
-\xf2 j\xec\xd2+\xc6!!\xcf\xb7@l22P\
-\xb0\xe7\xfbS\x17\xd6W\x18\xb5t\x05\x02\xa4\x22rs\
-\x22<(C\xa8\x17b\x84z\xa1\x1f\x0e\x98\x82\xf3%\
-\xc1aP\xba\xe4)\x00\x0b\xb1\xc2P)\x97\x09\x06\x15\
- \x1d\xfc\x1c<\x0bu!\xfb`\x94*\xd1[\xb4\xb4\
-\xe3[\xea)\x1e\x1a\x03w\x18\x9dp\xc6g\x95(\xb9\
-\x9c\x9fyM\xd7\xf5\xc5e|WI{}8\xf3\xeb\
-\xff\xafg\xc5\xa1P\xcfq\xe1\x82w\xf7o\x97\xbe\xfd\
-\xd6\xae\xcf\xbd8k\xbb9-\x0ao(\xdf\xfa\xc3\x8f\
-\xe3\x8f\x9a\xfd\xf7{\xb3m\xd4Ya48\xa9\xbe\x15\
-\x0f\xe3D\x93\xa70\x1d\xb8\x13/sF5)\xd0i\
-\xa0T-\x1c\xc9\x82C\x81\x83\x81V\xef\x14QC\xf3\
-\x1c\x13\x8aW\x8b`\xe5\xcd\x84B\xb5\xffa\x97K\x0f\
-S)$\x9e\xa2*\x8a\xd0M\x02D\xa5W\x96\x1bl\
-\x9c\xc8\xbc\x86uX\x9a,\xe29\xbd!RV`F\
-\x8e\x22\x83l\xda6vQU5\xa0\x1f'(@\xc3\
-m\xce\x98\x80\xfa\x84f\x19\xd9&\x8d\xd3XLB\x08\
-\x91\x8b\x90\x900U\x94\x95ii\x9d*\xcb\x10\x1c\x1d\
-\xc2\x1e\x880\x8c\xda\x03\x87\xcf\x0f\xb6\xf42h\xda\x02\
-2P\x86\x16\x81\xb6\xd8|\xcb\x0a\x9eL\x0eYs@\
-\xc3\xcbL4\xcb\x05\xd0\x13\x0d\xb1\x05\x13\xf3\x83\x00\xae\
-\x91%\x91D8&\xd6%#\xad\x9b>\xe6\xc9\xeaM\
-2@~\xc3\xcb\xb6\xd3\xc4\x06\x0a\x80U\x0aFh\xd3\
-!.\xde\xff\xfb\xb2d\xf6\x80\xd5xuA\xd3\xc9\x1c\
-rg#hRpCLZ\xe1\xea\xf8\x0fm$\xc1\
-\xbb\xb5a\x09\xc0\x8d\xa1\x8c\x99b\x9bC\xa53\x03\x9d\
-NV,N\xb7\xf2WOc:^rr\xe6<\x16\
-\xa9@\xff\x1a\x882!YQ\xc7\x12H\x88\x94\xdfi\
-=\x0a\x99v\xa9'\x0e\xb1)e\xdc\x9f\xfe\x14R\xc8\
-\x9d8\x85u\x87\xd9\x99\x12e\xb5>\xbc?\xd3\xee^\
-[\xdd-G\xa5\xad0fs~!{\xdd\xf9\x97r\
-|\xbf\xd8\xc8\xb9{\x08\xfc\xedZ4\xf3\xbb\x93P\x1e\
-b\xe9\x00fg\xe60\x0c\x00\x00,\x0a\x04\xc5@\xc3\
-0W6\xe3\x0dg%6|\x15\x83\x09\x80?0\x1f\
-\x00\x85\x22\xd2\x94\x15a\x96\x11\xe5\xc8\xae)m,\xb4\
-c.\x8a\x06\xd8\xdb\x8e\xd1\xa8\xcb%\x03\xe5\x1a\xd2H\
-\xa9\xce\xcc\xb0\xe1$\x88\xd1\xa2\x81\xd2\xeeR\xc9\xc9\x09\
-t\xa1\xca\xb3\x88\xe1\xe7\xccu\x93Ajs@\xebt\
-3\xed\x8bA*.\x09\xc2\xb9\xf6\x9a\x83\x08\x02,\xd4\
-\x1b\xa3NR0jbd\x81\xd4\x97P\xcd4U\x96\
-`\x87\x1a\x8b\x05\x105s\x11D\x15\xa7\xb6\x10\x0cq\
-m\x10\xb6T4\x078s\xa2ZeoN\x1d\xf4\x8a\
--:\x89(?q\xcb\x00\xd1g\x08La\xc7\x05\xb9\
-\x08\xc6s5\xca%MI\x98a\x22\x8e$B\xf9y\
-\xde\x0b\xc3\x0b^x\x12!y\x9d?\x08gM,y\
-\xb0\xcc\x07\xa2\xbf\x08\x0b\xf67\x8b\xdb\x87\xec\x9d\xf7p\
-\x7fW\xd3#G\x13\x83=\xe6\xbbl\xed\xa4}R\xa8\
-\x9f!4\xe0\xdf\xad\xff\xf8\xdd\x1a\xd3\x94\xba`\xbf4\
-\xeb\xb8PR\x7f\xdb]\xf2\xde\xe4\xfcy\xfb\x8a\xae\x9c\
-\xff\xf3\xf7}-\xd1\x9a\x15\xc8\x9d[\xe6\xf4gU\xe5\
-\x97<\xa8\xbc5\xc4E\x08\x01\xf3\x04\x80N2h,\
-\x93\x16\x04\x019B\x04\x90\x97\x00\x86p0\xa1{\x10\
-\x9e\xa3IM\x15\xe1\xf6dU\xe4\xf1\xa1\x22\xea\x93\xf8\
-\xb6\xd2\xe1\xe8\xa57\x98\x9eH\xd1\xb8\x9e\xf0$\xc9\x07\
-\xbb\x05\xfe\x12!n\xcd\x1dU8,\xdc\x91i\xfd+\
-\xd2\xb4\x0eV\xb1\xb4\xd3+' \xc8\xd24en6\
-\xe7!\xe5\x16\x9e\xd3\x8f\x89\xdb\xa5\x8a*F$4\xa9\
-;8\x7fue\x16D\xc8\x84\xf9V\x98~dI\xc8\
-\xc7\xe7\x185+(\xe5\x05\x130\x84\xd4 \x19U\x12\
-\x19\xf4*Z\x16\x93\x91\xd2\xd5(\xe3oU\x93,\x97\
-fd\xae]%\x92x\xa9\x0aG\x98@\xb5I\x8f\xe4\
-t\xb3\x08\x1cvi\xc9\x81.\x5c\x95\x22z\x1ca\xa4\
-\xca#\x1e\xdf\x86\xa0\xff\xfb\xb2d\xf0\x0d\x85\xf9z\xbf\
-\x0b\xc93p``\x88Q\x1b;\x00X\xc9\xe4\xfa\x0f\
-m$\xc9e\x8e!\xdd\xa0\x8c\xf8\xc1\x94\x13\xa3P\x90\
-\xa9\xc6H\x00\xd5\xcaZi\x02\x85/\x80\xb6?6\x82\
-\x03\x12\x5cJ\xde\xac\x8b\x8c\xae)\x1a7(\x18qC\
-\x81\x85\x02\xc7\xa3\x03\xc0\x99&\x026\xadB\xd2\x08s\
-\xd4%\x1a0*\x87i\x7fu\xa9\x92M-dR%\
-\xe4\x11\xb7\x7f\x9d\x22\x81\xeb0i\xeb\xb6-`\x05\xa7\
-\xdd;eBUE\xec&\xf4\xd5\x18\x00\x07\xd9*L\
-\x03\xc0X\xcc\x9cX\x0c%\x05P\xdePLORc\
-.\x1c\x14\x011\x16\x1d\x9c)T\xfc\xe2\xa6\xe6\xc3\x06\
-\xd2V\xca.\xb9\x82]i\x02\xc2R\x8crC\x22\x81\
-J\x11\x00\xf8\x88\x94X\x03\xc1E\x80\xa0]\x18\x0a\x85\
-]\x5c\xda\xbddl\x1f\x81\x11w\x0e.\xcf\xe6\x97\x17\
-\xcbB\xb2JC\xa2&sW\x0e\xdc5\x06\xa7\x1cY\
-\x15\xa5\x0d\xb8\x1f\xabit-@R\xcc\x89\xf1\xd0o\
-P\xb8\xf0\x85f\xed\x0bE\xe1\x0do\x16\xb6\x9aZ[\
-<a\xb4\xe4\x9bg\x1c\xf5\xa00\xe5\x88\x5c\x87\xa2O\
-I\xe2\x9e\xb0\xd4E+d\xd4\x84\x93@(\x90}v\
-\x92&\xc1MRJ\xcc\xbc.\x15\x12+G\x0bzl\
-4\x94\x85\xa93H\x912Oi\xe4m\xbezR\xf1\
-\xd2\xa2\xec\xb2\x14t\x00\x1b\xdcHi\x98,\x82N(\
-\xe6\xcf\x00\x8c\x92,\x22.\x22\x84\xd9\x11\x5cV\xfd\x07\
-\xb5\xa5\xda\xbbV\x81\xecx\xf8\xd2\xeb\x95\xa6\xfd\xb1o\
-\xb9\xbb\xe5z\xfa\xc2h\xf6\xdd\xec\x19{3\x96F\xfb\
-\xb1_\xa3-\xfb\x7f\xed\x87w\xed\x7f\xb77{\x9d<\
-\x9a\x8e\xef\xe7I7;C}\x91\xdd\x84\x13\xfd\x0e\xa6\
-\x01\xdb\x9d\x0c\x88\xae\xa3~y\x18\x11W\x98,\x14\x9d\
-,&\x99\x0d\xd2\x1f\xe8\xa3\x9a\xd6\x00I/\xe2\xc20\
-w\x91\x9dK\xeec\x02h>\x16\xb3\x8b4\xcb\x90A\
-\xedg\x95S3\xaew\x1c\xfcI\xa6\xa9c\xc9\x15\x9e\
-Z\x04\x949\x1d\x94\xd9jpC\xd5\x22\x8cQ\x90Z\
-\x22-h\xed\xa5Oha\x03+4\xae/\x8c\xa2\xa3\
-\xecR&\x9aX\x80\xb3P0&\x7f\x8a\xcd\x90\xb2\xc4\
-\x10\xcf\x0b\xb8\xa8\xc1t\x90\x91\xf4\x8b\xb7\x8b\x1a\xa6\x18\
-\x8al\x92\xcd\x03\x06\x98 \x92v\xe6\xe4\xd6\xb1\x1dU\
-:eb\xea\xea\xb1i\x04W\x9c\x98If\x9aYR\
-\xc2\xb6\x8d\x12#\x9a\xf0\x22T\xd2k\x9dy1\xc8\xaf\
-\x14H\x8e\x0e\xdd\x09\x10\xa8\x98\xd2\xf8\x89\xab\x8e\x95Y\
-$k\x1apz\x91u\x8b\xa4\xff\xfb\xb2d\xf7\x8d\xd6\
-Wy\xbe\x93\xdaI2d\xa4\x18Rl&>XQ\
-\xe6\xfa\x0e\xe5$\xc9j\x10\xa1\x89\xa0\x8c\xf0$Og\
-~9\xd8\x04\x14qn\x86\xc9\x81-\x81I\x99\x1c\xbc\
-\xa9\x9d\xcf\xab|I\x1b\x90\x18H\x1c+\x0c\xc4$.\
-.Qo\xa3\x04\xc6\xafm\xcd\xb6\x82\x04\x05\xa7D\x0f\
-b\x1e\xd4J\x87\x1e1\x84\x1a\x83j\xa5\xb7%ft\
-\xb0\x9d\x0a\x99R\xd4 \xdf1\x1e@\xf4\x93\x06\xb2h\
-\xd5\xab\xbc\xda\xd6\xc6\x9eJQQ\x05p\x118@\x04\
-\x98\x06/\x1bJ\x90\x98\x87\xe4\x19\xc6v\x9c0\x17\xb5\
-\xbbECA\x00\x98u4I9\xeb\xb8Q\xa8L\xcd\
-\xf2,\xdcR\x81u\xb6\xd9M\xb5\x0e\x0a^\x8c\x9d\x01\
-\xf6\x0f=\x03\x0d\x03\x22\x0a\x15\xb4\xa3\xd7G\xa8\x08\x00\
-|\x89\xf9\x136\xda\xcd\xa3Ni\xd4\xc7\xd9,\xd2\x84\
-\xbc\x96R\x7f\xc4~\xe16\x1dJ\xa8\xd6\xa3\x14\xdb\x18\
-\x90\x98\xc0\x95\x02\x0e\xc1\xf2uIWE\x16\xe9\x8e\xba\
-\xfef\x8d&p\xa2\xc2\xa5\xa3\xb8B\x7fZd=5\
-\xe5\x14z\xa9)\x19>\xae\x80\xeb\xcd\x90\xa1\xf0\x98\xb2\
-\xd8\xac\x11\xb0\x9d\xb4\x92:*\xb9\x1b\xa9\xb6\x98I\x05\
-\xb56[T\xdb\xe1\xaf\xe8\x14\x8bF\x10\x22m\x22f\
-\x8d\xf6\xa5H\xcd2\xcb\x89E\x12%.\x92\xd8Q\x0a\
-\x8a*\xb0\xb0\x10T\x00\x10;\xe0\x0d,b\x00?1\
-\x8c\xe3UbE\xce\xbe\xfcS\xff\xad\xe9\xc1\xde\xaa;\
-\xbe\x16\x96$\x81X\xaej\xa9X\x1a\x13\x9c\x9f\xf9s\
-\xf2\xe4\xe1\xcd5f\xcf\xce\xfb{\x1f\xd2,\xbf\xd1!\
-/\xfc\xfe\xd2\xb2B\xe4\x9eE\xf6\xde\xe6E{\xff\xde\
-\xf9\xb4\xcc\xcc\xe5\xf3\xebk~\xdf\x84\xfc#K\xe6\x91\
-\xbdO\x85.\xe8\xdf\x96\x08\xe7J2\xa7\x19\x9c\x01C\
-\xd3,\x94\xc3\x1c\xef\x83\xed\xc5\xb0\x18\xa1\xa1\xac\xdd\xf1\
-}\x9c\x97\x86~\xd7D\x8e\x08\x9d>BRC\x0c0\
-KyD\xf8\xb3\xa0\x8d\x03(\xa2\xb1c\xd8\xcaXJ\
-qq\xd2\xb6\xab-A\x22\xe4\xb7\x1a\xd3-\xea\x88Z\
-x\xea\x08i<\x198\x8c\x95\x01\x03\xce\x15\x88\xdb\x84\
-\xaa[KMx\x10@Vr3L\xb59\x0a\x01\x9e\
-7\x8d\x88v3?\xcb\x129\xd2\x9bqF\xd4T8\
-\x8c\xa9c\x05\xa9D6<\x9a\xcc\xa6'\x22Jm\xa2\
-\xe5\x8d\x10\x8c\xab\x08\xb4\x831\x0d\x1bi\xe8\xcb*\xb0\
-\xe3Wb\x83!\x992\x80\x92WC\xca\xb6(\x93\x11\
-P\x9b\x08\x09M\xcc\xdbh<\x9bs\xc8[2\x8d\x09\
--\xce\xc8\xca\x22E2\x129\x95m\x14\xff\xfb\xb2d\
-\xf8\x8d\x16Dy\xbe\x8b\xb9I\x12h\x0exV\x0f#\
-\x04Y\x0d\xea\xf8\x0e\xe9$\xc1\x80)aY\x90\x8c\xf0\
-O\xc2P59\x85w\xb4\x10\x18N\xfd8\x84\x02Z\
-\x14\xa6\x9bi\x0fo2Qvg\xb4-\x91\x9d\xd1T\
-\x8c$\xd7<\xc8\xf3W\xf3YY\xbbaE\xca\xf2\x1d\
-\x85;\xf5\x9b\xfb\x0b\xfa\xb9f\xfb\xe7\xf9^\xf2\xe7\xc9\
-\xa6yg\xee\xd2[\xb7\x99\xbf\x83\xd3\xff\xf9\x90\x8dA\
-\xa5\xbd22f\xa2\xf9\xe4\x07\x10\xe8\x8d$T\x1d/\
-P\xa2\x1c4\xc46\x136 \x1f\xa6\xe2H\x0c\x190\
-\x81\x98\xa2y\x1e\xe6\x19\x0f\xb6\x93\x0c\xbe\x84`l\x1d\
-}\xa8D\x84\xea\x13=\x96$We\x14\x88\x11=y\
-\x1eU\xa5b\xc4\x98BFN\xaa!F\xa1\xb4e$\
-\x09\x22\xb2r\xb1JmE\xc7\xbb)\xb6B\x9ax\xd1\
-y \x0f\xa4\xcb\xde\x9aQ\xce\x90\xc6\xb0\x99d\xa0\xc9\
-3\x09A\x86\xd5\xc8,\xd2\xc8\xdaC\x93\xc5T\x89\xf2\
-\xc5\xcfM\xb2\xb1\x9a$\xd5\xa6\xd7eaY\xf5<W\
-H\xd1ClkIIT%\xa06V\xa0\x92\xe9\xc7\
-b\xc3\xa6B\xe2Y=g\xa3V\x17\x92 \x18P\xee\
-\xc4\xf59\x06 M6\x15D\xf4\xed\x813I\x14\xac\
-\xd5\x9c\xb5\x18\x95\x94]\x12\xe8\xcc\x13=_\x8e\x9a\xcb\
-A\x03N\xa8\xa0*@\x18\xd7P\xc8\x00~\xee\x01\x89\
-!\x88\x5c8\xd7\x8bT\x89\x14Q\x19\xe4\xe5F\x16\x93\
-3\xd5\x8bA\x13\x91\x04\x8a\x95GS\xc2\x07u\x95I\
-:R\xeep\x8ad\xf9\x9d\xe6n\x7f\xe9\x0a\xb19~\
-e\x18\xaf\xf1\x09\xad\xe7\xf6\xf4\x8ae\xfd\x07\xef\xb3&\
-1/\xa6C\x1aqA|p\x8d7r\xcb\x1e6U\
-\x9e\xccA7\x08\xcd\x0b\x84\x18\xf95U\xce\xef0}\
-\xdf\xba7\xf0\x04\x03\x99\xc6Y\x18\x8eq\x9c\xf27\x1b\
-\xc2\x98\x0c\xad\xcb\x028UE K\x91^)<\xc5\
-I\x1c\x1a M\x95\x08K\x9cl^-\x1e\xa5\x9aU\
-2\xc5\x12%\x8a\xd3?b\xbe\x9a*bj16\xde\
-\xb6\x9d\x92#\xe6\x22\x8d\xb7/&\x08\xd1\xb0\x9bb\x9b\
-B\xdc\x09.taD\xdamb4\x1a\x83\x11(i\
-\x96\xca\x12\xa2M\xa2\xb6h\x8cN&\x92\xa9Z\xb6a\
-\xa7\x22.\xab\x0d\x8aaoB\xa2Q$S\x14\x95\xbd\
-E\xf56\xa2\x8b\xab8\x08\x11\x9ah\x95(\x15\x91:\
-\xb4O\xbdr\x84\xf8X\x17\x92GUy\x0a\x8e5\xed\
-f\xe1$-\xa1\x8f\xb30\x9ar@\xad8yd\xd3\
-\xcc(\x92\x93\xccrH$\x85\xb4\xfb\x93T\x94\x91\xff\
-\xfb\xb2d\xf3\x8d\x86\x0dz>\x8b\xb9I\x10g\xe9\x08\
-Bd#>XE\xea\xfa\x0e\xe1$A\x8d\x14!\x9d\
-\x80\x98\xf8\xf6\xf5\x84m\xe4K\x8d\x10\x00\xcb\x99&r\
-[\x13\xda\xde6\xe2\x99\xc7g\xc8\x04\xac\xa5G\xb8\xa9\
-\xba\xd2\x03i\x12\x14z\x95\xa6\xee\x1dh\x91\xfb\xd5\xe4\
-\xe9\x9f\xba\xce\xfeP,\xf0$<\xdaL\x1b\x13\x1dh\
-v\xf3\x82\x8c\xa4\xd2Gc\xf9ZS\x1e\xc4\x83\x0e\x18\
-\xf0\x8b\x0c\xab2\x8c\xf1\xe1\xb1T\xec\x8a8\x04B\xbd\
-\xadH\x99KJ\x0d\x86\x09\xa9\xc6_ \x15\x85<\xca\
-\x82sv\x0f\xc0:\xb3\x8c\xa0\x90e\xd0gz\xb1>\
-Y^M?\xa4\xbe\xf2e\xe8\xe7\x1b\xe8\x8c\x1al\xed\
-\x1a\xf5\xae\xc4M\xf9OeEv\x03\x93,\xb3J\x92\
-\x13L\x96\xbc\xf9\xadl\x84\xb1)\xe3f\x99 .\x09\
-:l/\x01\xa2\xa8\x19\xde\xc0\xaa\x9a\x91w\xc1\xbe\xd9\
-\xc1Dc1\xecZ4\xbe\x22\xd5\xa6\xb2\xc7\xbe\x12H\
-\x89\x99\xbc\xb2\x14-Q \x8c\x87\x09\x91\x15d\x9ce\
-X\x98U\xd6C\x12\xcc\x89D\xe3h\x8e\x19\xa8\xc56\
-Xnm\xb6\xf5\xb1\x9e\xe2:f\x9bR\xe7'\xad\x11\
-\xe3\xd1\x15\xc8w\xa1F\xb1*\x14Z\x88>\xf3}\x92\
-S\xf09\xc2e\xd9&i\x95\xe9r\xc7\xeeU$]\
-\x02\xe2B?\x16\x08RA\x85\x09C\xe4$\xaa\x0b\x9d\
-!7\x14\x02F@\x02U\xd2\x01\xd3\x17\xf0\xb8\xed.\
-\xc5O\xd8\xff>\x19]R\x96\x84\x08\x8c:\xc4 \x80\
-\xc1U\x1c@\xb4\xca\x99\x8aRqf\x87\xc6\xcf~\x97\
-\xb9,\x8d\xd5\xab\x1e\xee>|'&\x85\xb4\xdf.\xb3\
-\x1f?\x99\xa2i\xea\xcf\x0a1\xb5C\xf5\xec\xca\xe4\xde\
-[\xc6\xfe\xb2\xe4q\xfe\xbc\xc8\xbe5\x5c\xce=\x22T\
-\x85\x08\xb9\x1e\xcf\x88\xa3S\xfb\xda\x0f\xa5!\x14<5\
-:\x1f\x01\x00i\xb0c\xc8o\xc03\x1f5\x00\xa8\xb5\
-\xbb\x8e^\xa4\x8b\x13\x1a\xe3\xa8\x89#\x8fH\xbd\x80\x90\
-\xee\x99\x8bx\x09\x87wX\xab\x92\x89X\x03\xfdG\x0a\
-r\x10\xec(\x119(\x86\x85K\x17NQ\xc7\x9c\x82\
-f$pRd\xddu*\x93cf\xfe\x9b\x83,9\
-(KK$\xa3T\x8e\xd1\x91G\x0a\x10\x8d\x121\xe0\
-\x18\xa4\xdaN\xc3\xa5,W,-\x058\x18\x84\x8a4\
-\xfak8\xc2)6\x9a\x99\x87\x229:2\x8f\x92\xfa\
-`\xa0\x8f\x03\x90;\xa5d\x0d)4\xebl\x16Q\xd6\
-$Bl\xd2\x01\x0e\xe1\x05\x93\xd2\x0b\xdd.\xee\x87\x91\
-H\x91\x81\xcb3\x0e\x8eQZe\xa8\xd6&L\xd8>\
-N\xc1\xff\xfb\xb2d\xf3\x8d\xd6Jy\xbe\x0b\x8cJ\xf2\
-nO\x08B\x07\x03\x02U\xe1\xe8\xfc\x0c\xf0\xc2\xc1\xa7\
-5 \xc4\x88\x8cA5\x14\x1b\x09\xf0.\x9f\xe9\xc5\x5c\
-\x88\x8d\xa3\xc5\xbf\x1c\x9aI8\xd5A\x1c.\x17\xd63\
-= \x00\x83N\xc0D\xa6r\x11\x937\xe18Y\x1e\
-\xd3&\xd4\xe4X\xe8\x5c\xb6\xfb\xc5TO+\x1a\xd4\xd2\
-\x7f\x9a\xf6\x83G\x1f\xf7$\xcb\x04\xdag\xae\xc4\x9c\xc8\
-\xcf\x90\xda\xf0\x9eZdt\xb3\xd3\x85\x0e\xaf\xd7\x1c\xde\
-g\xf9\x0co\x87\xe4XG\x0f_\x93r\xd9QD\x95\
-\x085\xc0\x01\xa8\xb5\x03:0\x07\xf0\x97\x85i\x9f\xc3\
-t\xbf9\xdf\xcc\x85\xba6\x9e#\x8c\x97\xd2\xebm\xf0\
-K\x09\xf1\x92k\xf9d\xd8\xf6\xb2$\xb2x\x1b,>\
-\x85\x19n\xe5\xf2qhD*\x9f&r\xad\x09'\xe7\
-\xa4\x1c\xa4\x0b\xa5$\x07t\xa7> \xd7-\x04\x89D\
-N\x05\x0c\x81\xee@\x8c\xb1(U\xce\xe1\x81V\x99]\
-~\xeb\x17\xbc\xacR\xednD\xd3\x97\xe905\x98j\
-HIz^366\xd3\x1e[\x1a\xcb\x97yR\xdc\
-\xb4V\x93\xdeJV\x87\xc2\x10\xc6oJ\xad#R\x1c\
-\x91\xc7\x9fP\x81\xb4-\xebU.\xb8\x87\xe2:\xcaL\
-\x87\xc6\xc2\x96\xc6\xcamgsePq\x82b\xae\xb1\
-\x837\x94\xf0(LX\x95\xcb\xbd\x12$%NB%\
-I\x9e\x0c\xd6\xbd\xa6\xe6C\x12V\xearB\xbb\xd7\xd4\
-\x13\x85\xa1\x96\x93\xa1V\x0c\x0a\x1f7 l\x91$\x89\
-\xe0\xba\xaa/\xa1v\xde\xfb\x8cW7\xb2\xc5\xa5\x04R\
-5$\x90\x1dm\xadE\x14l\xea29\x92\xc0\x89\x09\
-\xa5\xd1\x1d\x96\xc0n\x06\x89O\xa0\x9c\xe2\x85\xbcd\xe4\
-\xce\xc9F\x93\x9ah\x0a\xb7K\xe4\x97\x93X\xb4\x99m\
-\xe7\xa4\x85\x9b\xec\x92M\x12%\x14@\xdcih\xe9)\
-\xc5\xd4a6K&\xd6.\x93\xe73\x22\xe9\xc3\x1e\x5c\
-\xa94\x90k\x9c\x8c\x8eO\x88\xf4\xe4\x8eG\x09}S\
-J\xaa\x9bP\xf3\x9c\x92>^,\xd5\xc1\x22qP\xd6\
-Q\xfe\x12L\x8b\x85\xc0\x81a(-\xa4\xbe\x1aW\x11\
-h\xb9\x08\xdc3\xa6\xd3.\x85#8M\x91.\xb5\xe5\
-\x0feJ\xa5\x02\x0a*\xd4nu3\xe4\x92\xb9Ef\
-1\xe3\x1d\xca\xdc\xb5\xd6\xf8*zRr\x8f}\xbc(\
-\x8b\xe6F\xee\xab\xfa\xa3Q\x81\xc7))\x86Mg\xe1\
-\xf6\x8cJ{\xa5\xa0M\x90\xb3\x91\xeb\x970\xdb\x92q\
-\xf6\xddII\xc9\x1a\xa9^_\xb7+\x17\xed\x01\xb9T\
-z\x09\xc2\xd3 \x8c\xf3\xa6\xf6V\xd6A\xb5\x9f\x94@\
-\xdaTJS2\xff\xfb\xb0D\xf2\x81\xd5\x5cw?\xb3\
-l3r\xb7o'\xd0\x1bi\x04R\x99\xe7\x00$\xec\
-\xc2B<<\xa0\x05\xb1\x98\xe9\xdbF\xf9Cm[T\
-\xa4\xd0\xed%\xb7\xbd\xb3\xed4d\xcdC;V\xc4>\
-\xa5\x80\xb0WR|\x02J\x0a\x9e\xce\xefs.'z\
-}I\xda\xa5!$N\xd4\x0fR\xa4\x99\x92\x86\x9c\xe4\
-\xfb\x13\x8a\xa3\x12c.\xfaD\x9d\xe2\xe7\xe5\x11\xd2\x17\
-)\xd9\x87\xd6)9y\xe7\x17\xf5)E\xf6j\x0e\xb3\
-/\xef\xa5\x9bXIs\x88\xc3\x81\xee\xa6\xf9C\xf6\xd0\
-\xa9?\x91j\x8a\xb6\xcaB&\x9aQ\xa0*\x8b\xdb\xe6\
-J\x13[\xabv\xd3\x9f[\x0e\xefueesZ\x12\
-iV\xe4[eT\x94lb\x06xD\xee\xd9}\x92\
-5\xb2\x9b\xddOT\xf9\xcaZ\x1a\xc2\xf0(\xf3\xb8\xfb\
-\x85\x93\x0ePuhJ$\xd0\xe7\xd9z\xef^\x0a4\
-\xb4Z\xd5f\xe5\x9as\x99\x80\xac\x88\x09@\xa9\xa4\xa6\
-PF\xa2\xeb\x0a\xcf\xa8ua\x88\x10\x17V\x89\xab\x0a\
-W \x0fE[\x12$q\x18\x1d2\xec \xb4\xe4\xf3\
-\xac\xd8\xa3\xc8)\x1b\x22q\x15\x9aI92\x93=\x04\
-\x82MV\xa3n\x06Y9\x5c:%J\x8c\x8c0\xb6\
-&\x994\xb1B\x93\xba\xa73\x04\xea\x94S\x9e\x8a\x07\
-\x18\x05 \xc91\xf8\xe5\x92-$P\x19\xe6S~`\
-S\xa2h\x82\x0e@\xb2f\x15K>\x9b\x95\xcb>\xcb\
-2-6i-\x8c,\xd7%N=g \xc0\xa9\xe4\
-\x101\xe9\xeaKQ\xa6\xc8\xe62\x91\xc0Z\xc7\x1bo\
-\xa95p\xaf\xack\xea\xda{{\x87\xec\x8c\xe2:\x7f\
-\x0bl\x92\x88\x0d\xa7\x1c\xb23x%\x00R\x10N\x06\
-\x80\xf0\xbbC\x86\x0bb%\xb8\x1bm\xbb\xacb\xa39\
-w(\x90U\xeb\xe5mF\x10\x17cODe\x8c\x17\
-\x8a\xf0\x8a\x086\x0e2\xdd\x82nf9\x04\x98VA\
-\xc9\x8d5FL\x93`\xd2\x91\xdc\xc4G\x1a\x85\xef\x89\
-t]]P\x10\x08>AU[\xdc\x22\x05Bch\
-2\x85%'PL\x90\x09d\xcc\xf24T\x1c\xab\x82\
-\xca\x97\x8ae\x1cl\x07\x10\xb8\x86\x01_\xb0\xa4Y\x19\
-H~\xa9\x994\xb1\x19\xe6\xe0\xd9 \xc1\x10\xc9\x82\x1d\
-G\xbb\x88R\xfa\x87\x90>\x0a\xf5\x84\xb0\xe8\x9eQe\
-\xd2V\x0c\x0aN:\x11\x912\x14'\x10\xa6Dc\xb6\
-\x9bxH\x92E\x1c\x92\xa4*B\x09+)\x9el\xf7\
->\xa4\x9a8\xda#hN,\xe5\x22\xa4\xce\xb1\xca\xc4\
-@\xde\xb2\xf6\xcf\xa0m\xealV\x19\xa3\x8b\xa1\x824\
-\xae\xdc\x944\x81\xb9\x91\xff\xfb\xb2d\xd6\x0d\xd5\x7fy\
-\xbf\x0bi2\xf0\x83\xcf(\x11`\xc3NW\xa1\xe6\xfa\
-\x0c1%\x0a\x11<\xe0D\xf3\x0d\xb9\x1fb\x90\xac\xaa\
-\x8b\xb2T\xaa\x9dC\x88\x04\xea\xa15\x8b$\xb1$Q\
-\xa2\xb4\xc9Ji,\xd4\x22\x9e\x15el\xeat\xc5f\
-\xd4{%\x11\xf2V\xed\x85\xd8 n\x0d1tLJ\
-\xcc\xed\x93l+V\xf3K@\xb3\x0e\x1eM\x12\x9b1\
-\xac\xf3\x0d\xeea\xcb=3\x9bK\xf5\x8a\xf5\xb3\x06G\
-J=\x98\xfcK\xf5\xb3\xefv\x7f\xb7E\xe9\xce\xc6&\
-\x7f)\x03\x93\xcec\xb8yu!A\x8a\xd6\xb8z\x98\
-e\x8b\x18\xccY\xc8z\xc8)\x1d\xc8\x8c@\xa8\x08\xeb\
-\x02\x5cw\xa5O\x0a\x0d<\xc39\x5cf\x95\xc6\x8f,\
-^\xe6$=(\x87\x8fb\x1867\xa5N\x0c\xa5\x1b\
-\x03\x0d\xaf\x80\xaa\xc6\xa6BITP\x07\xbb\xbcDa\
-\xc1\xfd+\xe0-DD(\xcdX\xd8\xebW\x16B\x08\
-,\x1c1\xcd\x13\xd6%\x15\x9f\x9c\xd7L\x8b\xcc\xc0B\
-e\x0f\xdd2\xd1\xcd0\xe1\x9e\x0aQ\xa7\xcb\xe6\xa2r\
-D\xc7\xccI\xe3S\xc6\xb3\xac\x0a\x90\x87$\x81\xa9\xcf\
-\xc2\xa3MM<H\x95\x85\x8a\xeerx\xcb\x9c\x9a\x11\
-\xa7\xc6>h\xe0=\x98-,\x22\x9a\xe5v\x91DG\
-\xb1\xcb?f\xc9\x5cc\xe9;G\xa6\xa2I-\x93b\
-\xa5\xcb\xc5\x8d\x1f\x1c\x93\xcfc=\x87$\x94\x5c\x11'\
-oRL\xd2A\xce\x94\x22\x90('\x95LR\xed[\
-\xa1\x07h\x1b\x9a\xa5\x92'(\xa2\x94\xa2F\x0e\xb5(\
-\x82\x5c\xb5\x9eI\xb2\x81\xb80\xd1i\x1f\x98\xf8\xf24\
-\xe1\xe4\x11 \x86\x97$Q\x11f\xc1e\xa7d\x109\
-g\xa5u(\xbc\xc5\xa5rTd\x93z[4\x91B\
-\x1c\xa4Z\xe2$\x9d|\xfa\xec&\xcc>h\x91M\x09\
-1E\xa2\xcd\xa9\x1b\xc0\xf4\xee\x82\xe0\xb3(\xed\xb8Q\
-\xaa\xbd\xaa\x85U\xdf7=ft\xad\xf2\xe0\x84~\xda\
-\x15\xc8\xedbhk\x94\x99\x85\xa1K\xd2.{\xe7-\
-\x19*\x1d\xec\xc7\xb4.2O\x86R\xec\xc7\x22Kk\
-jN\xde\xa4\x0b\xa4^\xa91*\x8c(\xbcYpB\
-\xe3a\x12\xc3E\xf2\x04\xcb@5\xc0\x1d\x94j\xfa\xb1\
-\xac\xf9*9O\x09\xa8\xda&$\xc6\xee\x16l$j\
-\x07\x88\x06h4\xcd\x83\xfc\x1e\xb8\x8bF\x8ehI+\
-\x93]\xb3\x08\x93\x11\x86\x06\xcb\x0f\x13\xb2\xaa\x07\xb1&\
-\xbc\xc8\x9d\xac\xb2\x02E\xce$\xd5P\x8b\xaa^%_\
-\xd2\x0a\xa3\xcc=\xceES\x06\x94\x83\x10\xb4\xd9\xd8\xd2\
-*K\x09\xd6\x82\xce\x92\xc4\x1bb\xff\xfb\xb2d\xc3\x0d\
-\xd5\x05z?\x00\xc97\x80\x93oG\xf0\x18\xc6n\x13\
-E\xe6\xfe#$\xd8\x12_\xbc\x1f\xc4d\x9b\xd1\x05}\
-2&q(K\x86\xac$\x9bR4\x9eo\x97A\xee\
-\xd38\x8f1\x14\xf6\xf5:\xdd\xa9\x22\x81\xd6L>\x17\
-G\x1eWLo\xe5\x0c\x90u\xa2\x80\x82\xe1\xccbY\
-\x062\x0d\xd1\x87\xcdY\xce\xa3\x89-f\xeaK\xdfQ\
-:U\x18&Jt\x1b\xcf8rG\xd1\xea:&\xbc\
-\x08D\xd4\x8eI\x83\xb9\xdf\xa8\xf8Y\x1d\xd8\x04\xd5\xfa\
-\xd7\xaa/HtPD\x15\x84\x89.\xb0\x15\xe8\xa9F\
-G^ F\xad\x06&\x8a\x09#\xae\xe5\x17\xa9\xf8l\
-\xa4\x8a\xa2B\x93\xd4A\xd4v\xc5\x06\xefW.i\x22\
-\x85\xcf\xa7:[`\xcc\x9f_\x12^kO\xb4\x18]\
-6\xd5F\x8d\x84\x98\x86\x18\x91\xf15p\xb2[L\xd8\
-j\xe8\xc5\x9c\xf4Uhd\xa0\xb56\x1b\x86\xbe\xd4\x91\
-\x93'Iw\x98\x8d\x97\xa9/\xef\x1f%u\xd7.L\
-I&9\xdaKN\x9c\xba\xe8a\x82\x8b\xe8\xa7\xe7\x9f\
-\x8a2\xe5\xef/\xca\x0c.\xcc\xd7&\x99\xd0\xf3O\x80\
-\x00D\xb6\x16\xd5\xe5h\x09h\x16A\x9a\x94N\x19\x06\
-K\xed\x1dI\x12i\xdb}\x9d\xc7\xb1\xb9R\xa2x~\
-Q\xc1T\x94\xe3\x95RT\x9cC-=\xbc3N\xf4\
-\xcc\x81=\xb3\x89\xbe(\xd5\xc8^\xa3\xe8\xffT\xf8\xd6\
-\xe4C&\x84\x81|H\xcf\xd0v[\x22\xb1\xec\x16\x8b\
-\xb51\xbb\x86\x87+\x94\xf5{1\x05\x8c\xa01\x05\xd5\
-$lc\xc1\xa9\x99\x97\x18\x96M\x88\x86\x1c\xaa\xd3\x13\
-\xccM\x8b\xdd]\x9e\xbb[\xdc\x18\x1d;\x94\x11}Q\
-l\x0c@u\x14T9XbU!Q\xb6\x8e\xc6A\
-t\xbf[\xd4\xf2u\x95\x9b\xabm\xdb\xb74R\xb1)\
-\xcd@\x1e\x15\x1bG\xf9J\x94LN\x0f\xbc l\xc3\
-G\x96\xb3\x9a\xfb\xeaU\x8e\x84D\x14agF\xdc!\
-\xdbf\xd3E\xdf\xf8&\xda\xdf\xdf6.\xfb\xa3\x8do\
-\xd8\x86\x98\xa2\x90\xf4^'\xa9!)\xc6.l\xd9\xfe\
-\xfe\xb2\x19%<?)\xfc\xbb\xc4A\xb8\x9e#\x94\x8d\
-4So\x98\xf6\xe7\xa4\x7f.Q\xc6\xa8\x85\x17H\x9f\
-;\xd4rw\x14\xfbHK\xdf)4\xdd\xf1@t=\
-\x03\xd2\x10\xaf\x00\xb5\xce\x9a\x8a\x87\xa9\x88\xc1\x075\xc9\
-m\xa4l\xe7\xcd%\xb4\x81\xa1\x1a\xc0f\x1b\xda\x0bU\
-\xad\xa3\x09\xc2\xd5\x1fo\xe9A\x8d\xa4\xed\xb2\xcb\xd4\x13\
-B[[\x19%\xa4\x92\x0a'\x99\xc4;\xe3$\xb9\xd3\
-iD\x032\xfa\x01$0\xc7#tZ\x05\xff\xfb\xb2\
-D\xb7\x8d\x84\x9fy?\x81#4\xa2\x8d\xef(\x01\x19\
-&\xb2\xd2\xb5\xde\xfe!\x88\xc4\x0a\x0a\xbc \x983\x0f\
-\x19n\x13z\x22\x99z{Ne\xbcx\xcd\xa0\x95!\
-kvY\x84mQ6\xe4\x92@\xb67\xf2'm\xc5\
-\xf3)^\x13\x8b\xa2X\xce\x9a\x13\xa6\x1e\xcc\x19z\xc7\
-\xc1\xf9\xa2\xf9\xe2,\xd5\x9e\x116D\xad\x84\xd7g\xca\
-)\x12#d\xb5G;\x9e\xe2!nP\x0a\xd3\x9b\x9d\
-\x12e\x19\xa5\x09W~\x9a\xe6\x06\x0d\xb0\x11=\x0d\x03\
-5\xb4\x0e$\x18\x91\x15\xa0\xb0\xc5\x11\x10\x99L\xb9a\
-\x8d\xa8S\xcdi#\xdb\xeb\xba\x0b\xb8\x92f\x066J\
-YM\x1c\x92\x8aX#\x06d^\xad\x84\xa4\xa6Jj\
-\xae\x8b\x01\x83]uJ\x0c\x8e\xa88\xd2\xb5\xaam(\
-\x9b\x85\xb6UG.\xf5\xdf\xd5=\x96\xa8\xc2\x0dr`\
-R\x1a\x94-\x15m;e0\xcd\x0eJ\xe8z\x10\x81\
-{\xf0\x8a\xdc\xcb\x18\x1cC\x0e\xc0\xa5\x09\xdc\xd4\xfd%\
-\xbe\x0a\xa3\xdb\xd1yM\xb5v\xa9 m\x94\xbcwG\
-\x9d\xd9\xc92q\x9f\x9f\xba\xef\xdf\xcb\xf8Y\x8f@r\
-\xd3i\x9a\xcf\xd68<\x89\xf8\xf37\xcb\x95\x07\x8a\xbb\
-\xb6\x99\xa4\xf2\x0f\xe94\xfd:z\x10R\xde\x0a.\xf0\
-DruY\xefj\xb63\xf7b\xdf):\x92\xefM\
-\x5c\xb9z\xccO\xda\xd9\xd2GN\xee\xba\xc9*\x8b\xc7\
-\xcdS\x93\x892\xf5\xb5']\xdeh\x9b=\x16w?\
-\x9f\x1bE\xf31\xcf\xad\xd7\xd8j\xfb\x7fOt\x0c5\
-\x1e}\x8f@(\xca\xbd\xcb\x97I\xc6\xafV\xac\xc4\xed\
-Db\xda\xf1K\x99\xa2\xd2\xcc(\xfc\x98\x91\xe4O\xe5\
-uQ-f\x8f\xea\xf4\xef%\xc3\xe6\x9e\xee\xf8en\
-\x9d\x08MO\x9fK\xca\x87M\x0c)\xbe\xc4\xd4$B\
-/\xd1n\xd0\xb3R\xe8$\x96\xbap\x8f)\x1c\xe7\x82\
->%\x05/\xc1\x8fP\xeeE\x0bj7s|\xb2\x10\
-]\xe1r\xce\x8bR&iR\xe9\xc6\x1e\x08\x96\xc2u\
-*\xd9\x99\xd8lz\x037\xa0\xe8c5\xb9\x22\xce]\
-\x83\x02\xbcm\x9a\x05\xb4X}\x94\x81\xb8l\x08\x18a\
-a\x89\x185\xb4|\xd6\x9bT\x98\xb4\xb4\x9e\x9b\xe8f\
-\x1c]\xc4\xcd\x1f\xf7\xd9\xa4\xc8op~\x91$M.\
-$\xbb8\xdb}\xd6\xc2\xd7\x1b*\x87\xed\xf4\xe7;s\
-\xa9\x18\xa3\xe7R\xbf\x1dN\x99\x8b\xb2\xd6\xec\x8d\xe6\xee\
-\xfc\x12\x8eZ!\x19\x86D\xb4\xfe\xf0\x858\xb0\xb0\x83\
-\x17bR\xc0oUq~!T~W\xc1\x04\x10\x14\
-\xce\xc4pf\x5c<QS\xf4\x10\xc7.w\xa8Nk\
-\xff\xfb\xb2d\xc2\x0d\xd48y\xc0\x00\xc37\x02\x8b/\
-\x08\x01\x18\xc3\xceP)\xe7\x02!\x98u\x8a!<\xa0\
-\x001\x9a9\xba`\x92G*Dg\x90h9\xe4B\
-\x1c\xc4\x9c\xe1\x16\x07\x02\xe8\xa6\xec#{\x1f\x91c\x8d\
-\x8a\x01\x04o\x00\xc4\x03q\x06\xef\x87\xa0x\x05\x83B\
-\x1c\xb6X,UK\xb0B\x86\x82:B\x01\xb3\x1bW\
-2\x93w\xba\x80\x09\xe1\xb8#tq<=\xdb\xa75\
-\x07^\x1adI\xd4\xe5\x1a\xc5B\x15\x8a_s>G\
-Rn\xd7\x93W\x12\xc4\xf1\x90(\xd8\x8b5\xbac0\
-\xb6\xd3\xa2\x89e6!\x97+\x94\xf0\xb2\x97\xf1\xf1\x9a\
-\xb2\x13\xeb\x9asr?\x92\xeb\xffuj\x82Z\x8da\
-W]\xef\x19I\x13:\x95\x14\xe7`\x02\x00\x08\x02\xfd\
-\x00-mZ\x95T\xd4\xb2Zr\x9b\x95\xa4\xc7Dn\
-\xac<\x16HzK\x09'B\x9c\xf02\x04\x99C6\
-X\xd4\x02\x88\x9e\x90\x99\x1c\x81\xce\x86\x12\x861\xce:\
-z\xff\xd2.\xa88J\xef\x0c\xb4W\xd2\x95b3\x22\
-.L\xc45\xb4\xad\xcf,\x8a\x82\xc4[a\x87*P\
-\xfb\x94\xb0\xcaai6u\x8a\x91\xb1a\x14\xe1\x896\
-u\xe2\x5c\x88\xfd\x14\x19\xa1o\xe3\xf3\xda\xf9\x91\x91\xce\
-f\xa7\xa7\x10`\xea\xb4\x1a\xe0b\xd0\xdbvS7(\
-=\x06\x8d\x05\x9a\x8aW\xc1\x0cM\x00m*\xf4!\x87\
-@\x82\x84\x99\x15\xbcx\x8c\x08&\x95\xcc\x10%'\x11\
-!\x91\xd2(\x9f\xa3\xee}\xd5t&\xa9u\xb0\x83\x9d\
-\x97\xe2\x0b\x9a\x12\xbd\xc7jt\x15\xae\x08\x11\x14\x12 \
-3i\x04\x9dgCtW\xfbugab\xab\x06\x04\
-)\xaa7}\x02G$<\xc7\xac\x15\xddmd7'\
-Yf\x08\x84\x06c;Z\x8a\x18\x1d\x15\xe5\x8a\x84\xe6\
-\xc8\x99q\x16\x10\x08\x16\x1f\x03iTX^\xd1\xa3t\
-\xba.T\xc4M<\x0ep\xc3qH!-\x8c\xf4\x0b\
-6\x08\xa6\x97d\xd2\x88-(\xc8b\xee\x84\xb6:\x07\
-;\xe9\x15^\xd9:*\x8b\xa2O\x05\x1cu\x81\x17E\
-\xa83\x94\xa3\xe6\xd1j\xea8K\xad\xd3{/Q\xf6\
-\xbb\xe6\x1di\xc3S\x04\xf93I\x90$P\x96$@\
-\x80\x88\xc2\x06\x08\xcc\xcbI8c7\xb43\xe9\xc8\x1a\
-\xa8\xc1\x8e#J`\x99\x22\x9f,h\x12\xa0 \x0dj\
-em\xed\xfa\xd7; \x95\xb0X/I1\xa6f&\
-\x91\xe4W\x08s\xc8\x92Y\xfa\x12C\xa7\x03\xc8A\xd2\
-\x1e\xc8k\xea\x91d\x19E\xec\xa5\x89\xbe\xa8\xc4\xb4\xdf\
-\x9btE\x85.\xd1\xc9\xbf\xa9\xb5\xef\x0e\xd0\xcbPE\
-3\x85\x8a\xff\xfb\xb2D\xdb\x89\xd3\xdfu\xc1\xc8f\x1d\
-2\x80\x0dh\x11\x0c\xc3\xf2S\xb5\xe8\xfc\x03$\xd4\x02\
-X\xbc\x9f\xc4d\x9a\x89\xca\xb4K,\xd4\xef\xc6\x8a)\
-\xeaaO\xb3\xbe\x08\x9a\x92:x\xd1\xa4\x5c\xed,\xb1\
-|\x19$\x0di\xa7<\xa45%\xd9EM\xf6\xa0J\
-M'~\x86>\xc9\x83\xea\xa1W\xbd\xbeE\x8f{\x8f\
-\x882h\xeaE\x9c\xd0\x81\xb6\xc4\xac\xb62\x97\xaf(\
-\xe1\xd5\xefM1S\x94\xa62\xd3\xd7\x810\xc8\x114\
-\xe4HI:\xb4\x8b\xc4\x08\xd5Y\xad\xd0\xa2\x8dFN\
-\xd2f7\x95\xd9\xec\xb6\xc6\xbb\xa4\xca\xb5\xa6\x91\x0f=\
-.\x11~C\x8b9\x88\xca\xf4\xe0\xf0I\x1e3\x0e\xe4\
-\x88$D\x99\xd8\xe9\xb2\x8b\xa7d\xc8pD\xa9\x8e\x83\
-\x93\xa2f\xea\x18\x9b\x9b@a;h\x10\xb3\x14V\x16\
-l\x1fE\x13\xa9\x01xK>\x04\x5c9\x0a1\xa9\xd1\
-\xb3\xe0\xe0\xfb\x058\xbd\x9e!rc\xa0\x85&2/\
-P\xd5\xc5\xdc/Q\xda\x15\xcf1\xe4\xc4T^\xd2\xec\
-\xd5\x89r\xb4\xd6Aa\x88I\xee~\x8a\x0b1\x19\xbe\
-ju\xf0\x90.n\xcdk\xcd\x0c\xf6\xf8\xdc\xad\xb1G\
-\x12\x18q\x88\xa0\x9c\x1c\x84\x91@\x9a\x81LB\x891\
-\x12\x093\xa4\xe5x8(\xab4\xef2\x00\x0a@\x03\
-\xfb'f\x1a\x81\x81\x9e\x92\xc4\x8e\x8c\xe7\xc5\x94\x8e\x9b\
-&\xd6\xdb\xa2M$\x9e\x19\x1d3\xe3\x83\x1e\x18\xc3\xd2\
-\x0e\xe2\xd3\x09\xbeq\x08I\xd2\x0f\xa0(\xe0\xb2KD\
-\xf9\x19\x0c\x9bf\x97\xd7\xdb\xfb\xdd\xb9e\xdeM\xeet\
-\x17\x06\x95\x0b\x8d\xa0V{ \xf5\xa5~\xe73{+\
-\x1b\xd4\xf8F\xce-\xe7k\x18\x8a\xe4\xb7\xabl\xc2\xef\
-*1\x1d\xed\xb9\x95\xed\xe6>\x9c\xc8~\xdb\x5c\xd80\
-\xcc6\xd26\xb6d\x8cOd\xa4\xacv\xf3vb\xf9\
-\xa7\x18q3\x22\xda3\xda\x06\x98\xc6\xdec\x1dOn\
-\xec\xd6\x01\x0fX0\xa6\x1f\x99\x09\xc2\xb6\xad\x16\xa7\x96\
-\xa9\x93ABQ\xca\xff\x9cH\x91*\xaa\xca\xaf\xfb\xcc\
-\xbc\xb7\xc6j\xda:\xb9\xc9z\xf3/\x92F+\xccQ\
-\x22IR[9\xdc\xd9b[\xe4\x8c\xc9\x19c\xb3\x9b\
-\x95\xb3T\x0a\x12D\x02\x12\x0a\x12\x89\xba\xd4\xe8\xe4\xc1\
-(\xd9\xcf\xff\x9a\xaa\xa69#\x89K\xe7\xf5\xb8so\
-\xadj\xa7\xaa\xaa8\x91$\xaaJ\x0aK\xcb\xcc\xeb\xcc\
-\x91\x99\xc3\x9a\xbc\xb5~\xe4\x89Q$\x9ef{S\xcc\
-\xcc\xcc\xe6\xc9\x19\x15\x99\xc2\x89+\x01\x02\x02{\x85\x01\
-Z\xc6\xaaL}fc\xd8\xd5\x7fn31p\x08\x09\
-\xbdY\x9b\xb1\xa8P\xff\xfb\xb2D\xeb\x0fT\xddx?\
-\x00\xc63r\x94/\x08\x06\x19&\xe0P\xc5\xe0\xf2\x01\
-\x84\xca\xca <\x9e\x80!\x99\xb8\xc0L\xc4\x8e\x06\x0a\
-%\x8f2D\x89\x19\x22H\x92UO&\x91$I'\
-\xcay\xfe\xb7\xb9\x19\x22\x13T\x95WbTnUy\
-j\xa3H\xce\x7f\xe7\xd6\xb5Uo\xa6%T\x96\xff\xd8\
-\xe2[38\xdd\xaa\xa8\x92U\xbd\xf1\xcd\x22\x8e=\x1d\
-U[\xe8\x19\x1ay\xc7\xf5S?\xbc\xce4\xceS\x91\
-\xcd\x97#\x15\xb8q*\xe7\x12\xa3\x89Q$\xa6Z\xa8\
-\x92TLAME3.100\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xff\xfb\xb2d\x00\x0f\xf0\
-\x00\x00i\x00\x00\x00\x08\x00\x00\x0d \x00\x00\x01\x00\x00\
-\x01\xa4\x00\x00\x00 \x00\x004\x80\x00\x00\x04LAM\
-E3.100\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaaLAM\
-E3.100\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaaTAG\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00f9\
-I\
-D3\x03\x00\x00\x00\x0088PRIV\x00\x00\x14\
-.\x00\x00XMP\x00<?xpacket\
- begin=\x22\xef\xbb\xbf\x22 id=\
-\x22W5M0MpCehiHzreS\
-zNTczkc9d\x22?>\x0a<x:\
-xmpmeta xmlns:x=\
-\x22adobe:ns:meta/\x22\
- x:xmptk=\x22Adobe \
-XMP Core 9.1-c00\
-2 79.a1cd12f, 20\
-24/11/11-19:08:4\
-6        \x22>\x0a <rd\
-f:RDF xmlns:rdf=\
-\x22http://www.w3.o\
-rg/1999/02/22-rd\
-f-syntax-ns#\x22>\x0a \
- <rdf:Descriptio\
-n rdf:about=\x22\x22\x0a \
-   xmlns:xmp=\x22ht\
-tp://ns.adobe.co\
-m/xap/1.0/\x22\x0a    \
-xmlns:xmpMM=\x22htt\
-p://ns.adobe.com\
-/xap/1.0/mm/\x22\x0a  \
-  xmlns:stEvt=\x22h\
-ttp://ns.adobe.c\
-om/xap/1.0/sType\
-/ResourceEvent#\x22\
-\x0a    xmlns:stRef\
-=\x22http://ns.adob\
-e.com/xap/1.0/sT\
-ype/ResourceRef#\
-\x22\x0a    xmlns:dc=\x22\
-http://purl.org/\
-dc/elements/1.1/\
-\x22\x0a    xmlns:xmpD\
-M=\x22http://ns.ado\
-be.com/xmp/1.0/D\
-ynamicMedia/\x22\x0a  \
- xmp:MetadataDat\
-e=\x222025-09-16T09\
-:52:11+01:00\x22\x0a  \
- xmp:ModifyDate=\
-\x222025-09-16T09:5\
-2:11+01:00\x22\x0a   x\
-mpMM:InstanceID=\
-\x22xmp.iid:d1524b7\
-f-deeb-4958-80bb\
--af144becea37\x22\x0a \
-  xmpMM:Document\
-ID=\x22xmp.did:d152\
-4b7f-deeb-4958-8\
-0bb-af144becea37\
-\x22\x0a   xmpMM:Origi\
-nalDocumentID=\x22x\
-mp.did:bb5def67-\
-4fbd-4982-b475-f\
-fce61bcab8c\x22\x0a   \
-dc:format=\x22audio\
-/mpeg\x22>\x0a   <xmpM\
-M:History>\x0a    <\
-rdf:Seq>\x0a     <r\
-df:li\x0a      stEv\
-t:action=\x22saved\x22\
-\x0a      stEvt:ins\
-tanceID=\x22xmp.iid\
-:bb5def67-4fbd-4\
-982-b475-ffce61b\
-cab8c\x22\x0a      stE\
-vt:when=\x222025-09\
--10T18:24:59+01:\
-00\x22\x0a      stEvt:\
-softwareAgent=\x22A\
-dobe Audition 25\
-.3 (Macintosh)\x22\x0a\
-      stEvt:chan\
-ged=\x22/metadata\x22/\
->\x0a     <rdf:li\x0a \
-     stEvt:actio\
-n=\x22saved\x22\x0a      \
-stEvt:instanceID\
-=\x22xmp.iid:d9b234\
-36-cec7-4956-a17\
-a-2d4f7bd1eca6\x22\x0a\
-      stEvt:when\
-=\x222025-09-10T18:\
-24:59+01:00\x22\x0a   \
-   stEvt:softwar\
-eAgent=\x22Adobe Au\
-dition 25.3 (Mac\
-intosh)\x22\x0a      s\
-tEvt:changed=\x22/\x22\
-/>\x0a     <rdf:li\x0a\
-      stEvt:acti\
-on=\x22saved\x22\x0a     \
- stEvt:instanceI\
-D=\x22xmp.iid:975f8\
-8d6-61b1-48f8-86\
-f5-a70c2ca3739e\x22\
-\x0a      stEvt:whe\
-n=\x222025-09-16T09\
-:52:11+01:00\x22\x0a  \
-    stEvt:softwa\
-reAgent=\x22Adobe A\
-udition 25.3 (Ma\
-cintosh)\x22\x0a      \
-stEvt:changed=\x22/\
-metadata\x22/>\x0a    \
- <rdf:li\x0a      s\
-tEvt:action=\x22con\
-verted\x22\x0a      st\
-Evt:parameters=\x22\
-from audio/x-wav\
- to audio/mpeg\x22/\
->\x0a     <rdf:li\x0a \
-     stEvt:actio\
-n=\x22saved\x22\x0a      \
-stEvt:instanceID\
-=\x22xmp.iid:1a8f87\
-e7-b9b2-4064-998\
-7-c7877f951d10\x22\x0a\
-      stEvt:when\
-=\x222025-09-16T09:\
-52:11+01:00\x22\x0a   \
-   stEvt:softwar\
-eAgent=\x22Adobe Au\
-dition 25.3 (Mac\
-intosh)\x22/>\x0a     \
-<rdf:li\x0a      st\
-Evt:action=\x22conv\
-erted\x22\x0a      stE\
-vt:parameters=\x22f\
-rom audio/x-wav \
-to audio/mpeg\x22/>\
-\x0a     <rdf:li\x0a  \
-    stEvt:action\
-=\x22saved\x22\x0a      s\
-tEvt:instanceID=\
-\x22xmp.iid:d1524b7\
-f-deeb-4958-80bb\
--af144becea37\x22\x0a \
-     stEvt:when=\
-\x222025-09-16T09:5\
-2:11+01:00\x22\x0a    \
-  stEvt:software\
-Agent=\x22Adobe Aud\
-ition 25.3 (Maci\
-ntosh)\x22\x0a      st\
-Evt:changed=\x22/\x22/\
->\x0a    </rdf:Seq>\
-\x0a   </xmpMM:Hist\
-ory>\x0a   <xmpMM:D\
-erivedFrom\x0a    s\
-tRef:instanceID=\
-\x22xmp.iid:1a8f87e\
-7-b9b2-4064-9987\
--c7877f951d10\x22\x0a \
-   stRef:documen\
-tID=\x22xmp.did:1a8\
-f87e7-b9b2-4064-\
-9987-c7877f951d1\
-0\x22\x0a    stRef:ori\
-ginalDocumentID=\
-\x22xmp.did:bb5def6\
-7-4fbd-4982-b475\
--ffce61bcab8c\x22/>\
-\x0a   <xmpDM:Track\
-s>\x0a    <rdf:Bag>\
-\x0a     <rdf:li\x0a  \
-    xmpDM:trackN\
-ame=\x22CuePoint Ma\
-rkers\x22\x0a      xmp\
-DM:trackType=\x22Cu\
-e\x22\x0a      xmpDM:f\
-rameRate=\x22f44100\
-\x22/>\x0a     <rdf:li\
-\x0a      xmpDM:tra\
-ckName=\x22CD Track\
- Markers\x22\x0a      \
-xmpDM:trackType=\
-\x22Track\x22\x0a      xm\
-pDM:frameRate=\x22f\
-44100\x22/>\x0a     <r\
-df:li\x0a      xmpD\
-M:trackName=\x22Sub\
-clip Markers\x22\x0a  \
-    xmpDM:trackT\
-ype=\x22InOut\x22\x0a    \
-  xmpDM:frameRat\
-e=\x22f44100\x22/>\x0a   \
- </rdf:Bag>\x0a   <\
-/xmpDM:Tracks>\x0a \
- </rdf:Descripti\
-on>\x0a </rdf:RDF>\x0a\
-</x:xmpmeta>\x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-                \
-                \
-                \
-                \
-                \
-     \x0a          \
-                \
-                \
-                \
-                \
-                \
-          \x0a     \
-                \
-                \
-                \
-                \
-                \
-               \x0a\
-                \
-                \
-                \
-                \
-                \
-                \
-    \x0a           \
-                \
-                \
-                \
-                \
-                \
-         \x0a      \
-                \
-                \
-                \
-                \
-                \
-              \x0a \
-                \
-                \
-                \
-                \
-                \
-                \
-   \x0a            \
-                \
-                \
-                \
-                \
-                \
-        \x0a       \
-                \
-                \
-                \
-                \
-                \
-             \x0a  \
-                \
-                \
-                \
-                \
-                \
-                \
-  \x0a             \
-                \
-                \
-                \
-                \
-                \
-       \x0a        \
-                \
-                \
-                \
-                \
-                \
-            \x0a   \
-                \
-                \
-                \
-                \
-                \
-                \
- \x0a              \
-                \
-                \
-                \
-                \
-                \
-      \x0a         \
-                \
-                \
-                \
-                \
-                \
-           \x0a    \
-                \
-                \
-                \
-                \
-                \
-                \
-\x0a               \
-            \x0a<?x\
-packet end=\x22w\x22?>\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xfb\xb0d\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00Info\x00\x00\x00\x0f\x00\x00\x00\
-\x1d\x00\x00Iw\x00\x08\x08\x08\x11\x11\x11\x1a\x1a\x1a\x1a\
-###,,,,444====FF\
-FOOOOXXXaaaiiiir\
-rr{{{{\x84\x84\x84\x8d\x8d\x8d\x8d\x96\x96\x96\
-\x9e\x9e\x9e\x9e\xa7\xa7\xa7\xb0\xb0\xb0\xb9\xb9\xb9\xb9\xc2\xc2\
-\xc2\xcb\xcb\xcb\xcb\xd3\xd3\xd3\xdc\xdc\xdc\xdc\xe5\xe5\xe5\xee\
-\xee\xee\xee\xf7\xf7\xf7\xff\xff\xff\x00\x00\x009LAM\
-E3.100\x01\xba\x00\x00\x00\x00\x00\x00\x00\x00\
-4\xc0$\x05QM\x00\x00\xc0\x00\x00IwFC\x17\
-0\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xff\xfb\xb0d\x00\x00\x05+y\xba\x05\x0d\x00\
-\x00J@\x17\xce\xa0\x0c\x00\x1aa\x85+\xf9\xca\x80\x01\
-\x8e\x0b\xe2\xa74P\x00\x00\x00DDB\xa8\x9d\xf4\x08\
-\x00.\x1d\x83pn\x1f\x8b\x9fh...{\xe8(\
-\x0d\x00\x5c\x05\xc1x7\x06\xe2\xe2\xee\xe8\x88\x88\x88\x89\
-\x7f\xc2r.\x0d\x01\xa04\x06\x80\xd0\x1a\x07\x82\x95\x09\
-_\xfe\x88((\x95.x\xa0\xa0\xa0\xa0\xa0\xa0\xa1\x89\
-\xf0\x88\x95\xba\x22r\xee\xef[\x96...{\xa2W\
-\xfc\xb8\xa0\xa0\xa1\x89\xcb\xb8\xa0\xa0\xa0\xa0\xa1\x88\x88.\
-{\xbb\xbb\xbf\xfa \xa0\xa0\xa0\xa07\x06\xe0\xdc\x5c]\
-\xdd\xdd\x11\x13r\xc5\xc5\xc3\xc1ADDA@\xe0\x17\
-\x83pn\x0d\xc1\xb8\xb8\xb8\xb9\xe2\x88\x88\x88\x9f\xfa \
-\xa0\xa2h\x88B\x22n\x88\x95%\x8b\x9fp\xaa\x82&\
-\x00\x02\x00\x80\x0c\x04,\x07\xd2\xa2\x80\x98>\x0f\x83\xe9\
-v\x5c\x1c\x04\x0ea\x88\x9c\x1f\x02;\x83\xef\xf5\x02\x01\
-\x88\x7f.\x0f\x9f\xff\xca\x03\xe0\xff\xff\x12\x02\x1f\xcb\x83\
-\xff\xe2p|\x1f\x07\xc1\x00@\x109\xe0\x80>\x1f\xfd\
-\x00\xf8>~\x89@\xc2\x10)\x0b@\x9c\x0b@:\x86\
-\xe2\xf00\x14\x86\x027)LlP4B\xf8\xcd\x00\
-C\x1c\xaf\x9cvnlc\x11\x9bH&\xaaQ\x9c\xe8\
-\xe8\xfeS\x9c5\x16\x17\x05\x19\x84\xf6\xab\x93\x81\xa0\xce\
- eP\xa8\x18\x00\x04\x01\x80\xb77p0P \x0c\
-\xaa9\x02\xc2\xe00(\x04\x05\x03\xe1\xee\x1f7\xb87\
-\x80\x03\x82b\x86\x0b`1\xe1\x96\xc60N\x0fM\xe0\
-4\x1f\x0b\x10\x01@ s\x82\xd0\x04\xc0\x9f\x1c\xc1J\
-\x11\xf7e\xdc:A\x9e\x10@\xd4\x5c\x85RL\x975\
-\x22c\x8c\xa1\xfc\x9f$\x08y\x07.\x90r\xf9\xa2)\
-\x15\x08\x81\x9f\xfeM\x9b\xa8\x9fH\xd0\xae`h`b\
-_+\x9a,\xbep\xd3\xff\xba\x08)\x0a\x14\xd9g\x9d\
-\x03E\xbb\xd37W\xff\xf7\xa6\xebz{\xfe\x91\xe3C\
-\xe1\x10\xf9\x90\xb7\xff\xff\xff\xeeD\x00!\x00\x10B\x88\
-\x08\x00\x07~/\x00<f\x09\xf7\xea@\x9f\x07\xf0b\
-\xc1\xeb\xb0\x1c^Gu\x22 t\xd6.qq\x1a\x94\
-\xac\xd3\x9a]Xr\xc1;\xcc\x16\x85\x1a\xc02\xc9\x10\
-\x01\xb4\xce\xe5\x1bs'g\xd4\xc5\xb1\xe79\xb6>~\
-\xd7\x0cMS\xda\xd5\xb1\xdd\xcb\x5c\xf8\xf5\x88^\xc9g\
-\xb3\xb2\xca\xd7\xfe\xa4\xc8\xd9\xfdnc\x87\xc9*\x00\x00\
- \x16\x0dF\xa3A\xa8\xd4j0\x18\x03\x1cD\xa3!\
-\x11q\x00\x1ca\x0b\x12`(\x10ba\xd6sk\x06\
-e\x80ZnK\xff\xfb\xb2d\x13\x80\x06.WP\xee\
-v\x80\x00f$\x99\xba\xcd\xac\x00\x18\xe1#\x14}\xf8\
-\x80\x01\x8e\x8c\xa4\xf7\xbc\xb0\x04\x88a\xe8xz\xb0@\
-:3\x98\xacN\x18\xd6,\x8d\x06\x11\xf0\xc0f\x5c\x07\
-D\x80\x1d\x84\xa1\xc8\x8e\x0c\x0d\xea\xc06\xb3\x00K1\
-O1=\xc0\xcc(\x02\xc4\x00Q\xf0\x0a!!\xc4\x08\
-\xbeGx\x18\xc2`\x84`\x09\x16\x1c\x988BN\x89\
-\x8a\xbe\x14\x06\x0d\x83\x81\xbc\xa1\x83\x04\xb8:r\x8a-\
-I\x7f\x87H\x19d2\xf0\xa1D\xda(\x01)\x9cJ\
-\xa5\xd7\xfc\x5cBu\x19aI\x0cx\xad\x09a\x92 \
-\xa8\xd7\xa9U\x7f\xc6T~\x1c\xb2\xf9\x08K\x8eq\x0d\
-#\x0aD\xff\xff\xff\xe4@\x9d\x22\xc5\x12d\x98\x22\xe7\
-\xca\xa6\xc4\xd1D\xa0p\xdc\x00\x00\x90\xc1\x04B\x11\x10\
-\x8c\x08\x00\xa1O\xe4\xee\x0b\x04\x98J\x91\x93\xf5\xb39\
-\xb3q#103-\xbe33\x8b~\xbb\x99!f\
-\x90\xe3X \x02`\x0f\x80W\xf4\xc3A\xbc@\x01\xd2\
-\xcf\xf3\xe4\xf70w(NO\xffP\xd2\x89\x8a\x8e\xe5\
-KQ;\xff\xe7\xcd\xef\xb6$\x02\x03?\x80%\xca\x95\
-\x10\x96\xf4\xe8\x88\x85\x89\x12g\xff\x0a\x9e\x1a,\x01\x0e\
-4I\x80.\x00\xf9\x80\x08\x059\x81\xc0\x09\x09\x83L\
-\x09)\x81j\x1bQ\x89\xaaK\x11\xb9\xd7\x7f\xb9\xad\x18\
-U\x09\x90\x04'\x99\x89\xd2\x1bA\x89\x9e !\x83\xf2\
-\x18\xb1\x81\xca\x02\xf1\x80\xfe\x02!\x80\x1c\x01I\x80\x10\
-\x00J(\xa2\x00*B\xf3\x0f\xd0V\xe4P\xdc\x9d\x1c\
-\xe1\xd8<\x0e\xf2\x088\xc9\x82e3\xea<lh_\
-4\xaa\x93\xbb&\xb6I\x13\xe9! \x07\x96\xe6\x84\x10\
-\xfa\x13\x02@\x95\x1b\xe8\x96\xcf\x9a\x1b\xa1H\xc8\xf1\xf3\
-sB\xfc\xcf\xac\xccB\xe6\xe8\x19\xa4\x8b\xa6\x82\xec\x9d\
-\x14\xd9\x17AT\x96S+\xa3c\x06u\xa0\xca.!\
-\xa5\xaa}\x93R\xe8\x998\x0c8|\xe0.\xc1\xc1\xb8\
-\xa9\x06\x9cH\x81\xe7L\xacp\x9ckXM%\xd7\x13\
-\xba\xcf\xa8\xb7\xd2\x00\x00\x0f\xb3\x97\x0b[\x00\xc0\x10\x03\
-T\x8a\xa50\x0a\x02\x13\x03@I0j\x0b\xf3\x1b\xe4\
-\x7f1/\x08\x93\x05\x80A0\x19\x02\xe3\x01\xb0\x15\x07\
-\x00\x99qWLUC\xa7\xdc\x92\xf0\x1e\x81)5d\
-\x09\xc3\xf1\xb5C\x9cz\xfe\xbf\xbei\xa7m\x15Mh\
-\x04\x0d~\x92\xab6\x83\x87\xa2\x01\xcd\xc1\xad\xd7\xa5\x03\
-\x1b\x0cP\xcd+\x92A\x09z\x03\xff\xf3\x82!\x00\xcc\
-\x0b\x01\x8c\x1c\x00\x07\x02\x01\xc1\x5c\xd6\xef\xb4\xce\xd1\xd8\
-\xc8a\xd0\xd7\xb7\x8c\xd60\xff\xfb\xb2d\x0f\x88\x05\xed\
-A\xce+\xb8K\xe2`\xe5i\xadm\x83{Vp\xdb\
--\x8fu+\x89\x99\x8d\xe7\xf5\xbd1%h\xce\xe2(\
-\xc0\xd2t\xc4\xd10X\xc91L#0\xb8:\x0b\x85\
-\xa7L\x8b\xf8\xf8C\x5c\xc6$\x00\x09\x14\x81P\x02\x94\
-\x90hJE\x92\xf5\x97Q\x0e\xe9\x84\xabP]*\xd4\
-yr\xaa\xf5p\xa6jt\xd7\x5c\xf5\xd6\xca\x1b\x1b\x94\
-\xe68\xec\xa1\xe9\x87\x9f7\x11\xf7\x83!\xd8=\xdc\x86\
-\xe4\x90\xf4\x99\xdf\x88\x07\xc9\x85\x83b\x01\xa2Q\xf2A\
-\x19d&\xc5\x05\x0e\x9a<N@\xaa#\x08\x0b\xac\x84\
-\xda\x02\xeb2\xe4j*\xd3\x08\xd4\x8b-\xa0]g6\
-\x81u^\xc4\xd2U\xec.\x9c\x9c\xda\x91\x91\x96\x16\x07\
-\x05r+U=^GM\xe9\xfb\xea\x00\x01\xa2I\xd6\
-]`\x08\xd4\x9eML\xe0\x83\x81\x8d\x12XN\x8d4\
-L\x15\x0c\xd6\xd3S\xf8\xcc\x06\xcc\xd4M_\x97\x91\x11\
-\x1aXP\x94G\x5c$Dv\xad\x83\xfcY\xc7h\xce\
-\x0c*$\x18\x83ueBa|\x9f\x02\xf7\xd8so\
-e\x9c\xc1S\xd3\xfc\xfc\x9c\xe1D'8\x9b\x93\xbc\x11\
-\x1d#N\x9e\x04L\xf0\xe9\xef\xb7\xe1\xcc\x00\x00\x16\xbe\
-`\x8c\x05\xa6\x05\xe0^`\xc4\x03h\xac\x97&\x0a\xa0\
-\xc0d0rF\x81\xe0\x98b\x18\x06&5\x87J\x7f\
-(OF9\xc1^y<\x10lS>c\x1a #\
-\x02\xc9\x80\x92\xd3#2\xab\xab\x85\xfe\x9f*\x99\xb8\xbc\
-\x0f\xdc\xbd\xf9}\xa2qHS\x934\xc8b\xf2\xc7z\
-\x01\x96J\xddYS\xa26,l\x11P\xe9\x80\xd2\xa2\
-\x13\x0d\x92\xc8\x85\x87\x90\xda\xcd\xb8\x98Rq\xb7@\x8a\
-g\x0f\x92\xc8\x86\x07\x07\x85*\x1d\x1dx\xa4DP\xfb\
-\x89\x8e\xb0\xd8f\x96\x9b:\xac.+T\xc9F\xcb\xd6\
-U$\xf3fX\xac\xc5e6\xb8Y4V.>m\
-\xf2~(\xad\x0b\x8f:n\xb8\xd9y\xe7[\xbf\xfd\x0c\
-\x005\xbbK\x5c\xb0\x01R\xca)0\xe9[0\x0a\xc3\
-\x18\x08rj\x18\x14Y\xff\x88\x9f\xa7\x18\xe8\x80!\x95\
- \xa5\xe5\xb1[\xaaR\xae^\xa5\xdd\x0f\xaaW\x95\x95\
-\x01\xa1\xe8\x0f\x1d\x83TD\xa2\xd1T\x9b\x08\x92\xa0\x94\
-|\x94\xc6\x03*\x19<\xb4\xf6\x05\xd7[\xf1ab\xc1\
-#\x85\x05F\xc5\x13f\x8a\x0a\x8b\x92f\xcd\x1a*.\
-M\xb0\xf3\xaf\x0b\xb5\x00- \x00`\x84\x82\xe8V\x06\
-\x99\x81\xcc\x04\xe9\x80\xaa\x051\x81 \x0c\x19\x81.$\
-\xc1\x86wt\xe1\x9eNH\xb1\x92\xd6\x0c\x01\x85\xa9\x01\
-\x01\xeda-)\x8a\xe8+\x91\x83\xae\xff\xfb\xb2d\x1a\
-\x89\x84\xb7\x1f\xc3\xb3\xfa\x1b@bd8\xbak\xc9(\
-\x11\xf4a\x0f-\x7f\xa2\xc1\xa8\x0e\xa2]\xec\x99P\x11\
-\xb9\x81`\x09\x91\x80\xae\x05\xe9\xac\xf0jh\x9aFF\
-p`btH\x85\xe7+\xce\xfd\xfaLn|D\x04\
-\x02\xff\xf3\xce\x1b\xe6\x95\xec\xa6\xa4|8)\xcfa\xdc\
-\xb2\xaa\xb35\x16(\xe4\x93\x0en6\xc7\x1esT\x15\
-\xc5j^\xc60X4\x81\x8e\xb0Y\xcd\x8b-4\x0e\
-\x90O\xd5C\x0d&\x96,P\xf8\x0f\xc7([nD\
-2\x00\x009v\xb4\x00\x06\xa49\xaa/\x00\x94\x14\x0e\
-fv\x0d\x19\x1d\x9e1\x9b\x90\x1f\x18\xa8\x06)\x8dS\
-7\x9df\x10\xe1\x8a07\x981\x81Q\x81P\x07\x98\
-\x09\x80\x10@\x02\xab\xe74\xe0V\xbd-<U\xf1V\
-\x14\xdc\x8a\xb3\x87D\xbf\x11'j\xb4\xe6\x5c\xd4\x9f\x1c\
-Y5mb\xcb\xc1\x5cwZ\x8a\x84\x87\x03.Zw\
-\x87?\xfb\x80\x87\xe4T\x89\xa0<l\xe3\x9e\x8f\xc6\x06\
-X\x1e\xa6\x0fpI\x06^\x9a\x98F\x7f\xf0}FK\
-\x18|\x06E\x9b\x84\xc7\x91\xd9N\xa6@Hx\x87H\
-4\xe6\xaf\x9e\x86f\x13\xe6A\x8cF&\x04\xe1\xc1r\
-\xb2\x96\xa9|\xc4\xa4jP\xc2\xdau\x162w\xf2n\
-\x02\x5c\xf7\xb3\xfe\xdc\xcb\x96\xf7\x8d6\x1c\xc6\xd82T\
-:!\x1a\x5c\xc0\xb1\x01G\xbc\xe6\x5c \xa4\xd2\xb7\xf2\
-z\x09\x0d\x22\xadT\x88n/MMclZ$/\
-\xb0\x00\xa94\xcf\xd6\xab,J\xae\x05+\x0bLY\xd9\
-\xd2!\x1a7+D\x10\x18\x18\x10\x00RPD\x01\xe0\
-\xd0.0\x1e\x0a\xb3\x15U\x013.\x05\x13\x0cp$\
-1f%c\xaa#m0\xe4\x09\xc3\xce\x93(b\xd7\
-\xa8#/k\x8f\xc4\xbe\xf5\xb2\x0e\xcfW\x8f\xc0\xee\x7f\
-\xcd\x9diD\x94(\xb2Nk\x92\xc2H\xf5\xc02a\
-E\x16=\x06\xcc\x84H\x93B\xd2\x93{?\xae\x84\x22\
-=\xe6\x1dG\xbbO\x19w_\xb3\xec~*\x00.\xc0\
-\x00f\xc7\x1a\xc1g$\x91\xf8^`k\x81$`\xe8\
-\x05\x02d\x17\xb1Vi\xee\x07z`\xf6\x010b\xf8\
-\x9a\xdeyO\xa4\xc8b\xbd\x83V~\x05a\xb8J&\
-|\x13\x19$6b\xc0\xb1\x87B&\x03\x02\x97\xb1\x97\
-\xcbl\xdc\x97U\xa5\xd5\xdb\xd6\xb2\xa6\xfda\xbdZ\xbd\
-\xbc\xac\x5c\xb3\xccs\xfd\xf3\x99\xeb\x9f\xbf\xc3|\xaf\xbe\
-\xfev*\x81^1\xab\xb9\x1a\xcc\x95Y;\xe3\xda\x90\
-\x97\x8a1\xe9\xc7.\x9d\xcag\x9fh\xbdFG%X\
-\xf2\x0cF\x05\xa1\xa4\x90\x1f]\x0c\x8b\xaa\x1cy\xff\xfb\
-\xb2dH\x89\x94\x9e!\xc33_\xe0\xb0o\xc48v\
-{CT\x18\xed\xe1\x00\x0f\xf4\xca\x8a\x08\x90\xe1I\xaf\
-\x0c\xa9;\x9c8\x01= \x03\xec\xc8\xd0H\x01\x00\xb3\
-\x01\x00,0=\x0b\x13\x1a\x07\x871G\x0dS\x18P\
-\xf00\xf3fC_\xb4!0\xe1\x09\xe3\xa4\xfc\xd0\x9a\
-1BKl\xbbcVa\xeb=\xd2w\xb7\xfe\x1f\xf0\
-\x81E\x09\xbc\x8f\xcaS\xf4\xde*xpU3\x103\
-\xf2}\xc7\xd1\x85\x95j\x12}\xa3\xa3\xf9\xed\x14\x96r\
-\xb7\x8cT\x08,\xef\x1e+\x91}\x08\xb7\xd7C\x17{\
-\xde\xe4\xfa\xda\x83\x00\xa4\x04\xa3\x00(\x07r\x00/\x8c\
-\x01pPL\x05\x80\x9a\x0c\x12\x91\xb2\xcc\xb2/,\xcc\
-_\x02c\xcc\xf0ALL\x9eL\xd7N\xe4\xa8U\x8c\
-\x84\x01\xae\xceK\xbd\x8d`mL\xe1E\x0c\x8a,L\
-E\x18\x80\x80\xf8p,\x02\x0dC\x00\xa7T\xa6\xc9\xfd\
-\xf1L\x86\xc2g\x22f\x89\xd2m\x85k\x9f\x17\x9a\x96\
-\xa5\x84\x91A\x90\xc7.\x19;,\xc3=9S\x91z\
-\x94\xad\x8a\xcc\xeb\xab;\xba*\xadl\xafk\xb85H\
-$cO\x09\xae\xd6~\xa3l\xa3\xe6\xd3[\xd3\xff'\
-\xb1y\xa9\xd5n\xd4\x85l\xd9Uou>\x1f\x93\xbf\
-k\xdc\xa4\xb1=Y)\xf2\xc4tM\x1bU\x05Fs\
-\xd2\xe9E4[\x16}\xe9\xf0\x9d\x01\xba\xf1\xab\x08\xe2\
-\x1b\x14o\x8d\x8fY\x13\x96i\xd0\x12\x1eR3\x96\x5c\
-\xa5\xa1\xc0\x80\xccN\xfa#)\x02\x194\x1f\x05\xf3\x01\
-`\x8c1\xa1\x12\xa3\xd81\xf61i\x05\x10Pn\x11\
-\x02\xd90\x10\x13\x00:\xa0e\xee\xdc\xa3?$2\x85\
-91\xfc\xafH8\x80\xf0tt\xc5\xadm\xab\xe4M\
-\x9eB\xbe\x8f\xcf\xf6-\xcd\x7f\xa9\xe8\xbf\xce\x1fmu\
-\xdcl\xef@\xab\x05m\xfa\x92\x18\xe8\x1b\x09\xdf/\xcb\
-v\xa6\xfa/\xec\xecm\xdf\xaf\xdc\xef\xb1\xf6\xbc\x8c\x10\
-ry3\x89\xf0\xbcz\xf7w\xda]D\xe5\x1d&\x04\
-\x0c+\x03LP\x0b\x0c\x8d\x15\xcc\xfe'\x0e5D\xcc\
-\xb8B&\xcd2\xb0D\xcc8@XL|!\x17\xcf\
-\x8a\x82\xddLn@-L\x220\x0e\x8c\x11@\x08L\
-\x0a\x10\x02\x83\x00\xc9\x12\x01\xec\xc0\x1a\x00\x10\x18\x002\
-K\xb7l]!I''sJ\xb6y\x91\xd8Y\xab\
-\x9c\xaa\xe8q\xeeHE\xa2n^\xa7\xcfZ\xc2\xcc\xde\
-\x03<\x03#\xb9\x9f\x9f\xb6\x0d\xa1\xcf\x05s\x9b\x86\xd5\
-W)\x0a\xa7\x8f\xe4~ZF^\xd3z\xc6J\xa4V\
-\x92wY\xcc\xb3;\xc2E#T\xac\x0ai\xe5\xe8H\
-\x5c\xff\xfb\xb2dI\x8f\x05\x11rA\x83\xbf\x19Ru\
-\x83\x88r{#T\x1e\xe5\xe4\xf8\x0f\xf5*\x81:\x90\
-\xe45\xce\x89\x14H\xe8fg\x0eKr*f\x16\x96\
-\xf2\xb39]\xd7 \x042\xf1)\xda\x04\x0b\x00.\x17\
-\x07C\x06\xa4x1\xb3\x06#\x11 s0 A\x13\
-\x13\x92\xfe0$\x07\xd36`AhNZ/\x14\xdc\
-\xfd\xeb\xfb\xeeY~U\x8c\xd2\xca\x8d\x09\xa0t\x16-\
-\x911D\xb2\xe8\x0b\x122\x15\x18\xd4(\xd0uAu\
-\x01\xa8\xd1c]l\x5c\xd3^,\xf7\xa7\x17?C\x06\
-\x96\xbc\xadz\x87 \x0dB^\xf7\x9bY\xf3\xae\xaa\xb2\
-\xb3:UL\xe0\xca,\x03\xabI\x80\xc4\x03\x09\x80\xe6\
-\x03\xa1\x810\x05\x19\x81\xc6\x08\x91\x82\xf4\x11\xc9\x86\x06\
-8\x01\x96A\xe5Q\xc7\x82L\xb1\x9c\x22+1\x87\xbf\
-\xc2\x91\xaa-g\xd9\x84\xe65\xb1\x8b\xd8\xa9\x90nA\
-\x8bI\x19\x85\xa5\xe0 u08:\x01\x07\x83\xc2\x11\
-0*\xdf=\xcd\x0b\xc1\x10\xe2i\x1at\x9ddpm\
-\x99<\x87\x0d\x8a\x91\xc6zO7@B\xc8 6\xc9\
-\xa3H\x98\xa9\xa0`<\x9b\x09<\xd21\x5c\x11\x12\xca\
-\x09\x9c`\x98\xcaS\x8e\x93)\xf0\xb1\x12\xf2M\xe2c\
-\xe4*\x17%\x11\xb6Q\xc8\x9f2\x07\xa1(\xa0\xa5\xcf\
-\x12Jh\x95k\x0eK\xd9V2e\x5cC=$B\
-J\xa6\xca+[M\x1dd\x8c\x85\x1fh\xa8\x914i\
-$l\xd5\xb3&\x99a#\x91\x95\x1f.Dj\x18\xa9\
-dF\x16@\xd8\xa1q\x84z\xf9\x10\xbex6\xc6\x9f\
-8\x88\x5cnh\x10\x18&\xa1\x04\x97\x13\x82\xc2\x9bh\
-\xa3$-Y\x94e\xc5k\x98$\x8c\xdeTP\x90\xa2\
-p\x10\x00\x02Kv\xcd\x00O\xe1O\x18\x7f\xd0\x10c\
-\xf8\x81\x90\x01\xc6\x0a\x06\x98\xb1&p\x10\x184$\xa4\
-\x13k\x16\x9d\xbf\xc0\x80\xfa^\x8aK\xcan%\x9d\x89\
-\x19\xe4v35\x8c\x8a\xb1\x08\xe4\x18{\x07\x18\xd9\xe9\
-{-\xfd\xde\x8d\xbd\x7f\x16\xae\x8e\xab?\xf4\xfa2\xf5\
-\x0a\x00>`\x02\x00\x88`\x17\x80\xf6`0\x01\xa4`\
-]\x83\x16`\xd7\x08\x0ce\x0d\xc3`d\xb5\x09\xa8c\
-c\x85\x14d\x9f\xa78~\xa6\x85\x1ac\xfe\x84\xa0r\
-\xd2\x0ej\x190f\x10\xb6c\xd8\x5cb0\x0a\x10\x1b\
-\x8a\x80\xe5\xf6]\xb4\xc5\xc8g%\x17M)2\xf9\xfb\
-l\xfa\x05W4\xbd\xcd\xd3\xb5\xa2\xc3\xe9\x84\x0a\xa6*\
-j^P\xda\xeb\xa8\xdc\x1f\xf6lA\xeeEui\xef\
-\xc7\xdc\x93aU)\x98d\x91\x19]\x0a\xd0e(\xc9\
-\xf5L(\xca\xff\xfb\xb2dB\x0f\x86\xaaw?\x83\xfd\
-J\xa2n\xa4(bc\xa3(\x1c\x99\xe6\xfa\x0f\xf1*\
-\x89\x88\x8db\x1d\xdc\x0dHMf\xc6RR\x8e\xc9*\
-AZ\xdc\xcfNL\xad\xe1=\xb8\xae\xb2\x14\x1eu\xa4\
--\xcd\xe9\xb3\xabfL\xdb\xd9\xccYc\x90U\x99\xcd\
-\xf0\x8a\x1a\x10\xad\xf1t\xb5\x04\xf6\xab$\xe9j\xedl\
--l\x8d\xc5\x0eN\x95N\x1b&\xe7\x88\xa7\xe0\x9d\xf8\
-\xaf\xff[u\x0bV\x87\xb0A\x97\x80\x02]\x19\x7f\x98\
-j\x12\x8e_4$\xd9\x01v\x06X\x82F\x1eM\x87\
-\xf4Df\x17\x0a\xc0\xd0E\x19\x19\x9b\xc1\x13\x94\x00\x19\
-\x7f\xaey\x9f\x05E]\x1d\xad\xb8\xb8\x81\x05M\x84\x86\
-\xf4\x96\xd8\xb8\xc7\x98\xd7\x03Fv\x92\xac\xc9\x12\x88\xb8\
-\x15ZN\x80\x84\xc6'\x1c\x119\x93\x0e\x11Y\xaf\xbe\
-\x97sS\xabf\x95\x8c*\x92*F\x89\xd6\xbf\x1e0\
-\x82\xb9\x982\xb0\xf1\xda\xdc`\x14\x80\x14,\x04\xa8\x18\
-\x0f3\x03\x08\x00\xa0\xe0\xa9\xcc-\x00FL\xd5rQ\
-M\x9a\xe0\x80LT@\xaa\xccC6\xb5N\xa0\x96\x87\
-\x0c?0\xbaN%Z3Z\xfc\xc6GC\x0d\x92L\
-$,0\xa8d\xc0\xe0\x10\xe0\x22\xcf\x9d@\xe7;E\
-1\x8b,\xc9n\xbdtYk\xa0i\x1e\x13\xb8\x97Z\
-\x86.\xe7l\x99L\xc9>\xa4~\x06\x19N\x98E\x18\
-\x95\x9a\xc8\xe5\x12\x22G\xc1\xc9\xb1\x18\x112\xcb\x19d\
-\xd2\xa7O\x0c\xab\x15\xa4}\xe8\x94/\xa5\x8cH\x81\xd1\
-M\x0a\x88\x95\xd4\x07\xde\xc4\x86\x0b\x0e7#\x8d\x85\xf6\
-\x91\xcf\xb9\xa7\x15ZL /\x22c&\xdd9\xe2d\
-\xa5p\x95\xb8\xb4\xa2\x88\x153&d\x82x\x96\xebb\
-\x95&\x85iFp\x9b\x85\x0a9\x13\xd1X\xa6.S\
-(\xaaT\x99)\x16%2YDy\xc8\x1f\x14\xda\x86\
-\xea\x09\xb7\x224\xe4^\x88\x15YU\xe4\xa8S\x8c\x90\
-\x00\xca\xec\x91\xebU\x02P\x9c\x01.\x99\x0c\x19\x98\xce\
-\x1b\x18\xc2\xdd\x1eFe\x98\xae\x0c\x00\xc2\x86\xcc\xb5\xde\
-\x96\xdf\xac\xbf\xbes}\x09l\x8eY\x99\x11\xa3\x22\x09\
-\x83\xe1\xe2\xe9\x0f\x144\x09\x92q$B\xd3\xf3\xb6<\
-Y\x08\x8e\xe37\xfaV/F.\x8a\x15ML\xa3A\
-\xcdp\xbb\xb4Y\xbdV?iVQ\xd4\xf7w\xad0\
-\x0cI#\x04\x8c\xc1\xbc1\x1cL\x01\xd09\x8c\x05@\
-\xa9\xcc\x09UhL\x81\xc0\xc7\xccH\xa0\x7f\xccKD\
-,M\xcdB:\x8c?@mL\x12P2\x8c\x09\xc0\
-\x1cL\x05\xb0\x10\x8c\x03 \x08L\x01p\x01\x13\x85\xa5\
-.\xd7\xfaq<\xaa\xcd\xff\xfb\xb2d$\x0d\x96$x\
-\xc0\x0b_0\xe2^$\x08\x87s\xa3D\x18\xd9\xe6\xfe\
-\x0f\xec\xca\x89o\x0a\xa1\xc9\xc0\x8d\xd03f\x19\xcb\xb7\
-y\xffMk,\xf5I\xc9\x0e13a\x8e\xda\x0b\x92\
-B\x92\xd3\xee\x9buL\x81\xce\x82\xe3Z\xd2)\x0dy\
-5\x0e\xbb0\xbd\x84\x12\xa2\xef`\x84\xc25\xbe\xcaN\
-\xe6!\x08*\xad\xce-5\xb2/\x9aU\xd2S\xd32\
-cc^\xb2\x10\xceTo\xfc\xef\xcd?l\x7f\xd2$\
-\xe6[z2\xe4\x8e\xddB+X\x85\xbb\xe3W\xe7\xb5\
-\xdef\x81\xcd\xab\xdd3\xf3N*\x8c\xca\xbct\x17I\
-o*\xa1\x0a\xa6\xe8\xb8\xd0\x06\xa3d\x00\x07\xe7b^\
-\xee\x16\x5c\xd0\x15\xd3L\x88\xc0\xc4\x83\x1c\xa6\xce\xe35\
-\x0c1\x03\xc3\x80\x06\x9f\x02O\xd2[r\xfc\xa1Ht\
-\x8d?1`\xc9\xf0!\xdc\xea\xec\xf0\x11\xe6 \xe99\
-\x08\xc5\x94B\x84\x22\xff^\x8avz\x1c\xe3\xd1\xaa\x16\
-G\x15LY\x89eB\xe6*\xd1\xf6\xbe\xc3\xbe\xfc\x91\
-\xff\xbf\xd8+X\xba^\x18\x01`\x07\x98\x04\x80\x15\x18\
-\x09\xa0+\x98\x12\x00U\x18(\xa0\xda\x98\xd6Gx\x99\
-+ \xdf\x98\x16`W\x18|C\xe1\x1b\xd8Eb\x98\
-l\xc0k\x1f\x0a\xa9\xb4\x10\x19\xb8i\x8e\x02\x00\x86\xc0\
-\xc0\x09\x08\xce\xe7(c\x09-\xf1\xd0\x8b\xcb\xdbK\x14\
-\x9d\x81\xb4?u\x1b\x9f\xf6\x8c\xd4h\xb6\xcaB\x11\xca\
-^wiY\xae\xe7IE\xac\x92.\xa2\xces\xaa\x8b\
-?\xa4\x94\xc8\x8d5\xb5\xd3\xc8 \xcf2\x99\xdc\x81\x08\
-B\xd8\x9aQ\x9f\xde4\xde6a\xcac\xd2\x92\xac\xc2\
-x\x11\x05\xe5b\xc8\x04\xed\x1ep\xf4\xe8\x96\x16Z\xdf\
-M/\x0c\x11\xab\x82\xf6\xdbp\xbe\xcf\xa6\x94z\x05\x22\
-\x89\xce\xbb\xac\xf4G\x0bH\x0d\xa9\x1d\xec\xfb\x10\x83\x98\
-\xa3\xdc\xf2\x06\xaaj \xd3\xfbR6\x84\xafN9R\
-\xca\x9d\x90\xa8\x18\xcbO`Vx\xcb\xc1\x93\x15]N\
-\x8c\xdc1 t\xb4\xcb\x0a\xedFi\xb9D\xab\xa3\xcf\
-\x96\x95@c\x0e*\x02x\xd0\x00\x98j\x0e\x1c`\xab\
-\x0b\x81\xa9\xb9\xa46\xda(\x0e\x8a\x98\xef\xb5\xb3\x0eg\
-X\xd5>\xaf\xba\xb7\xb9\xfe|U[\x9d\xa9k)\xd7\
-{\x8f\xf8\xdd\x93\xcaA\x04*`\x12%\x05\x81\xc0\x12\
-`&\x00\x86\x06@Ja\x12\x15FYJllN\
-\x18\xc6>b\x10b\xb3\x11\x06\xe6\xab\xceb2\x18\x87\
-:\xb9\xa3Pc\x08\x80A$,5-\x8bN\xdd\xef\
-\x1b\xe1\x95\xb5x\xea!u\x06\xaeVc*\x88\x12o\
-\x22\x13\x93\xb3\x88\xb4\x12\xc8Hp\xff\xfb\xb2d(\x8d\
-\x04\xa0wA\x8b\xda\x1a\xa2TE\x18\x86s\xa3D\x13\
-%\xe1\x06O\x18q\x09\x13\x8d\xa2\xe8\x1d\x0c`\xd0\xcc\
-\xfc\xd6\x16\x7f\xf9\x12BmW\xc9\xef\xf3\xbc\x16\x08\x98\
-\x8e\x9f\xa4\xcf\xb4\xedx\x8d_\xa6q\xb4\x88o\xa9\x7f\
-\xf0\xb6\x87-|\xf2\xba\xdc\xa5c\x07I\x8b*D\xa6\
-\xde\xbb\xfd\x18\xc6v\xf5z\xc7\xf2\x9ccT\xf6\x09\xe2\
-\x1a\x025\xf0\x01\xcc\xb7r\x0b \x02\x18N\x8ca\xd0\
-\xb0\x80\x06b\xc1\x09\xc4\xc28\xf0\x98P\x055\x18U\
-\x15\xbc%\xc8\xff\xcbM\xe9\x939e8\xfe\xca\xad\x0d\
-\x9fe\x19\x1c\xc29\xd6\xf2\xca\xe8\xccs\x04\x15\x1e\xdb\
-\xd7\xca\xf5]\x7fN\xcf\xf4\xf6\x90\xfa\x93\xdfn-\xee\
-\xeb\xa2\x8f\xb7K\x86\x06B\x81C \x12\x16\x01\xe3\x00\
-\x10M0\x18\x0f#\x11X$0\xdb\x0f\xa3\x08p.\
-1\xd3\x15#\xdbR.\x05\x18\xd8\xf0^\x8d\x02\x91\x10\
-\x0e\x94\x00\x12\xdci\xf0\xdcr\xaf\x1bo\xdfgmA\
-\x9b\xeb\x9b\xc8\x1a\xf2\xe9\xdd\xa9\xc7\xbe\x15G\x98bx\
-O\xda`\xa1gmcw9n\xabT\xf9\x03\xedl\
-hg\xbc\xdc\xabR\x91\x8cnAp\xe917\x92\x12\
-\x1fI\x9f\xf7pZ?I7t\x9fJM\xd2E\xaf\
-\xb3\x9e\xc6\xbf\xe6f\xaa\xe4C\x12OY}\xe6\xda\xb2\
-\x91*\x9a\x9eE#\xe4\x7f\xa891\xb5\x15T\x88\x00\
--\xcbch\x80\xc9\x82\xdb\xf0g\xde\x04h\x12L+\
-\xe8\xd2UKh&j\xe8k3\xf3?b+)\x87\
-y\xe1hU\xd5\xd1\xf4\x1c\x18J\x11\x99\xb0P\x0e\xd1\
-I[\x16\x03(P\xc9\xe1\xec\x86\xb5\xfc\xff\xff\xb1\xbd\
-\xff\xff\xfb\xaa\x04\x01)J\xd1\x00\x89\xe6\xd1X\xc3\x00\
-\x1a\x11'\x89\xa1\x8d\xd9@\x19m\x01!\x86\xa0=\x98\
-\x02!Y\x8d\x89\xad\x02\x01d\x02\x03\x81`\x07H\xe4\
-\xf5n\xd3o2\xd7\xaf\x90\xc5\xf6\xf7 \xcf\x97\x93'\
-\xa2\xe86\x93\xc5\xcd\x1d\x06\x82\x86\xf52\xb2|\xbc\xaf\
-)N\xbf\x8dkU^O\xac\x03M\xc9\x1b&\xc0\xb2\
-\xc7\xc5\xfb\xb6\xf3\xce\x8c\xdb_6\xbfR`\x91\xde;\
-T\xedk\x09\xef\xad\x1f\x12l\xbc\xa7\xb5\x9d\xa4\xb7?\
-Z\x87\xd7\xd8\xca\x09z mz\xf5\xbb\xbc\xb0\xf1\xac\
-\x08}\xb8\xd0\x0br4@\x00\xa2\x0d3!0J\x1c\
-\x1c\x89\x07\x03\x8c\x22N\x13)\x8b\x06\x99\xacZtP\
-\x9b\x7fO\xeeS\xa6\xbd\x84\x8c\x0c\xd8\xca\xbe\xb0\x15A\
-\x07\x153,6\xc5\x9a4P\xf2\xca\x9e\x1a\xfd\xe2\x9f\
-e\xfb\x95\xb5\x85\xbe7\xff\xedO\xff\xef\xdf\xff\xfb\xb2\
-dl\x80\x84}&\xc2\xd3^IBN\xc4\x08\x97\x07\
-\x83\x18\x13\xa5\xc1\x04/\x14oI^\x8d\xe1\xc8\x0d\x8c\
-(\xc8\xe8\xba\xc3}\x04\x03\x0eV\xd4n\x0a\x009\x80\
-\x18\x12\x18\x15\x04\x99\x89zG\x99\x90\x04)\x85\xe0;\
-\x98\xae\x1a\xc9\xcf\xd0{\x18\x93\x00\xb9\x82X\x04\x01\x80\
-\xe40\x03\x92\xe5\x8b@\x81\x00\xb9\xcaw\xa5+\xa8\xb1\
-\xde\xc5\xa9\x99\x1c8@\xb6\x87^i(gfR\xce\
-\xa5kM\x0c\x11K\x11+\xba\xb2]z\xc8\xa3\xb6\x91\
-bZ\x94.\xee\xe3\xda\x19\xa3\x1b1\x91\xa9\xa7\x08\xc6\
-i\x19N\x95s?H\x09L\x00\x81\x93'\x16\xb6K\
-yiBc\xe1\xc1\x88\x121Q\x13+\x1e{\x17f\
-\x81IB\xbb\xa22\x89S<jC\x08\x8cR<b\
-H\x94\xa9\xbb\xe4\x00\xd5\xd9\x85\x96b\x16\xa4 \xa5\x02\
-\xa1V\xb3\xc9bD\xf7b\x9e\xa3\xcc\xfa\x7f?\xcf*\
-\xaa\xa8D\xc4\xc1\x87\x83\xe8\x12\xae\xe1\x1cY`\xd1\x83\
-\x87,\x06\xdc'\xbe\xc1\xad$\xf6-O\xb2^\xd6W\
-\x81\xe9\x9cKo\xb2R\xbe\xa63E\xcf\xa0!\x9bT\
-\xd9R\xa6\x16\xa4=\xf7W!\xe6\xc6\xd5\x82\x99\x1a\x18\
-\x02BL(\x98\xcb\xe4LS\x164\xc4\xdc$L/\
-A\x88\xc2P\xec\x8d\x88\x0e\x04\xc1\xe0\x18\x00\xa0>\x22\
-\x00E\x0fi\x0d\xdd\xfc\x08\x02\xf5\xf3\xdaOYHt\
-\x5c\xc728\xa1\x99\xd0\x85MK\xbb\x0bU\x99\x1c\x92\
-b\xf2\xf5\x09F\xc1\xd2\xcd0\xb2\x91zU%UP\
-\x83Uli\xee\x88\xe7\x94\xe4\xb4\xda\x8f\x99Xo\x86\
-%\xdc\x88\x1a\xf4\x95yc>\x93\xde\x12K(k\xf4\
-\xed\x05J$&\xc9\xdd\x96\xf6\xf0\xefn\x8e\x8c\xb0f\
-F\xa5\x13\xdcI\x17.EC\xa4S\x5c\xae\x864X\
-\xfdk\x91\xcbGv]Ro\x06\xdb\xded\x98\xd8\x10\
-R4@\x01\xb4\xefH\x86\x87H\x94\xc4\x82@\x08\xe7\
-\x1c$\x85.4f\xd1}?\xeb[* @\xc5\x08\
-x'(\x18\xa2\x82\x81p\xa9\xe0\x18\x84UB\xd3\xa1\
-\x03\xcaBjf|uU\xfa\xbf\xe5\x7f\xff_\xf4\xff\
-\xf2_\xd7\x7f\xb1v2*\xf33T\x9a\x16\x05L9\
-\x01\x8d\x864A\xeb\xb9\x97d\x01\x9a\xfc\xa1\xb0(\xff\
-\x98Z\x81\x81\x81\x80\x08\x80\x80x\xb7\xaa\xe9\xc5\xb4\x0c\
-P\xc7\xd2\x06\x0a\xe9H\x1b\x16@\xca\xb5\x130\x85\x0c\
-\x10B`Fn(\xe7C\x9b02C`\xa2\x14\xf4\
-\x0bH]\x07\xbb\x06\xb9)\xacc\x88z\xb9\xb8\xc2\x8e\
- 7x\x94\x91\x03\x00\x8bH\xce\x1cDpU\x8a\xc6\
-\xff\xfb\xb2d\xaa\x0f\x85\x15y@\x83~ABH#\
-\x08\x97\x07b\x18\x14\x01\xdb\x02\x0e\xf8h\x89\x1b\x0e\xe2\
-\x1d\xb0\x8d\xa0Jy\x02\x85\x01\x11\x22 \xe2t\xa40\
-\xc6\x17\xb8\xda\xb6e\xa5\x89\x82\x06dN\x80\xb8Rl\
-y9\x06\x08\xa9\x19\xe0Hg\x02\x05P\x86\xe0\x85\xe9\
-\xc3>a\xc1\xbb\x85\xf2\x0d\x13\x00\xecI\xc6@\x00~\
-\xbf+\xaf\x10\x89h0\xda\x1f\x06\x07\x1d\x01\x1a\xbc\x91\
-\xd8\xea\xf2\xbeZ\xa1\xce\x80\xe6\xeb.(wH\xce\xa4\
-,\x8c&\x0d\x83\xc0\xab5\x10\x11N\xef\xfan\xd6\xbf\
-Q\xa6\xb5[R\xf7i\xe8\xea\xfe\xaf\xff\x92\xec\xbb\xfb\
-\x22E@\x1c\x16|\xaa%P\x06*\x00\xf8\x5c \x8c\
-\x16\x91\xd0\xc6\xcc\x1a\x80\xc1ra\xb23\xe6\xf0dx\
-af\x08'\xc3\x06\x0dX\x19;\xa9\x0d\xc0\xf8[\xe1\
-\x12\xc81\xe3\x22\xd3\xd7\xa1\xe5\xa5\x1cGaC\x00S\
-Rqj\xbd\x84\x089\x22\xf6O \xe3\x9a\xee\xf5)\
-i]1=0\xc4uf\xe4Rd2\xe8\xa4&<\
-\xcfi\xb7\xb9\xc8\xf9nD\xa3\x0f\xf4f\xb9\xa7\xd2\xe2\
-\x09KN&\x84M\x98}\x92\xea\x1b/|\xa2Kb\
-\xe1\x8b\x86\x17\x14JgH\xb1\xa6\x0e\x8dt\xc0\xaaL\
-$\xad\xd8Jd\xfe\xb3\xae\x9bZ{.H\x96lV\
-\xc9\xe5\xb9\x06\x04\x93X\xfd0\xe3\xf8\x8a\x93\xcc\xc9 \
-V0y\x1f\xb3&Y\x00\x0bJ\xbb\xa0bi\x06\x04\
-\x1a\x14\x15\xa4oU\xa84\xa6\x9b\x10\xdf\xfb\x17nf\
-hy\x9e\xc5\xc9\x0e%Pg\x0a\x05\xcf=\x86\xd0\x08\
-cS\x10.\x06\x0a5\x08C\xacP\x06\x7fp\xf2\x22\
-\xdf\x1aI\x1c\xa1\xd1z\xedb\x08\xa1\x1d\xea\xd9Q#\
-\xa2\xad\x02\xa5b\x8e\xbc\xe4AyT\x10\x9fa\x03D\
-\x94\xf2S\xbf\x8cM\x00\x86\x05\x81f\x15\x09\x86\xa7\xff\
-\xc6\xd5\x0cFm\x11&>~'\x96T\xc66\x0a'\
-\x1bF \xa5\xe2X\xb0\xd4E\xee\x93t\xf9\xc6\xe4\xc3\
-[+\x96k\xedh\xb1\x08&jK\x92D\xbc\x10\xa0\
-!\x1d\xbf7\xe2\x0fi\xb2\xa4\xb6\x90I\x16\xb4\x92\xa9\
-\xdb\xe3m\xbfz\xb3\xc9\xab~\x9d\x04KI\x1f/%\
-\x109\xbd:\x924K\x0a\xf2\xe0RRI\xb3H\x10\
-\xa6Q\x0b\x0a\x9f\xab\x8a*|\x14\x9a\x87L*\x96\xb2\
-\xca8\xdb\x92\xa8/qj\x8cWM\x98w\xc1'\x9a\
-J\x97\xd6\xb7\x1d\x19\xa0D\x9at\xac\xca\xa1G&\x1a\
-\xa4\x96\xbbA~\x9b\xd3\xb2\xc2\x89\x06\xa2\xbb\x04\xa4\x09\
-\xd1\xe8E\x11\xb4Ym\xcd\x97\xc1\x14\xed\xd0\xb9.\x93\
-\xe2\xean\xff\xfb\xb2d\xe8\x8d\xd5\xa0v\xbf\x8b\xd82\
-\xa2[\x83\x08b\x07C\x18\x18\x11\xe8\xfc.\xe5*A\
-q\x10\xe1\x88\x1d\x8c`\x1e\xaf\xc5L\x14<\x99\x15\xc6\
-@\x11\xcd\x82+T\x9a\xfe&q\xfe\xed\xf9\x15U;\
-\x9cG\xd8\xcbV\x10!\xad\xc0\xb1,\xa1<\x1a\x1d\xa3\
-\xee*:\xa7\x8e\xbe\xb1\x87\xf1*\x88X\xd7w\xb1$\
-\xcc\xd0\xf1\xf4\x863)JX\xf5\x87\xa8=\x84\x0d\x9a\
-\x14$\x1e\xba\x87b\xe8P\xac\xe4\x83\x19\x10jy%\
-\xd6\x8aU\x8dC\xac\xe9@A \x11\x83A\xf9\xa8)\
-\xc8\xd98`Prf\xc1\xf6nd\x1e\xe6\x16\xc0H\
-$\x09d\xc0\x18\x9cm\x02/\x14(\xa2%\xed\xa2\xc5\
-\xcf6\xdb\x06\xb1]C\xcf!y!,I\xf1\x0c\xb1\
-4R\xaa%\xb4HQL\x91Te\x14U\x5c'U\
-\x84\x84* \x9bi\xbc\x84\xdd\xa7t*,\xacQ\xc2\
-I\x1f\x82\xcb\xa1\xdcZ\x0fQc\xc4'.I\xf3H\
-\xa8\x99\xe9\x919\x0d0\x8dRT3\xc4D0`g\
-\x10\x11A\x88R\xc9(\xd1c\xc8\xe6Yr\xb0\x22\x1c\
-\x5c\x9am<Q6\x5c\xcb[\xacY\x14\x1eQX\xae\
-\xd4\x97\x83K\x89R\xc6\xd0\xe2\x12F\x9cl\xe4\x9e\x93\
-\xf2M\x22\xe5\x0d\x10!2\x89\x7f*^\xeb\xa2+\x91\
-5$D\xa2\xb9NL\xcas[\x0d\xae\x89\x94I\xe2\
-o\x9c\xa4\x005i(\x0b$\x92\x18%P\x96\x1a\x98\
-\xb4\x8f\xa8e\xef}\xcb&#\xce\xdb\x0f\xcc\x11\x02@\
-\x22\xa5\xb0\xd4#\x0d\xa0\x16f\xbd\xc0\xdfL\xaf`\xee\
-s\xd0Qh\xbf\xbd\xe9}\xb0\xabF\xfe\x9f\xea#{\
-\x9aC\xf6\xd9\x0f\xe5\xaa\xf1Je\xe5\x8d\xfff\xfa\x94\
-GG1\xf4n\xb7y\x8c\xdb\xa9\xca_\xed7\xfb\x8d\
-\xb3\xb2\x8d\xe2\xbc\x8d\xf4'\xe9\xe4v\xd9\xb9\x84 a\
-m\x98\xf5u\x9a\x04%\x18\x92\x10\x18\x8a\xce\x18\x84\xf4\
-\x986\x07\x06\x01\xab\x04\xee\x89\xa2\x91u\xca9\xa61\
-gb\xad\xab\x13\x89V\x19\x8b0U\x86\xe6\x93-\xbe\
-rr\x94B\x88&PD\xc0\xbb+\x9a\xd4b\xc6\xd5\
-\x86\x9c\x9d\xbe\x0997\x22f(j\x8f7\xac\xb6\xd3\
-\x8e\xc7\xc3^\x92\xad\xd2\xfc\x86\x05u\xc7\x9aH\xcb\x14\
-\x93\xd3@\xd4\xd7\x84PA6\x1ca\xb4Na\xd1(\
-[\xb3\xaf\x92\xed\x91\x1cRk<]\xd6\xb1\xe3\xc7\xda\
-\x5cB\xb3*#\x15\xc1\x86\xa8\xaa\x06V\x9a{6\x13\
-\x84_\x08\xd0\x89\x12\x85\xd2\xb79\xd0D%=Qb\
-\xd04\x94\x93F\x8a\xd2q\x1a\xab\xbeD\x8e3h\xca\
-\xbe\xd1)\x12\x12\xc1\xff\xfb\xb2d\xf9\x8d\xf6vy\xbe\
-\x83\xbeJ\x22e#8R#C$X\xdd\xe2\xfa-\
-u$\xc9\x82\x8d\xe1@l\x8c\x91\xf5\x8b:\x1b#\xf1\
-l\x136\x1e\x02\xc0\x09\x8b\x16\xd4G+=\x95\xb2i\
-\x10\xa5\xfd\xdf\xa8W>\xda~-\xe3\x88\xf7%@\xa6\
-\x80\xb1\xac\xb3\xf6}:\xbeb\xa6=N+\x95\x8f+\
-\xe1}\x8b\xbb=\x7f\x15\xc2\xcf\xb3\xaf\x15\xab\xd1\xab\x8f\
-\xbe\xbc\xf6m\xecU\xbe\x93\xe2\xda\xe0\xd7?T\x08u\
-\xb9\xf40\xb0\xd3y\xf4\xa3\xf7X3~\xef~\xd9\x97\
-\xb7\xeeJ\x19\x00\x00h$\x11\x87\x110d\x0b.h\
-\x9e\x9cI\xe7\xb9y\x80\xa0\x90P\x98:yrN\xf1\
-\x10T\x0c\xf2&\x85[\x86U&\x15@\x94\xc2$\x06\
-\x12&_5\xb9\x1b\x12(BQ\xd8+m\x85\x0f\x16\
-\x10\x85\x94\x04H\x8d\xe1Vl\xc2\xe6\x97:]\x04\xa0\
-\xd4\xac\x8d\x22\xea0j\xe5;\xd4H\xa4\x89\x88\x92\xac\
-i\x96\xd8d\xed.T\xe5\xde=KaY\xa8\xe4\xd4\
-[qk5h\xfc/21\x9a\x22\xc8r-#i\
-\x95\x14G\x139\xd2B\xaa\x8a\xb0\xd4\xe4iY\x9b\x8b\
-[vML\xd6\x19|\x99\x94V\xa9=Q5\xeeJ\
-\xd5\xb4\xe4\xabZ\xfc\x22KX\x97ID\xa5\xe0\x823\
-jm\xa6{t\x88\xf6\x1b\xbbN.V\xe0\xad\xc9\xb3\
-j\xadD\xc7\x16k)\x01\x01\x857\x09\x00\x0e\xe7\x9f\
-~\x81'\x0b\xf5!\x1cH8\xd9p\xfeL\xcf\xf3\x9f\
-?k\x03\xa5Z\xf6Z\x95\xda\xa9xbDU\x82\x8f\
-c:Cd\x5cU[\x9cL\x83\xd3Z\xfa\x94\xdc:\
-\xef\xbe\x92U#i\x1a\x14.\x9eBm1G\x80\xda\
-\xad*\xefM\xad6Q\x84\xc5\xb8u\x81\x9a\x12\xaf\xbb\
-\x18\xa7\x7f\x15\xbcHA\x19s0\x85\x84\x1b\xc3\x88\x7f\
-L4(\x15\x00\xa9\xd3\x96\xb9z\xc5\xa6\xb0\x16\x16?\
-V[\xf7n\xa6\xad:\xb5\x9c]1\x1e\xb3\x17\x15\xe3\
-ZS1\xb1l\xa4p\xc3\xae\x9c\x99\x9a\xc2\xb7\xa0:\
-}\x97\xa8\xc4\xbd0b,Cqr'\xd6\xbevt\
-\xaa5\xea\x8e\x1f\xd8\xd0\x92\xcf\xacub\xa7\xf6\x06\xe6\
-\xcb\x12\xc4g\x0d\xf1\x95\xa5\xc3\xe4\x97R\xd3\xb1\xafd\
-\x9f\x157\xe8\xdb\xef\x09\xb6QXW\x95\x89I\x1fX\
-\xca\xca!\x93V\xb4x\xea\xd3\xf2\xf2\xe2\xfb\xf5:\x94\
-#\xd6XA\xd3\x97 .>\x84Xu\x18\xf2\xae4\
-\xdc\x86\x5cZ\xb9\x93\xb5\xab\x15\xddq\xfa\xa8[M\xa8\
-\xb9\x14eX\x16\xb1\x1dO\xe4\xe4\xed1\xc1\xdb\x5c\xf4\
-\xda\xebv\x17\x14\xa7\xa7\xd0\xdf\xff\xfb\xb2d\xf3\x0d\x06\
- y\xbf\x13]I\x92W\x84(z`f^\x1aA\
-\xe8\xf8\x0dq\x86\x81\x98\x1b\xa1\x08m\x0c\xc9\xea[-\
-?\x0a\xe7\xa0\xe1\x80\x00-\xdeH\x80Jw\xe5\x10D\
-\xc2<\xa2\x84\x8f{g\xf8\xc1L\xbe\x13\xb1\xd6F\xd6\
-\xccI\x82,\x1e\xc0T.o?-x]/\xb9I\
-\xdb;\x0ds>Yg\x18\xf2\x9c\xb9`\x85;\x03\xed\
-\xc6\xa2\x90\xd9m\xfb\x0b{\xee\xb3\xab5\xce\x14\xd5\xd5\
-w\xe3\xbd>E?\xd7e\xd6\xfdC\xf7\x17R\xc0\xa3\
-]%y\xb3\xeb}L\xf9\xfcU\x8a\x10*\xd3S\xe1\
-\x05\xb5B\x108\x08\xcaD\x0dG\x18^B\x07\x14C\
-@\x8a\xd6d\xa7\xcc\x8f*\xf22uK$>Y\xa9\
-L\x93\xe2\xafh\xe2X\xdd\xa9\xab$\x89\x14\xe5\xa9*\
-Lc\x04\xec\x13\xccDx\x5c\x81\x03\xd4!\x96 {\
-H)U\x9a!I\x9d!\xb5\x8c\xe2\xed.\xd8\xe0\x9e\
-\x97tf\xba\xcc\xa3i\x01EL6\xa6?\xb5\x13\x15\
-4\x89fm' \xeb\x9dh\xcfP\xea\x05E:\xbb\
-b\x94(Sf}\x04\x0a\x95\x8a\x08i\xe4\xa7\xd1\xc0\
-\x98\x89\x1b+\xc4L\x8e>jM\xa9\xb6\xcanY\x92\
-D\xbc\x9aF\x80\xba\xfa\xe5\x5c\xe4\x94\x89KY\xb6 \
-\xc1>F\x06\xca@\xc2\xa4\x0c'&0\xba\xf2\x22\x0a\
-!o\xd9\xc3\xcb@.V\x95\xf2\x18U\xd9\x88\xe64\
-\x00\x12\xa9\xcc\xa0Z,Hc\x80\xe9\x01\xcd\xaeP\xc8\
-\xf8]\xf9\xf1a\xe6\xa92\xe3\xa0cb0j0D\
-\xa8\xa2\x83\x08r\x1e\xf3j\xd9\xf6\xe1\xb6\xdaL\xaf\x16\
-u\xbf\x85\xec\x13l\x99?\x13\xb1\xa4\xfd\xd5cy\xe7\
-\x17\xe6\xcdz:\xff\xbc^\xdel.\xfc\x22.2\x9b\
-2N\xd3of\xbf\xc6\xd8\xd2\xe8\xad\xf6\xaa\xcf\x9b\x90\
-\xa7\xc6\xea\x91U\x82\xcf\xc8\x1a\x11\x88\x80\xa6\x1e\x02\x98\
-\x19.l:!\x84\x81k\x0d\x06\xd3<\xb3\x04j&\
-\x85\xa4\x0a#\xa6S\xe4\xb1\x81D\xa4\xd2[!\xc3\xcd\
-%f\x02\xb2eA\x85\x83\xea\x8a7\xbf\x1b\x9c\x8d\xed\
-\x93$\x89\x86&\x92eY,u\x0a\x94\xbbm\xc0\x8a\
-/Iz=\x13\xa3$\xe6b\xc1\xf5T:\x81\x03\x0a\
-7\x96\xe2S\x06\x08\x05\xa6K5\xad\xb8\xc5\x92\xf1\x93\
-\xd1\xcb\x0f\x16\xb5\x91\x17\x92\x06\x902\x8e\x09kxC\
-\x16\x1a\x8d%2\xcdy\xceH\x96Z2Vpd\xf1\
-\xb3\xb2\x9aL\x17\xbdrL*p\xbbqIvp\x8e\
-L\xac\xcd\x11\xaf\x19Aj\xc2\x12\x15\x14\x9a\xe9\x11\x9d\
-\xc4\x93\x22R6\xdc\xd9\x92\xfay}\x1d\xff\xfb\xb2d\
-\xf0\x8dV\x1fz>\x8b}J\x10dDHB#\x03\
-2X\x19\xe2\xfa!\xf1#\x09\x89\x0e\xa1\x18\x1c\x0c\x91\
-\x99\x22\x14\x89YdR\x1d\x01(Nuv\xa4\xb9\x0e\
-C{\x85)\xc0~G\x11\xf9K\x9a\xff\x831b\x05\
-\x1bP\x8385\xd2\x15v\x1f\x13\x5c\x7f\xed\xdd\xcb\xcd\
-\xb2\xd08U\xf6\xbe\xdf\x83\x17\xa0\x92\xdfU[\xbe\xed\
-r<\xee\x9f\xf7\xc3\x9ee\xd9W\x85\xc1>\x8b\xb5\x00\
-\xe5n%\x9eV\xb7\xff\xa4\xfa?\xc3\xddu\xcd\xa7m\
-\xa6j\xb0'/@\xe4G{5\xd5bl\xed\xaf\xbb\
-\xf24o[\xc6\x08d\x8c\x9f\x89\x1ci\xee\x04\x06\x83\
-\x82\xeb\xbd\x97\xb27.6\xa2i\x92F\x0b\xfb\x22(\
-\xe1\xa4\x07\x11\xa0]A\xf1\x88E\x99\xd9\x99FF\x16\
-\xb7\x94]E \x8d\xca)\x87\xb5e{\x8a\xd1\xfa@\
-p]d3(\xb1\x0c\xd1\xa4P\xba\x0d\xd1b\xb1Z\
-lL\x84+\xfe\x9a\x8a\xd0@`O\x8c\xc5\x8a%\x8e\
-\x8a\x8e\xfb\xb2$\x5c\x99S\xf0z\x1bY\x11S\xa7\xc4\
-\xe4%\xe2uB\xb8\xe0\xda1\x02\x02\xe8\x13\xc5\x96\xa2\
-\xab\xa3\xa2sre\x125\x9c\xb4Q\xc9BD\xb9\x88\
-\xe2Xi\xa3L\x1c]\xa5Xy\x88!Jl\xa0,\
-R*\xeb\x96\xefa\x19\xe5Z\x93[m\x1aj$\xc8\
-\x9a\x93S\xb3o\x94\x8d\x16F\xac)\x96\x12\x92\xecJ\
-@!\x9d\xa4\xaa\x82\xc1\x81\x1d\x0f#3\xcf\xcf\xbd\xa5\
-\x1e\xc2,\xf8\xe79$\x81\x80C)\xa1*\xe7\xe6\x89\
-K\xbeGo\xff\x17\xaf\xa2C?\xa9\x9a\x95\xca\x99O\
-\xeeG\xd6e\x22N\x11A\x99\x22\xc2>\xe7s\xa7\x94\
-\xa4\xd91\x0b\xfcW7\x9a\xc9\xcd\xb7\x18\xb6\xb2\xfd\x97\
-^\xaf-m\xd2p\x0fn\xf9\xfb0\x17|>3\xed\
-O\xf6BD\x9c\xa7\xfa-*\x81\xad*\xb2\xce\x00\xac\
-s\xc8$\xd3-\xbd\x8c\xa6\x05\xb2\x91g\xa2\x97\x96\xeb\
-Sk\xbal\xc9n\x9b{:\xabd*\xe5\x89\xfb$\
-a\xb3\x83\xed\xb6F\xdc\x18\xd7\xc9\x94\xf7\xb3l\x94e\
-J\x18\x94\xceE\xaa\x8a\x88&@\x92\x96c\xb6\xaa\xd6\
-\x13&n\xa8\x890L\x0ey\xec\xacM\xed-\xc2\xd7\
-.\xc6n\xef\x16\x9e\x1fG\xc8\x14Y\x84P)}\x0f\
-\x85\x1c4\xa3\xc5\xb59\xf2\x85Wg\xa3\x5c\xac \x9c\
-i\x87\xd4\xae^2TW@\xdc?\xd1S\xf0\x92\xa1\
-';g\x1dw\xc8\xb2-l\xef\xd3\x03x$\xb9\xa9\
-\xd8\x0d\xbb\xba\xab\x10@\xd9+\x05\x22\xc6\x9bd\x88\xd0\
-\x98\x00\x96U\xd2\xaa\xa1\x00\x22\x13\xcb\x8e\xc9\xb0$\xff\
-\xfb\xb2d\xf2\x0d\xd6'y\xbe\x83<J\x22b\xa9\xb8\
-A\x0d\xe3@\xd4\xd9\xe8\xfe,\xa4\xcf\xd2\x00\xbb`@\
-4\x8cac\x12xc\x19\xb3y$Y\xb5\x83\x82\x10\
-\x86\xa8\xe2`%3Qj\xa6\x1a#\x90\xd1A\x84@\
-\xca \xa0\xf4\x9c\xc1w\xe5\x87\x1e\x90\xd9B\x84\xa4\xea\
-\x10{\xb9n\x84\x185\x0f\x02-2\x22f\x5c\x94\xba\
-\xaf#\xb3F\x0c\x19\x11M\xe5\xa8\x8bk\x19\x19A*\
-\xda\x05f8\xc1\x0a\x98\xa7\xd5\xfa\xd9\x0d\xb2z\x90\xa3\
-\xb8\x93%H\xe6\xa38de\xd5\x84\x9dx\xea\x10)\
-7\x95I``Tly\x7f\xb0\xb8[\xed\xec\xabA\
-\xcc\xf7\x85\xea\x12B\xdc\xc0/\x92*\xc4B\x97\xb4\x89\
-\xc1\x8c\x97\xb2g\xc1F\x12=\xa64y\x12\x9d\x02I\
-AD\xd4q\xdbG\x14\xa82\xd4D\xc9\xd2\x82\x1c9\
-\xa1\x08(h\xe2.\xf5\x05\xa7\xa4\x02WH!\xbe\xfa\
-\x91%\xf7\xe5\xe1X\x81\xf0yR\x91\x22\x82\x14\xd1\xab\
-i'\x18[\x13z\xf3?S\x91\xe2\xfe\x0e\xdci\x93\
-\xcfc)\x84\x87\x87`gb\xc9B\xbdD\xb2\x0a\xc6\
-4\xe45lv.-\xb5I3i\xd1\xc6\xd6m\xa9\
-\xbeI\xac\xca\x06\xd7^}V\xd7BmhAV\x85\
-\xb5\x10 \xce^\xc8\xe3\x03\x95H#\xd0\xca\x85T\x95\
-\xa5\xb4%\xa4\x9e\x82\x00\xe8\xa4\x1e\x8b0\xdd(Y\xd0\
-a\x1cM(\x15\x05\x1as\x97\xb4H\xf2\xcc\xdeP\xa1\
-\xa6fp\xda\x98\xe4\xda\x8a\x08\xadh\xf5\x0e\xbd\x86\xa7\
-C\xcc\xc1x\xeer\x22+\xb9\xb9\x9a*\x82\xde\x94>\
-0\xf4q\x8b\x12\x8eBY-L\xef@\xf6J\xb3\xf6\
-(qw)\x1dH\xf4q\x0e\xad\xea\x12\x12[\xa37\
-\xad\xe6\xcc \xb2\xc8P \xab\x81\xad\x8aT\xb3\x16\x91\
-\x1a\x92]4\x9aY\xa4t\xab\xe1\xaa\xae\x9ah\xcc\xa8\
-\xcb\x180\x5cs\x22\xdc.\x937\xf0\xd2\xb4BC\xd9\
-\xd33\x92\x9a\x8e\xa4Z\x14qf\xf7Fc\x85\x81\xea\
-\xc0\x88\x04Y\xf6\x90\x8d3%GU\xd4\xa4\xbf/f\
-C\xb5f\xfc\x93Z\x8e\xc9*\xd3\x8bm}\x02\x86)\
-\xa4\xbb[-\x8d\xcf\x98\xf0v\xdbk\xddr\xbb\xfe{\
-\xb6\xe3\xb2\xe1\xef\x14\xa5\xda\xb1F<\x9e\xd1\xd2\xa9\x85\
-\xe1\xd0\xb7\xc3^o\xe3\x153\xb1\xe2]\xd7u\x915\
-\x1d\xda\x88B\xc84B\xd2h\xb4N'&=\x9d\xb4\
-\xa2:e\xb7%\x15\x13\x12\x95V?j\xf8\xb2\x93\xa0\
-=J\xd3L\x84ww\xdcf6\x86\x0ac\xec\xa7\xd3\
-\xb7\xbf\x8d\xb9\xd9\xd73\x13\xac\xce^c4\xebn\x1f\
-\x12c\xff\xfb\xb2d\xf2\x0f\xd5\x11y\xbf\x00\xc6Mr\
-\xa4o7\xe0\x18\xc9n\x10\xb9\xe9\x00\x01\x84\xd4\x02\x14\
-\xbc\xa0Ha\x9bY:H\x1aH\x97,\x86\x80\x96\xb0\
-kB\x8c\x12!\xd4\xfb0\x1a\xf5b\x0d\xc8-,\x11\
-H\x8d\x8c\x84\xb00\x84\x9b\xd8\xac\xc4D$\xdf\x84\x15\
-\xe3\xd1\xb0\xa8\xddb\x8a\x02\xd7x\xed\xbd\xdb\xbc4\xa9\
-\xf5\xe7\xce\xbf\xc4\xa8\xc4\xb0\xfa\x97\x98\xa8\xb9g\xacN\
-\x91\xbf\xe3\xba\x1a\x87\xfaZ\x07\xc7kh\xfe\xe1\xce\xf1\
-uf\xa6\xba\xa1\xae\xce\xdf\xb9\x85<N\xd9\x98\xfa\xf5\
-\xe6\x9dA\xf5\x91\x98!\xd2\x15m\x84\xc5Gr-\x95\
-Q\x0c\x93\xb1\xf6\xd8U\x84\x10\xf5dzCl-\x1a\
-RB\x9a<:\x09&\xc2r\xd5\x09\x14{\xa2@\x99\
-\x14mKX\x97\xa4\x9e\xbc]\x0b%L!\x96M\x0a\
-\xba4+a\xb6\xb0\xb3;\x85\xe6\xbeGc<\xd6\xd2\
-D\xd9)\xd3\xec+\xa5\x9a\x81\xb5\xc3\xe9\x93\x8a\x90j\
-\xc8Q0\xf6^\xd1\xa7\xb0T\xcb\xd9$6\xaa\xd3!\
-t\x8f\xae%%Y5\x89Z\xaazpFH'V\
-\xe7\x04\x05Z\xd1\xbaZJ\x22\xb60\xc1\x02K\xaa\x9c\
-\xe2\xc2\x98\x91\x5c\xad\x07\xc7\x9c\x1e\xa5\x953\xdcH\xae\
-\xac\xefI\x80\x8aA\x1f N\x99\xc4+=H\xbc(\
-\x13\xe1dd\xa8S\x10\x0cb\x0dS\x98R\x10Jx\
-\xf3\xed\xb9\x14\x96\x9a\xab\x1b\x13\xb4\xa4L$^\xa9(\
-\xd9\x94\xe8\xb3\xb2\xb5 $\x96\x12\xa0Pq\x0b\x03(\
-\xb7{G4\xa4\xd0tM\x94\xf1H'Xx9V\
-zG'K\x22\x1e\x8b<\x84\xbf:$\x97'\x0f\x15\
-\x88m\x11Qc\xadF\x1f\x85\xa8$\xbf(\x87i&\
-\x81h\x22H\xe5\x8bF\x1d\x8dN\x101\xd1-8\x92\
-X\xb2G\xa8\xc7kut4\xc3\x0aF\x99,\xa4\xbb\
-\x05!\x0e\xbd\x13\xb6\xad\xab5Q\xe9F\xad\xb6\x91Z\
-?M\xa6L\xd8\x7fWe5\xdbMN\xcak\xaa\xda\
-\x0a^K\xc1\x1cT\x9c\x16\x5c\xbc\x17Q\xbf\x12U\x9d\
-+\xd8\xa9i:\x9f\x10\xc6.\x08\xd2VV\x18\x9d\xbc\
-\xe1\xd0s\xba\x87\x07?pFqXJ&+\x04#\
-\x94/\x93\x22\x9b!\xb7\x1b\xb5(JR^\x1bU;\
-\x11\x04]\x8e\xf5\xd0\x9d\xd9\xf2b\x0c\xecQ\xf8\xe8\xe4\
-\xd4#[\xb4\x94&\xf5\x87\xe4\x97\x86\xa4\x1a\x0fB\xb0\
-\x9c\xd0\x1a\x8b\xcdo\x15\x99\x16d\x7f9\x87rM\x83\
-k\x1a\x11\xf9VC,\xcc\xaa\xad\x8e\xf2\x86\x1as}\
-\x8d\x9cG\xb4\xa2V\x93u\xc1\xd8\x8a\xdb\xe2\x07\xf4\xd3\
-\xc4\xc8\xe5\x95\x0a\xff\xfb\xb0d\xf0\x8f\xd5\x91z>\x81\
-)6p\xa9/G\xe1$\xc9\xbe\x11Q\xe1\x00\x03\x0c\
-\xd6\x8a-<\xe0\x001\x999=\xa7I\xc6\x9d\xf0\x89\
-\xc9DAb\xc1\xd2&\x83\x98\xba\x84\x9c\xcd\xc8X\x1b\
-\xbb%\x5c\x95\xad\xf6\x85\xa7\x0d\xcbQ\x02\xe1\x1cI\x88\
-\x87/y\x07iJ\x9a\xfb\x1ez\xc8\xcd\xbe\x0fr\xb4\
-\xc3\x96\xde\xa9\xea\xdbq\x13`\xe9L>w\x18j\x05\
-Lx)\x8b\xfdl~\xa3j\xb3\xb7\x95\x7f\xa8\xdbY\
-kN\x93RQ\xaf(w:\xd8\xaa\x99\xfc\xe6\xd4w\
-=FFl \x84\xc1\xf6\x89\xb0V\xbcxI\xcd\xc6\
-\x84t\x89\xd4\xd5\xe7\xad\xda\x92K\x95\xdfP9\xfe\x84\
-\xe9\xe7+7\xa1<\xb86WT\xf3i`\xaei\xe4\
-JiH\x5cb=&\xc6\xa5X\x0c\xf8\xfa\xd5R\xe8\
-k\xd9f\xd2SN\xb4\xa1\xd9\xcc\xbdh\x92\x91\xb5!\
-Go2h\x0bY\x97\xa6\xa7r2\x13\xfa<\xdd,\
-6\x867\x9f\x1a\x8a\x95O\xb0\x81P\x94V\x9a}\xe1\
-epC\x80\x84\x95\x84h\xe3K\xd3\x14I\x0c\xc4\xeb\
-\xc3\xc5Q\xad\xcf\xbdZh:q\xb0^f0\x11\xc6\
-\x16\xc7(\x9f\xa6\x96\xad.\xb0\xcfk\xaa2)L\xc7\
-\xe6\x13\xd2i\x98D\xe2\xa3[\xd1\x97ET\x09\xd0i\
-\x86Q\xac\x04\x8c*\x17m\x96IL\x0a\xd6\x07e!\
-\xfa\x06~\xce\xa1\x0a,\xad\xfb\x10\xc6\xe9\xf7\xe8\xb4\xaf\
-|\xe5D\xc2\x9d\xe8\xfa\xf6\xca,\x99\xe8\x9f\xa0o\x85\
-\xae\x84g:X>\xdcl\xb2i\xc6jS\xaf\xb7[\
-\x9d\x0a\x93\xb6\xd1\xd1\x89\x9e\x85#\xcf&b\xb8f:\
-\xe7\x06\xce\xa6\xdc\xb6\xeaN\xb6\xe6\xf7%\xd0\xbf\xcc\xb9\
-V2w\xff!\x99\xec\xa1f\x9f%w\xb7A\x22\x0f\
-4\xe5zF\xa4\x85\x0a\x99x\xd4l\xb4\xd7\xf6\x0c\x9b\
-\x7fX@\xf5\xc9VF\x91\xcb\x83\xe2\xc5\xee\xeb\x14M\
-y\x87&O\x11&\xb0T\xeewn\xe6k\x17\xf4\xb3\
-\x8b^\x1e\xdaS1\xb70^D\x9a\x9c\x99\x96\xc8\xb9\
-\x04D\xa4E\x13\x97\xcaYv\x5c\x02\xfcL\x99\xa5\xc9\
-\x0ed248\xe9M) G2:\xe6l\xb5\x9c\
-\x91\x96\x18\x5c:\xd3Pd\x8d\x09\x1c\x1f`\xa0\xf2\x86\
-\xcc\x96\x03\x84\xd6;\x8a#0\xa8\xbdm3\x17\xf3\x00\
-\xa7\xdc=}\xf4\xa7\xad\xbfo\xdd\xde\xe7\x93\xf1\xb6v\
-a\xb3\x8dH\xe5\xb2\xd0\xd6\xad\xad\xfa\xa3v\xb4zO\
-\xb9\x0f=U\x06fT\xb4\xa0\x98\x9d\xd3c8\x92\xd9\
-}J(\x0e\xcfV\xdc\xb59\x86\x9bzy\xc8R\x8f\
-u!\xb1\x95l\x91\xf4\xff\xfb\xb2D\xdf\x0d\xd4\x91y\
-?\x80\xc32\xc2\x8dN\xa8\x00\x18f\x04P\xa9\xd1\x02\
-#\x0c\xdc\xca<<`\x04c\x19\xb9\x95\x16}\x89\xda\
-32\x1a)\x01\xa89\xf8\x0fh\xa4fj\x8a\xf56\
-\xd4N\xdb'\x9e\xc8\x1a\x86\x17\x07vr\xaeP#\xcf\
-\xdb\x9cJ\x8c{A\xf5Ot\x93i&0\xd4v\x97\
-%\x1cSD\xe5$\xe7\x98\xf4e\xf6uZ3\xcaQ\
-\xdd\xdd\xd8\xec\xefQ\x85B\x8e3qx\xcfH\x9b\xe6\
-O\x86\xf5-\x97E\xe1\xa4'\xb2m\x89\xa5P[\xa1\
-z;2\x17\xab\xb6(\x9f\xac\xc9b\xa5\x93\xfd;0\
-Z \x0b\x00\x01\xcfs\x17\x88z\xa4\x0d\x1ab\xd9\x89\
-P\xa3j\xc52$\xee\xcc9th\xc8\x88EK1\
-xr+4:<\xdaF\x0c\x13\x15\x06\x80\xaa\x5c\xf2\
-\xb4\x9c[\xcf\xfd\xeb&\xda>^rvC\xaaYj\
-\xaf\xd6\x8b0YuP&\xb2\xea\xa8A<t%+\
-P\xb5\x16\x86\x18X\xab\x8d_\x94\x96~\xa3\xd4\x0d\xb0\
-74]\x89.\x8a\x94:\x83\xc6B\x83\x02\xc5K\xb9\
-\x22<\xd3\x0d\x0d\x88Q\xb3\xe4\x94@9I\xb6\x14\xef\
-E\x92\x1bZ\x08^\xb9\xcb\xbe_\xdc\xeexd\xc8\x06\
-\xd3t\xf3\x03\x15\x8eB\xb4\xb6\x84\x8d \x917'\xd4\
-Q\xd3\xd3\xa2\xa3fP\xb5\xb9\x00X\x00\x03KGm\
-\xb7%]<8\xe4\x0d\x92\xaeL\xe5\xd2/lf\x90\
--\x012\x81\x03ka+\xdaB\xc0,<\x1c%B\
-*%F\xce\x94]y\xd6\xbc\xf7M\x8d\xdb8f\xa7\
-\x06K\xb5\x14\xe5\xb9\x05\xa3\x91=\x0a\xd5\x13\xa9\xbdv\
-\xff:\x91-3%\x12\x8c\xa1\x89C}2\x88\xfc\x9d\
-\xa9I\x86\x13V\x0d\xc2b\xd6aMeYu!\xce\
-*\xf4\xf9=\x990.\xb0,%\xce6\xe6\xad#\xad\
-\xcfEmS\x0b7\x08\xe8\x19\xd7\x05\xbe\xe2\xca\xc9\xde\
-\xd1\xdc\x99\x12\x00\x89P\xa3\x9e\xaf\x17nQ\x16D>\
-\xdaI\xc5\xe0hL,-?jFl\xd1\xc7v.\
-\xa9\xbe\x9bO\xa9=\x9d\xd2>\x14t\xbd\x95paV\
-|hy\xb04\xac\xcfQ\x14\xc7N\xdc\xd9\xef\xa7\x1c\
-n\xa6\xac\x83\xf3\xc7Y\xbb\xbe\xe5\xcd\x8f\x13\xaf\xaa\x93\
-I\x15s\xfc\x93\x7f\xda\x1c6<1M\x0f\x99W\xd7\
-\xb6L\xd4\xb7\x15\xf09OF\xaf0\xd4\xc2\x93\x82\xb0\
-k\x11\x7fvw\x99./KeEO\x8a\xea,\x93\
-\xe3\xcaz\xd9\xb4b\x04\x18\x85\xd5\x16\xb89E)\x93\
-\x8f?\xd2\xe0\xdb8;5\xec5j\xc7Y\xf1lE\
-\xc3%\x0ap\x99?h\x15\x95d\xff\xfb\xb2d\xec\x85\
-U=z?0\xc95p\xa1n\x97\xf6\x19&\xbcQ\
--\xe9\x00#\x18y\xc2*<`\x00c\x0f1\x13\x82\
-\xb5f\x5c{\xd7\x92\xac\xc3\xd0\xc3X\xbb\xf2\x99\xa1\xdb\
-~!'_\xc3*\xb1\xa9\x07\x7fq\x1c\xe3)W\x17\
-\xa8\xf7k=\xc1\x89\xd4\x09\xd93z\xc8\x02\xbby\x12\
-U^j)vvBk7\xf3\x8c1\xca\xcelk\
-\xe11+w\xcf\x8b\xacG\xa5>\x12\xd54'\x96\xf2\
-\xeb\xd3\x22\xba\x1550t\xad\xcf4\x04BpFk\
-\x85\xc7Tb|IY\xd0N\x12\xd9F\xa6;\xb8a\
-\x02\xa9\xe3\xa0\x9d\xc3S\x91\x18\xa4\x02\x0dC\xd1H\x19\
-\xc4\xb5\x19\x00\x00\xecU\xad\x12\x8f0n\x87#\x86\x1d\
-\xaa\xb6}VT\xc4\xb3L:>\xb3\xf2\x88@\xb3\x89\
-\x11\x0eL$\xc3J\x83\xe7\xa5&\xec^\xab)\x06\x19\
-\xc3V3\x92@\xc0\xb2\x18\xcc\xd6\xd1&f\x8c\x1e\xa4\
-)\x02\xa6\xa1]\xc9\xa2\xa1\x9cU+\xa1\x00\x9d\xb4\x8d\
-P\x81D\xb1\xe0e\xf5!\xa9y\xb2\x08\xe5p\xa4\x18\
-\xd8\xa20\x8d\x94 \x10\xa5!\x94\x1f\x93>\x08\xb5\x04\
-\xaeQ\xef3{\xb4\x1c\x96\x11\xb1\x9300\x03\x8e\x14\
-\xf2\x1a3\xa9| D\x00@\x01\x01b\x931\x99\x05\
-Z=\x84\x92\x1a\xa6\xc8v\x15iI\xaa\xa8&&\xec\
-9\x12x6\x8fUj\xac\x8a\xc9^)\x09&\x88\x98\
-4\xeb\x19\x8c\xde\xbd8\x16\xdd$\x8a\x8ess5\x93\
-:Q\xf3(s{C\x9d\x22\x88\xda\xe1\x8b\x04\xfc\xab\
-\x96M)\xb1\xb1\x94\x94\x82\x91\x9d,A\xc7$wr\
-\xca\xa9\x82#2 \x87C\x86\x8e\xa4\x1357GR\
-\x0c\x87\x99\xf1(\x9a\xd2\x82\xaf\xd6\xcd\x80|3\xb4\xc2\
-P}\x1e\xe4\xf23\xba.F\xcdM\x9d3\x09d;\
-\xc68\xe4\x8c\xa3\xee\x01\xef\x92P\xf0d\x8f\xa0H\xd9\
-\x02\xa3\xa5\xcab\x90F\xa8!\x84\xd7B\xee\xbb9\x86\
-\x15iF\x11'`d\xa9\xc9\xf2I\xc2\x08oEi\
-\x127\x03\x9dh\x224\x81\xbbj\xa4(\x89\xe7\x1a\xda\
-\x86t\x03.:8\x99!\xcc\x96\xb2\x19O\x0d\x19\x81\
-\xc4\xa2\xb3K\xc1g\x81\xcd^\x1da\xd6!\x8d\xf6\x99\
-\x09?\xc4\xdee\xa1\x0c\x15(\xca\xf4\xf1\xd1\xa2\xfa(\
-\x18\xf2P1\xc5rrF\x0b\x9c0\xb0\x968\xb9\x1d\
-h1\xb5=7\xe1\xae\xcd(\xc6\x12k\xd9\xd2PH\
-D\x86M\x03\xcbF\xae\xc9\xa8\xf8\xf0\xadl\x03\xc3\xcd\
-$<\xc1\xc6A\x14\xc8\x95\xf5t\x10`Qq\xa8\x91\
-\x84P\x1a\xfbT~+f\x81\x10\x09<m\xff\xfb\xb2\
-D\xe5\x8dT'z@\x90f\x1bpx\x0d\xd8(\x0c\
-\xc3\xc0S\xe1\xe8\xfc#$\xd8\x02\xbb\xbc\xdf@c%\
-\xf9\x9a(\x14\x82\x14\x99\x8cq\xd8\xac\xd2D\xc31\x1b\
-%\xd2B\xb0\x0fSk\x90I\x94q\x9aL\x92\xc3$\
-\xc1\xe4\xe7\xee6\xac\x8b\xd4\xc8-F\x0ei\xdb\xd8c\
-\x96\x83k\xc9\xf1$Y\xec\x1b*\x9b2;J\xac\x8c\
-\x80@\xdc\x910\xc6L\xb3\x9aM\x1b\x07\xf0\xbb\xb7W\
-4Uv$\xb9\xf3\x04(\x91\xc5\x99\xb6\xd0\xa2\x99\xf4\
-\x91\x0f\xb4o,\x98e\x96\x15E7\x13\x15_\xa5\xc4\
-\x13\xe8K\xac\xa1\xe3\xe7\x95tu\xd58 c\x0a\xb0\
-%\x09\x00\x02\xb0\x12\xc0\xe1J\x0eO\x0e\x00\xaa\x87\x88\
-;];\xb5\x91\xb9\xb7b\xa8[\x8ef\xaa\xcf,l\
-JLD\xaaI\x1bb\xd6\x0c\x04\x81\xe8\x0bD\xf1\xa9\
-\xdcAPd\x96e\x81\xb6\x91J\x927\x94\xe6\x1a$\
-N\x9b\x09s\xd0u\xd3\xf9\xabI\x0c\xaf\x8b\xb78\x1c\
-\xca\xdce\xcc\xfcd\xcdU\xbf\x0a\x8c\xe8#)r\xf7\
-m\xa0\xa5A3\x18\xfd8\xd5\x1az\xcf\xee\x91K)\
-D\xf7nfZ\xec\xe4\xf0\x08\xb0\xb5\x96\x85\x13\xb6\xfa\
-\xcc\xd7GN\xddi6\x93X\xb8\xae\xd18\x07RL\
-\xc7\xc3\xe5x\xa9\x92@1\xc5H\x0a\xdedz\xdc5\
-\x04/)\x14\xf6\xb9zN;\x01R\xb7 \xe3e\x0b\
-xzJ\x09\x12#d\x19\x0c\xd6Fb\xa4\xd3\xbc\xfb\
-\xc4\xbe\x06sX\xb3\x11\xd2\x09'\x96\xca5u\xa7\xc5\
-\x0bi\xc9\x1a\x0f\xa83g\x19W\xee\xa9@\xaa\x91\xee\
-^k\xc2/j\x10m\x88\xaf4\x91F\xb6t\x8e\xfa\
-\xed\xd3>\x11\x9a\xa3\x1d\x0e\xc74\xfc)6\xb2\xd3#\
-\xa24q7{\xaaY\xea\xda\x98!\x91\xae\xadm\xd3\
-3\xed-\x22\xb3\xa8\xf8C\xa1\xa1\xa1-Y#\xbc\xbf\
-z\x92U>\xbf.\xa59b\x1d\xe6R\xcbIu\x9b\
-\x1b`\xf73wgwrF\x5c\x1f\x1b\x1c\xb7\xc6*\
-t\xdd\xc51\x84i\xb6\xb6\xa2\x8aQ\x91\xd0vQ4\
-\x91\xbdT\x11\xfe\xd0\xd8\xbd\xaaH\xc9\x8c\x9dF\xa5.\
-2\xb20Gx\xa5Wn\xb1\xf7&V\xc8~\xa1\x15\
-B\xa8=\x04Y\x04\x8dQ\x03F|\x99\x05*\xd0\xcf\
-c\x99-\x19\x12\x94\x08\xe8\x85\x9b\x07\x15L\xe0Fy\
-kG\xad\xc3s\x07\x9ad7\xf7\xf2\x1c\xa7\x05\x18\x03\
- n\x89'\x8eAA\xe2\xa2B\xc3a\x0c\x073\x04\
-\xeb\x22Rf\xd5C\xb6\x94u\xd1\xbd\xcaz\xf0\xd7\xa5\
-\x0ct\x9e\x89\xb5`\xa2\x94\x8f[\x93\xc8\x91\x08\xe08\
-\xff\xfb\xb2d\xe7\x8d\xd4\xc2u?\x90i4\xb2\x95\xef\
-7\xf1\x19&\xf6O\xa1\xcf\x02#\x0c~\x0a\x05\xb9`\
-H4\x8d\xe9N\x11\x12\x03C=\x12\xd1\x82\xc0\x02(\
-g\x86\x19@P\x15\xe0\x86\xc5\xb2\xb2\x89<\x84\xdc\xec\
-\xf1\xc4\xa9\x22R\xaba\xb0!\x1b\x90\xd1S4\xc2\x0e\
-a\xf2\xa3\xa9\x9eQ\xbb\x8dP+\xc1h\xbd\xb6\x1b%\
-\x0cb\xc4\x8e\x95z9\x91\x0b\xb4\xc9\xed+OmQ\
-\x91\xa5\x5c\xc5\xac[e\x0a\x12\xab\x0b\xa3O\xa3HH\
-!\x95\x1a\x00\x0c<\xd7\x12P\xe2QI\x1e\x94Nl\
-4\x1f\x06b\xaf\xcb\xdc\xfa))=\x94@\xa8\xaf`\
-\xf5\x0d\x91\x22#[\x8c\x1cX\xb7\x13\x0a&\x88\xcb-\
-*N}{~\xde\xb30\xc4\x8e\x956E\xa2\xc9\xcd\
-3Q\x04u\x8f\x9b=\x04\x0c\x0f\xc3\xd5a\xf4A\xb5\
-:\x18x\x99M\x04\x12+OB(\xc2\x9e?8\x81\
-\x92Q:\xc0[\xb2\xd9n$\xa8H\xd3OH\xd6\x10\
-\x9a\x8f\x82\xa2\xe1I\xf3\x0f*l\x10\xeaxL\xddM\
-\x08H28\xd2A),\xa2\x07\xe9tS\xf1\x87&\
-}\xecn\xe5@\xcd\x9c\xab\xa5\xa2R['\x17\x86i\
-\x85-\xb5\x0cP\x5c\xb1 \x00\xe2\x96/\x14\x16\x02\xf1\
-%c\xf2\xac\xdf\xd8\xb9\xcc\xc9)\xbd\x10\xda\x06O \
-\x07\xc4\x90.0\x17\x0b\x9e:\x84\xc1\x04X\xdeFh\
-x\xa9\xb5\x9bdW\xb3\xbbbS\xea\xa9\x90C\x04\x11\
-\x8d\x92GWI\x94\xd4&\xa4h\x17\x93}\x0bJ\x10\
-O\xbfo\x9fi\x5c\xafb\xe6\xaf\xd6\xd2\x19\xce\x93\x08\
-\x11\xd2C\x04k\x0f\xd5\xa5\x22\x5c\xeb\xbd\xf8\xf6\x9fy\
-FJ:\x9f\x1dD\xa2\xf7z%I\x8b\x05Y\xca\xb1\
-K\xbe\xa3]\xf7\xcc\xa1\xa5q\x90\x81\x15\x9a{\xd8R\
- \x5c\xf2\x8f\xa3\xafQbE\x1c\x8aXqNl\x86\
-t\xa1e\xd9\xe8\x0a8x\x81Qq\x11\xa4I\x07\x86\
-\x05\xdf\xaa1R4\x89e\xb1\xa4\x88sQ\x22'\x85\
-\xddj\xb0z\x90\xdd\x8e&\xd1\x9b\xa8IW\xebG\xce\
-\xb8\x99&qi\xc6n:\x94\x12n\xe9\xb6,\x95\xeb\
-\xcbd\xbb\x13B\xb0\xce?\x0e\x98\xb2\xc5/\xb2\xabP\
-\x88\xa8\xd6JB\x1d\xec\xa1e\x9c\xb9\xcc\xf6\xcd\xd6u\
-\x03g\xa6\x99\x059\x86a\xa4D\x9fKA\x90\x1b\xd5\
-\x0fZ\x09\xa5\x93\xeb\xfc\xa3\xe8\xc4\x18\xe3F3\xcaH\
-E\x81D\xd0 V:\x05'\xc9\xa0\xd5\x08 `\xf3\
-\xd79\xc3\xc0\x9f\x0e\x93\x99\x14o\xec\xdc\xb3\x22D\xd3\
-\xdc\xf5\x17H \xd5\x92H\xaaZ:GJ.n\xe9\
-\xfb\x01\xac\xff\xfb\xb2d\xf8\x8d\x05\x04y?\x90\xc95\
-\xa2\x87N(:\x0d#\x9cT\xfd\xe6\xfc#$\xd9\x8a\
-\x82\xbc\xdf\x80c'9\xfa\xd0l\xe89w$\xcbR\
-\x16,{\xe9\xfb\xb7\x80\x82W<\x9aA)\x98(0\
-\x11\x87U\xde\x04\x12I?\x92yT\x80\xb9\x1b_R\
-/\x1c>\x1e\x89{\xc3,\xca1\xf0\xf6\xe7\xda7\x8a\
-B\xe8\xb1!4\x95\xc8\x80\xa4b\xb4V+a\x10:\
-4\xa0B\xcf\x08#\xbe\x9bQ\x83l0\xb2D\xd2I\
-\xc3\xe0\x84\xa4\x82\xde\xcdR\xc4b#p\xbd''1\
-g!j)\xd2jOj\xf2d\xd9\xe15\xd7\x12\x5c\
-K\xd1T\x93A%\x15\x02\x15\xe8\x004ai\x83c\
-b\x1f\x88\xf8\x86\xd2\x83 \x83\xed]\x17.P\x8d\xb4\
-O\x9aUB\x08\xc0\xf1\x84\xf4R\x22\x13\xa6xt\x81\
-\x0be\x09@\xa3\xe7V\x10\xbaQa\x83\xcc:\x16\x82\
-\xfdm$j=0\x8a\xc4jxP\x8aLu\x14S\
-\xa9\xe6\x01\x1a\x0a\x0e\x8e\xa5B\x14\xd4q\x0e\xb6\x06\x18\
-\x1b\x90qJ\xf1\x89\xc9\x98Gt\x81\xb8M\x02k\x04\
-(\xd1D^;f\xd1\x8aU\xaf\x88\xaad\xac`\x8b\
-`fB\xc2j\x99\xb8q\x9eoT\xe9\x0e\xe3\x114\
-\x0e\xcd\x01\x8bf\x07\xc1ju\xbb<\xe7z,\xbf\x92\
-ZE\x95nz\xa2\x88\x98\xb8l\x84#\xb9\x85\xd4\xfc\
-\xca\xdc\xb6~\x1e\xae\x9a\x16\xfa\xd2jh\xf5\x088M\
-\x142\x96\x08\x11\x8fI\xaa\x86\xb9\xaa\xb8\xc8\xad\xb3\xd9\
-\x5c2\xe3\xc7\x19til\xd3E\x1b\xd4\xe9\x11\xf6\xdb\
-\xbb\x931\xaa9&\xadx\xc8E\xcd6M\xd28\xe9\
-\x5c\xbfl\xd7\xf7\xbaIr\x89\x0c\xd9\xab\xd9\xba\xcc5\
-\xe9>\xef(,\xd0G\xc7w\xd9?\xde\xdc|L\xd7\
-e\xc5GQ]xIS\xa8\xcbe\xa0\xdc\xdc\xdc\x9c\
-\xfa\xe1\x8a\xe4\xcf\x84!\xe6\xdf;\xbb\x9d\xbagL\xae\
-\xa84\xa1\xe1\x99\xae$,\x8dD\xcd\x12\x15P6H\
-\x18hC%\x11\xa0fkC\x8c\x13\xb7\x0b<\x82\xd3\
-\x86\x1f\xceQ61\x8b\xd6\xc3k\x0c\xd5\xe9\xb8V~\
-\x91\xa8\x97\xf5l\xdb\xb9\xe9\xed[\xbaN\xe9\x1d1&\
-\x97\x96\xd9\xa7\x15t\xbe\x82\x15Xj\x9e\xb2\x8e~u\
-#[3\xe4\xfa\xac\xc6\xe6\xc9\x7f\xc9f\xc1\xe5\x9b\xb1\
-\xcd\x7f\x0fs\x01\xa5\xfa\xb6\x12\x866\x5c\xb2\x8e7.\
-? v\xc1\xb8\xd38\xbb:S\xc3T\xedyPY\
-T\x81\x0c\x0d0\x16\x92\x92GML\x8a\xef\xd5]\x8d\
-X\xfb\xf8\xdd\x0d\xcd\xa4W\x0eZv\xae\x9eq!\x1e\
-\xc4Fl\xf20\x14\xff\xfb\xb2d\xe7\x89\x94yu@\
-\xb0i\x1d@\x85\xcf(\x00\x18f\xe4\x12\xb5\xe7\x00C\
-$\xd6\x82e\xbc_\xd8d\x9a\xc9\xc8\xa8d\xb8,\xcc\
-7\x0c\x1a\xb2\xc7ZO<\xab^\x12\xd7\xd2\xbe\xd1\xc6\
-1\x12\x1a$\x96)\xd7E\xb1x\xffa\xc0\x98\xa75\
-\x02\x9e\xdbq\x06\xc2\xff%\xed):\xa7\x0b\xd2\xe1\x86\
-\xf9&\xaa)\x8c\xb9\xb6\xaa\xeaN=9@\xc9\xe1h\
-d\x1aT\xd2\xd2s.L\xf7Pc\xf2\xe9v\xb4q\
-Gj\x1c\xe2\x8eEE\xe2Tn\xa4y\x92N9\xda\
-\x8d+\x09\x1cn\xe3\xd7U\xa9\xd3M5\xf0\xbc&\x09\
-\x00\x06RY\x92,\x8bbK\xcao\xa6,\xca\xcd$\
-\xd1\x17EB\x99\x8c\x8a\xab\x82\xb1\xfe,l\x8d\x03)\
- \x1e`\x1a]\xb1\xa7Y\x84\x0e\x89g\x1d\x9ff\xe0\
-\xcd,\xd8cr\x18\x8d\xf3/4\xfcU\x08U\xdc5\
-\x1fj\xf4tDgA?g\x15\x91#~\x11\x04E\
-gC\xddFs\x1e}\xec\xa2\xdd\xec\xca_\xa2M\xa6\
-\x94\x9aN\x965}P&K'&\xbb\x15\xcb\xfeh\
-M\xb3!\x89\xea\x8dT\x1b\x7f7n\x1e\xe3\x0b1\xb6\
-\x1a\xb2je\x9a~2\x96\xd2\xbb:x\xd1\xb2\x18\x01\
-@\x0dG(\xf2\xe6\xe8\xda\xacA\x88\xa3.\xd8\x9e\xce\
-bQD\xa5\xb6Y9N\x88\xdc\xfc\xb2i\xcf\x0b\x17\
-\x9b$\xcec\x8eL\xe2g\xef\xd4\xf6X\xa2\x09t0\
-\xc6eJ\xef\xc5\xac\x11\x93\xa8=\xf7J\xc8\x924\xcd\
-o\x19\xd3>\xd6j\xd9&\xccg?'\x97\x08\xc3\x15\
-\x08x\xb4q%\xdfBL{l9#\x0e\x01\x13\x15\
-\x93\x04\x14\xd6\xff`\xe9\x86\xd4\x0b\xb2\xb7h\xa2\xe5\xae\
-\x96U\xd9\xe6E\xbd$`\x9c:\xba~\x8d\xd2\xe5)\
-L1\x86\x94%j\x92d\x94\xe7.\xca\x8f'\xc2P\
-Vy!\x1e\x0eZU\x1e\xb2OQ\xd2\xdbX\xf2\xb3\
-\x0cp7'\xacyP\x18\xeb\x03A/\xc36\x1c\xb7\
-\x93C\xc0\x19\xa0\xe4\x12\x9ez\x98\xb5\xe9\x03\xee\x12\xd8\
-N\xb5\x0a#r\x95\xba{H/\x0bc\x9f\x92\xe7\xe0\
-\xe8\xf2\x9d\x9cvpd\xcdf\x18\x14s\xd5,\xdc \
-A\xdf\x086\x8d\x98\xbe\xb2\x1bb\xb4\xdcX\x0a\xebp\
-BZ\x15\xa9\xe9\xff\x9f\xcf'\xee\x8a:\x99\x14\x93\x1a\
-\x12\xb4F\x13m6\x8e\xe5d^\xb8\x8c&z\xdf\xb6\
-:U\x18iK!\x96]\x90<\xc5c\xadR\x80\xe4\
-\x0d\xa3\xbbY*Gu\xb9\xe7bK\x06\x18\x89Bl\
-\xdc8\x0e\xb4\xb4\xdc\x14\xbc\xb4\xe8M\x14\xfae\xd39\
-\xe7c,\xf6\xaa\xb6\x96H\xc6\xff\xfb\xb2D\xed\x0d\xf4\
-yw?\x90\xc96\x02\x95OG\xf1\x0d&\x10\x131\
-\xe0\xfe#\x08\xc2\x0af<\xdf\xc0d\x9a\x99\xe5(\xd2\
-\xf6\xaa\x03\x9dC\xae#@\x81\x95\x84u%\xb5\x00t\
-\xab\x07u!Iz*\x5c\xe2\xa4F\xb2\x9c\xa39d\
-\xe8\x91\xd7m\xcc\x06V#S\x0a\xef.`\x9a\xa4\x0f\
-\xc9Wp2\xfbR-\x98\x07\xc9\xc13\xfe\xfdE\xac\
-\xfa\xd6W<\x89va*\x9a5\xaa\xff6\x1cK>\
-\xa2%GY3\xe9\xd3d\xf5\x1c\xa1f\xbdMG\xe7\
-\xe37\xa9G\xa4M\xec\x0a\x06@\x92\xcaAm3N\
-T\x81J\xd1\x04\x8d,\xf2\x0b\xa2u\x18\x00\x0c\x9d>\
-f\xab%)T\x19\xb8\xd3WrT\x96\xd3\xbd\x1at\
-\xd2A3Q8`\xc7\xa2\xd2\x14\x88\x11\x9b0\xc2\x8b\
-1\x90\xb2\xa0\xce\x9f\xcd1\x22\x8c3\x5c\xbd{6\x09\
-?\xe5 u\xbb\xce\xa4\xc8\xc6\xa2\xef\xebd9h\xdf\
-\xd3\xa7\xef(\x94\xdb\xc1\x14\xe8\xc9H\xfdu\xe1\xb5\x0c\
-\xda\xc6\xa6\xffm\xeaMFU\x94\xe5Z\xb4\xe2\xab\x9a\
-\xab\xf2}\x9f\xe7\xc9\xdf\xa5\xe1\xd5\xa9~\x8d\x9d\x86V\
->%\x9by\xb9\x9b,L\x8e&Z\xd5^\x99\xc9\xe5\
-\xd3\xdam\xd5w\xdbm\x17,\xe4p\xe5\xb1U\x90g\
-\x17\x13*(\xd6\xcd7\x12\xc4^\xd0r\x10q\x0ed\
-.\xe2\x97jl\x83\x0d\xc9\xb4\xd0\x22\xb8\xb4\x11\xff\xce\
-\xe9t\xc9\xbe)\xe5\xb0\xc4U&\xb7p$u\xc7\x1c\
-\xdc\xc1'&\x1d\x03\xac\xdf\x17\xd4D\x96\xd2\x05\xa7i\
-\xa3\x9f4\x83M\x11&\x91\xec\x94\x07\x13\xd034\xa3\
-Y\x8c\x06\x9b\xc4H\xae\xdfPr\x8c\x9dAG9+\
-vo\xdc\xfbY\x98\xa4\x5c\x93h;\xd4D\xf4\xec\xd4\
-\xdd\xf0\x11\x0co\xa6\xc9\x9b\xda\x11\xd2\x16\x22\x97o\x01\
-OZ\x7f\x034 &r\xe4\x09\xcc\x19g14N\
-\x03p\x83\x0d\xa4N!+@\xa4\x07\x17\x80\xbd\x1bs\
-\xb0W=?\x84\xa9G\xe5n;\x95\x07\xa6'QJ\
-\xa0\x8f#\xa7]\xd8\xe2\x0cYdIs\xc9\xd3\xfb\xa2\
-p\x9f\xd4!i\xf2lzS\x5c\xb5AE.\xfe\x14\
-y$r]h1X\xb41\xed1\xd4\x9a\x19\xb4\xc5\
-\xa6\xee\x92\xf0\x19\xfe\xca\xd2fNl\x89\xc7A\xcb\xaf\
-p\xe4 \xf8>\xbc\x1cy\xce\xb6\x02\xd3\xce>!F\
-\xdd&\x84s\xb5\x18i)\xe1sd\xad(\x11\x80\x86\
-\x06ui\xf8\x94\x1eUoxo\xac\x06\xc6Jo\xcd\
-j\xdc>\x87\x9a5\x8b[\x81R\xd4`\xd64\xd8\x93\
-%\xb7W\x851/\xb4~\xdb\x22\xcds\xff\xfb\xb2d\
-\xe8\x8d\xd4\x8fy@\x10\xc96\x02\x94/\x07\xf0\x0cf\
-\x22R\xd5\xe8\xfe\x03\x0c\xcaB&\xbd \x04\x11\x98 \
-oVy\xd3\x10TB\xf7\x17hL\xa6\xc5\xb9\x85\x93\
-;\xcc\x22\xc6\x1d\x168\xc6*\xde\xcbN\xa4\xfd_Q\
-G\xf9.\xdd\x9f\xcdB\x11\x88c<\xb5'4\xf7\xb4\
-R\xc7\xa3h\xa2\xd3\x1b\x05\xcc6n\xe1~TR\x0c\
-r\x1e\x11\x9c}\xfaJw1\xbbi\xb9\xefrmt\
-\xefZ\x8e\xe7{\xc8\xd6\xf9\xdal\xebH\xd9&}?\
-\xb4\x8d\xd4\xfdM\xa5\xf3\xee\xb3jw\x0d\xcdD\x8fi\
-!\xa6q.B\x15\x08\x0f\x06&]\x9c\xe0W/\x05\
-\x9aA\x9e[2i\x04\x18P\x8bQ\xd6\x90-D\x9e\
-Ah`\xa1a\xe2\xd29!stV\xba\x04\xd2\xa3\
-\x92\x0bIAhZ\x89 \x91\xe7Z\xa8\xd5\xe1]\xba\
-\x93w#\x1d\xf4@1E\x9c\xed$\xd7\xf8\xfc,\xa4\
-\x18\xc4t\xea\x98\x10\xac\xda\xf1R\x91\xc6\xad#i\x96\
-\x89\xe5\x1er\x88\xdc\xdc+\xbe\xe1\xe6\xf7\xb3$\xa9\xe9\
-\x94P\xfb\x9d\xda/Q\x93j\xccC\x07f\x11 {\
-\xad[\x07a\x88\x104F\xae75\xf3vh\x96\xac\
-\x02UA\x06\xa4\xcbY(\xd4MI\xac\xd8t\x8ae\
-&0\xf2\xf3L!\xd7\xc2g\xbd\xb9\x136\xcf<\xad\
-H\x99H\x9e@eaE\xae\xcd aE&\x81v\
-\x1a\x1d\x87k\x19\x80\xd2\x81o\xd20\xe4\xb5\xda\xf7\x02\
-\xf0\xca\xcfc\xe5&<\xfd\xc4g0\x89h\xf8\xd4K\
-\x1f0\x99\x8e\xed\xb2\x9d\xac\x18\x7f\xc7\x84\x15N\x81k\
-?\x94AEK\xb8\x22\xcbu\xb6\x99I$}\x96^\
-\xba$\xd1*\xec\x08\xaaz6`\x0a\x88.\xf3\xebi\
-\xf0\xab\xd7\xe4\x0e\x86\x10a\x06\x88Ii\x95W0Z\
-D\xec\xab]-\xc8\xa5\x08\x9f\x95\x10\xcf\xe5\x92r\x17\
-C\x12)\xba\xd2:Hb\xc9\xe4=*\xb5\xf2\x0a'\
-:S\x05k \x1c\xd3\xde\x93\xa6\x07b)\x16V\xbf\
-\x85<\x13M\x1a2N\xcd\x09\xb2\xed9\xe6\x07\x19\xaf\
-\x8brv\x9a\xce\x90\xa6CE\x15\xa2p\xd9 \xeal\
-p:\xa4\xca\xf0\x05Qo\x87;\xa3\xd4H\xf4\xea5\
-(\x87Z\x1d\xa4\x81g\xf4\x9f\x0b\xe6=l3\xa39\
-\xab\x87\x93\x1a\xea\x13\xb9\xd29\x8a\x17\x84\x13c3\xae\
-Q\x08H\xb5\xcd\xdb[\x16v;\xf5\x8b\x1f(.\xc7\
-\xfd=\x13\xb5\xb2\x89\xce\xd7\xedg\xb4\x17t{\x14u\
-\x9f\xe6\x95\xbaQd\xb0\xd9\xf2~[\x9dq-\xa8\xf2\
-\x8a\xc6Yz\x8d\x94\xc5S\xda\xac\xad\x86I\xe5\x05\xff\
-\xfb\xb2D\xec\x85\xd4\xdey?\xa8\xc34\x92\x98\xcf7\
-\xf0\x18f\xc0RE\xe4\xfe\x03\x0c\xde\x02L\xbd\x1f\xc4\
-a\x9b\x80\x95\xd8\xbd#\x1e\xf8\x83\x0b\xa3@/\x0a{\
-4K\x93\x92\xd7D\xe8\xdf\x8b+\x19\xc2 \x03\xd9\xc2\
-\x06>\x8c\xf4\xe9\x92>\x0f\x1a\xd3\xa8\xb6\xf3\xe9\x88%\
-uz\x96/Wdy\x8aON\xc6M\x18\x13\xf3`\
-\x81F\xf4i\xbd\xe2\xec\x97L\xb44lj*Y\x1b\
-\x8f\x89\x9aq\x03\xd2\xe7\x9a\x91\xd9v\x99\x856\xc9\xb9\
-PA\x19\xb5\xdb\xaf\xc6r\x17bj\x84\xce\xb3i\xf8\
-\xa7t\xe7\xc5\xae\x0f\xd6\x9b4\x9c\xd5\x1e\x99i\x11\xe8\
-\xfa^suR3\xa4\x09h\x12Pu\xb2n\x9e\xec\
-l\x9ck\xb4\x1e\xc6\xb12l\xa9\xd6\x85k\x0c\xd5\x90\
-\xc7j\xa3\xa5\xb1\xe2\x9e\x88\xe2X\xe7\x99\x17n\xcd\x5c\
-\xe3\xb6\x0c\x8b8\x9e98>\xd2\x99\x861\xfc${\
-\x11,\xca\xd35\x0c\xc0\xeb\xfb\x96\xd7'\x10\x94\xd6a\
-\xb3g\x1f)\xe4\xdb\xad-\xae\x99Y&\xe6\x22\x89\x0b\
-{\x12\x8b\xcd\x1f\xa6}\xd4\xac\x83%\xda\x10\x5c\x94v\
-\xa4\x13\xbd\xe0\xf4\x18\x8b\xed\x89J\xcf\x0e\xb4\xaad\xb9\
-=\xcc\xa3K%\x9a\x8e5\xd9'\xab\x97I\xd9\x7f \
-\xcb|\xb3\x12-\xd7\x1c\x92\xb1\x0a\x0dY!\x80\xd0\xb6\
-h[ \xcdN\x0e\xe4\x8aT\xf8&\xc5\x1d.bW\
-\x06%\xea\xad\xf7)\x04\x94\x92\xe8\xaf\xde\xec\xd3\x97\xd2\
-8\xcaH\xa4\x1c\x159\xc9r\x09\xa3\x08\xd6c\x16\xfb\
-,\x0b\xb4SE\xc3\x0e\xca6\x0a\x99\x7f\xb1\x04\x05\xd1\
-\x07\xa3\x17\x5c\x94\x9c\x81<\x9a\xe7\xd3\x88\xc9\x98\xb2\x12\
-|\xe3d\x9b]:*\x0c(\x1fYQIg\xb3\x95\
-\x00\xac\xb6v\xb2\xd3\x92[\x8e)$\x99\xbc6\xe0\xe2\
-i$D\xdc@\xc9L\xf4\x13\xb4\x11LKY\xaf3\
-.\xe7\x96\xb3\x0f*\xcb\xf2\x8b\x90\x88<k\x95xq\
-\xe0hh\x93\xaf\x5c\xe3\x93U\xca4\xf9ZF-\x1c\
-\x22\xdai\xa3\x5c\xc4\xb1\xe7\x83i\xc5\xa2\xe8$l\xe3\
-$)[\x9e\xaa\xf1\xfd\x14|\x16\xcc\x93\xf6$\x5cY\
-\x87\xe9\xc9K\x95V\xac.<\xd4\xff\x9e\xb5\x93A4\
-X\xd2\xae\x124\xc4\xf4\x19+F|&J\xe5\x1a\xcd\
-\x97r\x92e\xa3V\xac\xd6\x0a5\xb9jo\xaaH\xa0\
-\xeaH\x92\xce[Q\xe1%\x80\x96\xdb\x89#Dm\x1a\
-\x96\xa9\xd1\xa1)a\xea\xa2W4\xceV\xd8M|j\
-yk#T\x01\xa4I5\xe7ce\x19\xa7%B\x83\
-<Q+Gr\xa7\x1c\xe08\xabD\xd4\x17\x09\x12\xaf\
-\x16\x1c\xff\xfb\xb2D\xe7\x0f\xb4\x90y\xbf\x80\xc25\x82\
-\x94\x8fG\xf0\x0c&`\x12\x99\xe6\xfc\x03\x04\xca\x0a;\
-\xbd\x1f\x94a\x9aP\x8c\xd5X3\x91\xafB\xadD\xb9\
-f\x1f\x1a\xe8\x9d\xce\xb4n1\xb5T\xcd\xb2q$\x8d\
-\x92\x96D\x15\xeb\x12E\xe0\xed\xf5\x1at\xd5\x1bE\xa0\
-\x93[N\xd9\x195D\xbbZh%\xdf\x91\x22V>\
-2YO\x8d\xe8\xe5\xf2/\x05Y\xc6\x9a\x132r\x8b\
-U\xcb%\xec\x91\xbc\x8bO\xf3\xcb\xc3e\xaeJ\x8d\xa6\
-\xde\x8b\xc6f\xe3\xcf\x9a\xdc\xfaFA\xb7\xe03\x9eA\
-2\xb7h\x96\xc9\xc9\xe3T\xf6\xaeJg\xecYG\x9d\
-\x8ef*LAME3.100\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\xaa\
-\xaa\xaa\x06=\x05\xa2\x91\xa7\x09\x03 \xb4N.6_\
-6Z\xf1#K\x8d\x92\xa2>\xc2F\x9d\xa1\x19\x0dN\
-\x9e5\x1a4\xa8\xd9\xa7\xcd\x9a\xa2\xcc\xb5\x12\x22qv\
-\x89\x22\xd4\x94\xb6\xeb\xb6\xcbj$\x8e>77*^\
--I\x1b\x0b\x99k\xcd\xff\xbf\xc6|\xa9g\xfd\xd9\xe3\
-d\xe6Z'<%'5\xe7\xff\xff\xf6h\xd2\xadI\
-U\xe2RU\xe5}v\xd9\xa7*\x125\xad\x1avi\
-8\xb3\x13Q!'\xa8\x91\xa5^o\xa7\x8d\x96|\xa6\
-\xa3N\xb5S\xe4\x9cY\x00\xe1$\x8b0OeCV\
-\xae\xa1\x81\xa0\xe2C\x03q!\x81\x88\x14$07#\
-\xec5\x0c\x09\xc9\x9693YP\xc9\x82\xd42\xff\xe5\
-\x8eMH\xd9c\x93,\xae\xd2\xcf\x1b-\x94iV\x8a\
-F\x95\x09\x11)\xff\xfb\xb2da\x8f\xf4Uy\xb7\x00\
-\xc15\x22\x87\x8e\xf6\xf0\x0cf~@\x00\x01\xa4\x00\x00\
-\x00 \x00\x004\x80\x00\x00\x045\x12\x22(\xc5\xcbl\
-\xd1\xa7\x15j\xd9\xa9\xa2\xdf*cf\x9e\xe6\xaf\x12\x22\
-p\x19h.[\xf7o\xff\xd9\xa7h\xd9m\xcf\xb2\xf1\
-\xb2\xdb\x94ij\xa9m\x7f\xac\xf9S\x0b\x09\x06\x02&\
-\x82R\xdf\xf98\xd3\x13D\x91\xa5B\xe5\xb7?\xff\xcd\
-;Z$\x8e\xb8Z%D\xd5LAME3.1\
-00UUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUUUUUUUUU\
-UUUUUUUUTAG\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-"
-
-qt_resource_name = b"\
-\x00\x06\
-\x07\xa6\xc4\xb3\
-\x00s\
-\x00o\x00u\x00n\x00d\x00s\
-\x00\x09\
-\x09e\x8d\x13\
-\x00e\
-\x00r\x00r\x00o\x00r\x00.\x00m\x00p\x003\
-\x00\x0b\
-\x0cS'\x13\
-\x00s\
-\x00u\x00c\x00c\x00e\x00s\x00s\x00.\x00m\x00p\x003\
-"
-
-qt_resource_struct = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x02\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x99Q\xb9?\x93\
-\x00\x00\x00*\x00\x00\x00\x00\x00\x01\x00\x00\x5cq\
-\x00\x00\x01\x99Q\xb9p(\
-"
-
-def qInitResources():
-    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
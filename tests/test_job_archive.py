@@ -0,0 +1,62 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from job_archive import JobArchive
+
+class TestJobArchive(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.archive = JobArchive(os.path.join(self.test_dir, ".dit_project", "history.db"))
+
+    def tearDown(self):
+        self.archive.close()
+        shutil.rmtree(self.test_dir)
+
+    def _job(self, job_id):
+        return {
+            "id": job_id,
+            "status": "Completed",
+            "report": {
+                "job_id": job_id,
+                "start_time": datetime(2024, 5, 1, 9, 30),
+                "files": [{"source": "/card/A001.mov", "status": "Verified"},
+                          {"source": "/card/A002.mov", "status": "Verified"}],
+            },
+        }
+
+    def test_archive_and_get_job(self):
+        self.archive.archive_jobs([self._job("job_1")])
+        job = self.archive.get_job("job_1")
+        self.assertEqual(job["status"], "Completed")
+        self.assertEqual(job["report"]["start_time"], datetime(2024, 5, 1, 9, 30))
+        self.assertEqual([f["source"] for f in job["report"]["files"]], ["/card/A001.mov", "/card/A002.mov"])
+        self.assertIsNone(self.archive.get_job("missing"))
+
+    def test_update_file_and_status(self):
+        self.archive.archive_jobs([self._job("job_1")])
+        self.assertTrue(self.archive.update_file("job_1", "/card/A002.mov", {"thumbnail": None}))
+        self.assertFalse(self.archive.update_file("job_1", "/card/B001.mov", {"thumbnail": "x.jpg"}))
+        self.archive.set_status("job_1", "Processed")
+        job = self.archive.get_job("job_1")
+        self.assertEqual(job["status"], "Processed")
+        self.assertIn("thumbnail", job["report"]["files"][1])
+
+    def test_copy_jobs(self):
+        self.assertFalse(self.archive.has_copy_jobs())
+        self.assertFalse(os.path.exists(self.archive.db_path))
+        finished = self._job("job_1")
+        finished["report"]["end_time"] = datetime(2024, 5, 1, 9, 45)
+        stub = {"id": "job_2", "status": "Cancelled", "report": {"total_size": 1024}}
+        verify = dict(self._job("job_3"), job_type="mhl_verify")
+        verify["report"]["end_time"] = datetime(2024, 5, 1, 10, 0)
+        self.archive.archive_jobs([finished, stub, verify])
+        self.assertTrue(self.archive.has_copy_jobs())
+        jobs = self.archive.copy_jobs()
+        self.assertEqual([job["id"] for job in jobs], ["job_1"])
+        self.assertEqual(jobs[0]["report"]["end_time"], datetime(2024, 5, 1, 9, 45))
+        self.assertEqual(len(jobs[0]["report"]["files"]), 2)
+
+if __name__ == '__main__':
+    unittest.main()
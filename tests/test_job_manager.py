@@ -0,0 +1,81 @@
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import datetime
+from types import SimpleNamespace
+from unittest.mock import patch
+from job_manager import JobManager
+
+class TestCancelAllJobs(unittest.TestCase):
+    def test_cancelled_pending_copy_job_is_not_reportable(self):
+        manager = JobManager(SimpleNamespace(project_path=None, global_settings={}))
+        # Shape of a job from create_job_from_ui that never reached a worker
+        job = {'id': 'Job_1', 'sources': ['/src'], 'destinations': ['/dst'], 'status': 'Queued',
+               'report': {'total_size': 1024}}
+        manager.add_job_to_queue(job)
+        manager.is_running = True
+        manager.cancel_all_jobs()
+        self.assertIn('Job_1', manager.completed_jobs)
+        self.assertEqual(job['status'], 'Cancelled')
+        self.assertEqual(dict(manager.completed_copy_jobs), {})
+        # The session report button is driven by this, so no report can be started
+        self.assertFalse(manager.has_completed_copy_jobs)
+
+    def test_cancelled_report_without_end_time_is_not_reportable(self):
+        manager = JobManager(SimpleNamespace(project_path=None, global_settings={}))
+        # Mid-run cancel as saved by builds whose worker didn't stamp end_time
+        report = {'job_id': 'Job_1', 'start_time': datetime(2024, 5, 1, 9, 30), 'sources': ['/src'],
+                  'destinations': ['/dst'], 'files': [], 'status': 'Cancelled', 'total_size': 0}
+        manager.load_completed_jobs([{'id': 'Job_1', 'status': 'Cancelled', 'report': report}])
+        self.assertFalse(manager.has_completed_copy_jobs)
+        manager.load_completed_jobs([{'id': 'Job_1', 'status': 'Cancelled',
+                                      'report': dict(report, end_time=datetime(2024, 5, 1, 9, 45))}])
+        self.assertEqual(list(manager.completed_copy_jobs), ['Job_1'])
+
+class TestJobChangeSignals(unittest.TestCase):
+    def test_jobs_modified_is_emitted_before_coalesced_list_refresh(self):
+        manager = JobManager(SimpleNamespace(project_path=None, global_settings={}))
+        modified, refreshed = [], []
+        manager.jobs_modified.connect(lambda: modified.append(True))
+        manager.job_list_changed.connect(lambda: refreshed.append(True))
+        manager.add_job_to_queue({'id': 'Job_1', 'status': 'Queued', 'report': {'total_size': 0}})
+        self.assertEqual(modified, [True])
+        self.assertEqual(refreshed, [])
+
+class TestCompletedJobEviction(unittest.TestCase):
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def _copy_job(self, n):
+        report = {'job_id': f'Job_{n}', 'start_time': datetime(2024, 5, 1, 9, n), 'end_time': datetime(2024, 5, 1, 10, n),
+                  'sources': ['/src'], 'destinations': ['/dst'], 'checksum_method': 'xxHash (Fast)',
+                  'files': [{'source': f'/src/{n}.mov', 'status': 'Verified'}], 'status': 'Completed', 'total_size': 1}
+        return {'id': f'Job_{n}', 'status': 'Completed', 'report': report}
+
+    @patch('job_manager.MAX_COMPLETED_JOBS', 2)
+    def test_evicted_copy_jobs_are_read_back_from_archive(self):
+        manager = JobManager(SimpleNamespace(project_path=self.test_dir, global_settings={}))
+        manager.load_completed_jobs([self._copy_job(n) for n in range(3)])
+        self.assertEqual(list(manager.completed_jobs), ['Job_1', 'Job_2'])
+        self.assertEqual(list(manager.completed_copy_jobs), ['Job_1', 'Job_2'])
+        self.assertTrue(os.path.exists(os.path.join(self.test_dir, ".dit_project", "history.db")))
+        self.assertEqual(manager.get_job_by_id('Job_0')['report']['files'][0]['source'], '/src/0.mov')
+        self.assertEqual([j['id'] for j in manager.session_copy_jobs()], ['Job_0', 'Job_1', 'Job_2'])
+        manager.clear_completed_jobs()
+        self.assertFalse(manager.has_completed_copy_jobs)
+        manager._archive.close()
+
+    @patch('job_manager.MAX_COMPLETED_JOBS', 2)
+    def test_evicted_copy_jobs_stay_in_memory_without_project(self):
+        manager = JobManager(SimpleNamespace(project_path=None, global_settings={}))
+        manager.load_completed_jobs([self._copy_job(n) for n in range(3)])
+        self.assertEqual(list(manager.completed_jobs), ['Job_1', 'Job_2'])
+        self.assertIsNotNone(manager.get_job_by_id('Job_0'))
+        self.assertEqual([j['id'] for j in manager.session_copy_jobs()], ['Job_0', 'Job_1', 'Job_2'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+import unittest
+from ui_components import JobQueueModel
+
+class TestJobQueueModel(unittest.TestCase):
+    def _ids(self, model):
+        return [model.job_at(model.index(row))['id'] for row in range(model.rowCount())]
+
+    def test_set_jobs_keeps_rows_in_place_and_appends_new(self):
+        model = JobQueueModel()
+        a, b, c = ({'id': job_id, 'status': 'Queued'} for job_id in "abc")
+        model.set_jobs([a, b])
+        # b moved ahead of a (e.g. it started running) and c was added
+        model.set_jobs([b, a, c])
+        self.assertEqual(self._ids(model), ["a", "b", "c"])
+        model.set_jobs([c, a])
+        self.assertEqual(self._ids(model), ["a", "c"])
+
+    def test_update_job_repaints_only_its_row(self):
+        model = JobQueueModel()
+        a, b = ({'id': job_id, 'status': 'Queued'} for job_id in "ab")
+        model.set_jobs([a, b])
+        changed = []
+        model.dataChanged.connect(lambda top, bottom: changed.append((top.row(), bottom.row())))
+        self.assertTrue(model.update_job(b))
+        self.assertEqual(changed, [(1, 1)])
+        self.assertFalse(model.update_job({'id': 'missing', 'status': 'Queued'}))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,5 +26,12 @@ class TestModels(unittest.TestCase):
         self.assertEqual(job.status, JobStatus.COMPLETED)
         self.assertEqual(job.sources, ["/src"])
 
+    def test_job_round_trip_ignores_unknown_keys(self):
+        data = Job(id="rt", destinations=["/dst"]).to_dict()
+        data["file_queue"] = None
+        job = Job.from_dict(data)
+        self.assertEqual(job.destinations, ["/dst"])
+        self.assertFalse(hasattr(job, "__dict__"))
+
 if __name__ == '__main__':
     unittest.main()
@@ -48,6 +48,18 @@ class TestScanWorker(unittest.TestCase):
 
         worker.scan_finished.emit.assert_called()
 
+    def test_scan_resolves_source_folder_per_source(self):
+        self.job_params["create_source_folder"] = True
+        worker = ScanWorker(self.job_params, self.file_queue)
+        worker.scan_progress = MagicMock()
+        worker.scan_finished = MagicMock()
+
+        worker.run()
+
+        task = self.file_queue.get()
+        source_name = os.path.basename(self.test_dir)
+        self.assertEqual(task['destinations'], [os.path.join(self.dest_dir, source_name, "test.txt")])
+
 import tempfile
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,8 @@
+import os
+import tempfile
 import unittest
-from utils import format_bytes, format_eta, resolve_path_template
+from datetime import datetime
+from utils import format_bytes, format_eta, resolve_path_template, get_device_id, atomic_write_text, json_dumps, json_loads
 
 class TestUtils(unittest.TestCase):
     def test_format_bytes(self):
@@ -20,5 +23,24 @@ class TestUtils(unittest.TestCase):
         result = resolve_path_template(template, tokens, 1, "ignored")
         self.assertEqual(result, "MyProject/A/001")
 
+    def test_get_device_id_uses_existing_parent(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            missing = os.path.join(tmp, "not", "yet", "created")
+            self.assertEqual(get_device_id(missing), os.stat(tmp).st_dev)
+
+    def test_atomic_write_text_replaces_file(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "state.json")
+            atomic_write_text(path, "old")
+            atomic_write_text(path, "new")
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(f.read(), "new")
+            self.assertEqual(os.listdir(tmp), ["state.json"])
+
+    def test_json_round_trip(self):
+        obj = {"start_time": datetime(2024, 5, 1, 9, 30, 15, 250), "queue": object(), "files": [{"size": 3}]}
+        self.assertEqual(json_loads(json_dumps(obj)),
+                         {"start_time": "2024-05-01T09:30:15.000250", "queue": None, "files": [{"size": 3}]})
+
 if __name__ == '__main__':
     unittest.main()
@@ -3,8 +3,11 @@ import tempfile
 import os
 import shutil
 import queue
-from unittest.mock import MagicMock
-from workers import TransferWorker
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+from workers import TransferWorker, FileQueue, DriveMonitorWorker
 
 class TestTransferWorker(unittest.TestCase):
     def setUp(self):
@@ -70,5 +73,52 @@ class TestTransferWorker(unittest.TestCase):
         report = worker.job_finished.emit.call_args[0][0]
         self.assertEqual(report['status'], 'Completed')
 
+    def test_cancel_mid_run_closes_report(self):
+        # Second file is never reached: the worker is cancelled once the first one is copied
+        self.file_queue.queue.insert(1, dict(self.file_queue.queue[0], destinations=[]))
+        worker = TransferWorker(self.job, self.test_dir)
+        worker.progress = MagicMock(emit=MagicMock(side_effect=lambda *args: worker.cancel()))
+        worker.file_progress = MagicMock()
+        worker.job_finished = MagicMock()
+
+        worker.run()
+
+        report = worker.job_finished.emit.call_args[0][0]
+        self.assertEqual(report['status'], 'Cancelled')
+        self.assertEqual(len(report['files']), 1)
+        self.assertGreaterEqual(report['end_time'], report['start_time'])
+        self.assertEqual(report['total_size'], 1024 * 1024)
+
+class TestFileQueue(unittest.TestCase):
+    def test_fifo_order(self):
+        q = FileQueue()
+        for i in range(3):
+            q.put(i)
+        q.put(None)
+        self.assertEqual(q.qsize(), 4)
+        self.assertEqual([q.get() for _ in range(4)], [0, 1, 2, None])
+        self.assertTrue(q.empty())
+
+    def test_get_blocks_until_put(self):
+        q = FileQueue()
+        threading.Timer(0.05, q.put, args=("task",)).start()
+        start = time.monotonic()
+        self.assertEqual(q.get(timeout=2), "task")
+        self.assertGreater(time.monotonic() - start, 0.01)
+        with self.assertRaises(queue.Empty):
+            q.get(timeout=0.05)
+
+class TestDriveMonitorWorker(unittest.TestCase):
+    def test_emits_only_on_change(self):
+        worker = DriveMonitorWorker()
+        changes = []
+        worker.drives_changed.connect(lambda added, removed: changes.append((added, removed)))
+        polls = [["/", "/mnt/a"], ["/", "/mnt/a"], ["/", "/mnt/b"]]
+        with patch("workers.psutil.disk_partitions",
+                   side_effect=lambda all=False: [SimpleNamespace(mountpoint=m) for m in polls.pop(0)]):
+            for _ in range(3):
+                worker.poll()
+        self.assertEqual(changes, [(frozenset({"/mnt/b"}), frozenset({"/mnt/a"}))])
+
 if __name__ == '__main__':
     unittest.main()
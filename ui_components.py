@@ -1,17 +1,17 @@
 # ui_components.py
 import os
 import platform
-import sys
 import subprocess
 
 import psutil
-from PySide6.QtCore import Qt, Signal, QSize, QPropertyAnimation, QEasingCurve, Property, QEvent, QParallelAnimationGroup, QPoint
-from PySide6.QtGui import QMouseEvent, QAction, QPainter, QColor, QBrush
+from PySide6.QtCore import Qt, Signal, QSize, QRect, QPropertyAnimation, QEasingCurve, Property, QEvent, QParallelAnimationGroup, QPoint, QAbstractListModel, QModelIndex
+from PySide6.QtGui import QMouseEvent, QAction, QPainter, QColor, QBrush, QFont, QFontMetrics, QPalette, QPixmapCache
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFrame,
     QListWidget, QListWidgetItem, QFileDialog, QDialog, QLineEdit,
     QMenu, QMessageBox, QTextEdit, QFormLayout, QGroupBox,
-    QTabWidget, QSpinBox, QGraphicsOpacityEffect, QSizePolicy
+    QTabWidget, QSpinBox, QGraphicsOpacityEffect,
+    QApplication, QStyle, QStyledItemDelegate, QStyleOptionViewItem
 )
 
 from utils import get_icon, get_icon_for_path, format_bytes, resolve_path_template
@@ -168,78 +168,172 @@ class ModernDropdown(QPushButton):
             return self._items[self._current_index]
         return ""
 
-class JobListItem(QWidget):
-    remove_requested = Signal(str)
-    def __init__(self, job_data, parent=None):
+# Status icon color and (SF Symbol, Font Awesome) glyph, matched by substring (first hit wins).
+# job_status_pixmap rasterizes each resolved icon once into QPixmapCache for the delegate to paint.
+_JOB_STATUS_COLORS = {"Processed": "#4CAF50", "Completed": "#4CAF50", "Post-processing": "#9C27B0", "Running": "#00BCD4", "Cancelled": "#FF9800", "Queued": "gray", "Completed with errors": "#FF9800"}
+_JOB_STATUS_ICONS = { "Processed": ("checkmark.seal.fill", "fa5s.check-double"), "Post-processing": ("film.fill", "fa5s.film"), "Completed": ("checkmark.circle.fill", "fa5s.check-circle"), "Running": ("gearshape.2.fill", "fa5s.cogs"), "Cancelled": ("xmark.octagon.fill", "fa5s.ban"), "Queued": ("clock.fill", "fa5s.clock"), "Completed with errors": ("exclamationmark.triangle.fill", "fa5s.exclamation-triangle")}
+_REMOVABLE_JOB_STATUSES = ('Queued', 'Completed', 'Cancelled', 'Processed', 'Completed with errors')
+
+def _job_status_icon_spec(status):
+    icon_color = next((_JOB_STATUS_COLORS[s] for s in _JOB_STATUS_COLORS if s in status), "#F44336")
+    sfs_name, fa_name = _JOB_STATUS_ICONS.get(next((s for s in _JOB_STATUS_ICONS if s in status), "default"), ("exclamationmark.triangle.fill", "fa5s.exclamation-circle"))
+    return sfs_name, fa_name, icon_color
+
+def job_status_pixmap(status, size, device_pixel_ratio=1.0):
+    # Font icons re-render their glyph on every paint; rasterize once per icon/size/scale.
+    # Keyed by the resolved icon, not the status text, so free-form error statuses share entries.
+    sfs_name, fa_name, icon_color = _job_status_icon_spec(status)
+    key = f"jobstatus:{sfs_name}:{icon_color}:{size}@{device_pixel_ratio}"
+    pixmap = QPixmapCache.find(key)
+    if pixmap is None:
+        pixmap = get_icon(sfs_name, fa_name, color=icon_color).pixmap(QSize(size, size), device_pixel_ratio)
+        QPixmapCache.insert(key, pixmap)
+    return pixmap
+
+class JobQueueModel(QAbstractListModel):
+    """
+    Rows for the job queue view. Holds references to JobManager's job dicts; rows keep
+    their position once added (new jobs are appended), matching the old widget list.
+    """
+    JobRole = Qt.UserRole + 1
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.job_id = job_data['id']
-        self.job_data = job_data
-        main_layout = QHBoxLayout(self)
-        main_layout.setContentsMargins(12, 10, 12, 10)
-        main_layout.setSpacing(10)
-        self.status_icon = QLabel()
-        self.job_label = QLabel()
-        self.job_label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Preferred)
-        self.job_label.setWordWrap(False)
-        self.remove_button = QPushButton(get_icon("xmark", "fa5s.times", color="gray"), "")
-        self.remove_button.setFixedSize(20, 20)
-        self.remove_button.setObjectName("ToolbarButton")
-        self.remove_button.setStyleSheet("background-color: transparent;")
-        self.remove_button.setCursor(Qt.PointingHandCursor)
-        self.remove_button.clicked.connect(lambda: self.remove_requested.emit(self.job_id))
-        self.remove_button.hide()
-        main_layout.addWidget(self.status_icon)
-        main_layout.addWidget(self.job_label, 1)
-        main_layout.addStretch()
-        main_layout.addWidget(self.remove_button)
-        self.update_status(job_data)
-    def enterEvent(self, event):
-        if self.job_data.get('status') in ['Queued', 'Completed', 'Cancelled', 'Processed', 'Completed with errors']:
-             self.remove_button.show()
-        super().enterEvent(event)
-    def leaveEvent(self, event):
-        self.remove_button.hide()
-        super().leaveEvent(event)
-    def update_status(self, job_data):
-        self.job_data = job_data
-        status = job_data['status']
-        item_text = ""
-        tooltip_text = f"<b>Job ID:</b> {job_data['id']}<br><b>Status:</b> {status}"
-        if job_data.get("job_type") == "mhl_verify":
-            job_name = os.path.basename(job_data['mhl_file'])
-            item_text = f"<b>MHL Verify:</b> {job_name}"
-            tooltip_text += f"<br><b>MHL File:</b> {job_data['mhl_file']}"
-            tooltip_text += f"<br><b>Target:</b> {job_data['target_dir']}"
+        self._jobs = []
+        self._rows = {} # job id -> row, rebuilt on structural changes
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._jobs)
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        job = self._jobs[index.row()]
+        if role == self.JobRole:
+            return job
+        if role == Qt.DisplayRole:
+            return job['id']
+        if role == Qt.ToolTipRole:
+            return self._tooltip(job)
+        return None
+    def job_at(self, index):
+        return self._jobs[index.row()] if index.isValid() else None
+    def clear(self):
+        self.beginResetModel()
+        self._jobs = []
+        self._rows = {}
+        self.endResetModel()
+    def set_jobs(self, jobs):
+        jobs_by_id = {job['id']: job for job in jobs}
+        # Remove bottom-up so the remaining row numbers stay valid
+        for row in range(len(self._jobs) - 1, -1, -1):
+            if self._jobs[row]['id'] not in jobs_by_id:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                del self._jobs[row]
+                self.endRemoveRows()
+        # Rows hold the live dicts, so existing rows only need a repaint
+        for row, job in enumerate(self._jobs):
+            self._jobs[row] = jobs_by_id.pop(job['id'])
+        if self._jobs:
+            self.dataChanged.emit(self.index(0), self.index(len(self._jobs) - 1))
+        if jobs_by_id:
+            first = len(self._jobs)
+            self.beginInsertRows(QModelIndex(), first, first + len(jobs_by_id) - 1)
+            self._jobs.extend(jobs_by_id.values())
+            self.endInsertRows()
+        self._rows = {job['id']: row for row, job in enumerate(self._jobs)}
+    def update_job(self, job):
+        """Repaints the one row showing job; returns False if the job isn't listed (yet)."""
+        row = self._rows.get(job['id'])
+        if row is None:
+            return False
+        self._jobs[row] = job
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+        return True
+    @staticmethod
+    def _tooltip(job):
+        tooltip_text = f"<b>Job ID:</b> {job['id']}<br><b>Status:</b> {job['status']}"
+        if job.get("job_type") == "mhl_verify":
+            tooltip_text += f"<br><b>MHL File:</b> {job['mhl_file']}"
+            tooltip_text += f"<br><b>Target:</b> {job['target_dir']}"
         else:
-            sources = job_data.get('sources', [])
-            source_text = os.path.basename(sources[0]) if sources else "N/A"
-            if len(sources) > 1:
-                source_text += f" (+{len(sources) - 1})"
-            dests = job_data.get('destinations', [])
-            dest_text = os.path.basename(dests[0]) if dests else "N/A"
-            if len(dests) > 1:
-                dest_text += f" (+{len(dests) - 1})"
-            item_text = f"<b>{source_text}</b> &rarr; {dest_text}"
+            sources = job.get('sources', [])
+            dests = job.get('destinations', [])
             if sources:
                 tooltip_text += "<br><br><b>Sources:</b><ul>" + "".join(f"<li>{s}</li>" for s in sources) + "</ul>"
             if dests:
                 tooltip_text += "<b>Destinations:</b><ul>" + "".join(f"<li>{d}</li>" for d in dests) + "</ul>"
-        fm = self.job_label.fontMetrics()
-        elided_text = fm.elidedText(item_text, Qt.ElideRight, self.job_label.width())
-        self.job_label.setText(elided_text)
-        self.setToolTip(tooltip_text)
-        colors = {"Processed": "#4CAF50", "Completed": "#4CAF50", "Post-processing": "#9C27B0", "Running": "#00BCD4", "Cancelled": "#FF9800", "Queued": "gray", "Completed with errors": "#FF9800"}
-        icon_color = next((colors[s] for s in colors if s in status), "#F44336")
-        icons = { "Processed": ("checkmark.seal.fill", "fa5s.check-double"), "Post-processing": ("film.fill", "fa5s.film"), "Completed": ("checkmark.circle.fill", "fa5s.check-circle"), "Running": ("gearshape.2.fill", "fa5s.cogs"), "Cancelled": ("xmark.octagon.fill", "fa5s.ban"), "Queued": ("clock.fill", "fa5s.clock"), "Completed with errors": ("exclamationmark.triangle.fill", "fa5s.exclamation-triangle")}
-        sfs_name, fa_name = icons.get(next((s for s in icons if s in status), "default"), ("exclamationmark.triangle.fill", "fa5s.exclamation-circle"))
-        icon = get_icon(sfs_name, fa_name, color=icon_color)
-        self.status_icon.setPixmap(icon.pixmap(QSize(18, 18)))
-        if sys.platform == "darwin":
-            self.status_icon.setStyleSheet(f"color: {icon_color};")
-    def resizeEvent(self, event):
-        super().resizeEvent(event)
-        if hasattr(self, 'job_data'):
-            self.update_status(self.job_data)
+        return tooltip_text
+
+class JobItemDelegate(QStyledItemDelegate):
+    """Paints a job row (status icon, 'source -> destination', hover remove button) without per-row widgets."""
+    remove_requested = Signal(str)
+    MARGIN_H, MARGIN_V, SPACING, ICON_SIZE, BUTTON_SIZE = 12, 10, 10, 18, 20
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._remove_icon = get_icon("xmark", "fa5s.times", color="gray")
+    def sizeHint(self, option, index):
+        height = max(option.fontMetrics.height(), self.BUTTON_SIZE) + 2 * self.MARGIN_V
+        return QSize(option.rect.width(), height)
+    def _remove_button_rect(self, rect):
+        return QRect(rect.right() - self.MARGIN_H - self.BUTTON_SIZE + 1,
+                     rect.center().y() - self.BUTTON_SIZE // 2, self.BUTTON_SIZE, self.BUTTON_SIZE)
+    @staticmethod
+    def _label_parts(job):
+        if job.get("job_type") == "mhl_verify":
+            return "MHL Verify:", f" {os.path.basename(job['mhl_file'])}"
+        sources = job.get('sources', [])
+        source_text = os.path.basename(sources[0]) if sources else "N/A"
+        if len(sources) > 1:
+            source_text += f" (+{len(sources) - 1})"
+        dests = job.get('destinations', [])
+        dest_text = os.path.basename(dests[0]) if dests else "N/A"
+        if len(dests) > 1:
+            dest_text += f" (+{len(dests) - 1})"
+        return source_text, f" \u2192 {dest_text}"
+    def paint(self, painter, option, index):
+        job = index.data(JobQueueModel.JobRole)
+        if job is None:
+            return
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        widget = opt.widget
+        style = widget.style() if widget else QApplication.style()
+        # Background (hover/selection) comes from the view's ::item stylesheet rules
+        style.drawPrimitive(QStyle.PE_PanelItemViewItem, opt, painter, widget)
+        painter.save()
+        rect = opt.rect
+        x = rect.left() + self.MARGIN_H
+        icon_rect = QRect(x, rect.center().y() - self.ICON_SIZE // 2, self.ICON_SIZE, self.ICON_SIZE)
+        painter.drawPixmap(icon_rect, job_status_pixmap(job['status'], self.ICON_SIZE, painter.device().devicePixelRatioF()))
+        x = icon_rect.right() + 1 + self.SPACING
+        right = rect.right() - self.MARGIN_H
+        hovered = bool(opt.state & QStyle.State_MouseOver)
+        if hovered and job.get('status') in _REMOVABLE_JOB_STATUSES:
+            self._remove_icon.paint(painter, self._remove_button_rect(rect).adjusted(3, 3, -3, -3))
+            right -= self.BUTTON_SIZE + self.SPACING
+        bold_text, rest_text = self._label_parts(job)
+        painter.setPen(opt.palette.color(QPalette.Text))
+        bold_font = QFont(opt.font)
+        bold_font.setBold(True)
+        bold_metrics = QFontMetrics(bold_font)
+        bold_text = bold_metrics.elidedText(bold_text, Qt.ElideRight, max(0, right - x))
+        painter.setFont(bold_font)
+        text_rect = QRect(x, rect.top(), max(0, right - x), rect.height())
+        painter.drawText(text_rect, Qt.AlignLeft | Qt.AlignVCenter, bold_text)
+        x += bold_metrics.horizontalAdvance(bold_text)
+        if x < right:
+            rest_text = opt.fontMetrics.elidedText(rest_text, Qt.ElideRight, right - x)
+            painter.setFont(opt.font)
+            painter.drawText(QRect(x, rect.top(), right - x, rect.height()), Qt.AlignLeft | Qt.AlignVCenter, rest_text)
+        painter.restore()
+    def editorEvent(self, event, model, option, index):
+        if event.type() == QEvent.Type.MouseButtonRelease and event.button() == Qt.LeftButton:
+            job = index.data(JobQueueModel.JobRole)
+            if (job is not None and job.get('status') in _REMOVABLE_JOB_STATUSES
+                    and self._remove_button_rect(option.rect).contains(event.position().toPoint())):
+                self.remove_requested.emit(job['id'])
+                return True
+        return super().editorEvent(event, model, option, index)
 
 class PathListItem(QWidget):
     remove_clicked = Signal(str)
@@ -299,25 +393,50 @@ class PathListItem(QWidget):
 class PathListWidget(QListWidget):
     metadata_requested = Signal(str)
     eject_requested = Signal(str)
+    paths_changed = Signal()
     def __init__(self, parent=None):
         super().__init__(parent)
+        self._paths = set() # mirrors the rows, for O(1) duplicate checks
+        self._bulk_adding = False
         self.setContextMenuPolicy(Qt.CustomContextMenu)
         self.customContextMenuRequested.connect(self.show_context_menu)
-    def add_path(self, path):
+    def add_path(self, path, animate=False):
         if self.path_exists(path):
             return
         item = QListWidgetItem(self)
         widget = PathListItem(path)
         self.addItem(item)
         self.setItemWidget(item, widget)
+        self._paths.add(path)
+        if not self._bulk_adding:
+            self.paths_changed.emit()
+    def add_paths(self, paths):
+        # Bulk insert (e.g. restoring a project): no fade-in, one repaint and one paths_changed
+        self.setUpdatesEnabled(False)
+        self._bulk_adding = True
+        try:
+            for path in paths:
+                self.add_path(path, animate=False)
+        finally:
+            self._bulk_adding = False
+            self.setUpdatesEnabled(True)
+        self.paths_changed.emit()
     def remove_path(self, path_to_remove):
+        if path_to_remove not in self._paths:
+            return
         for i in range(self.count()):
             item = self.item(i)
             widget = self.itemWidget(item)
             if widget and widget.path == path_to_remove:
                 self.takeItem(i)
+                self._paths.discard(path_to_remove)
+                self.paths_changed.emit()
                 break
-    def path_exists(self, path_to_check): return path_to_check in self.get_all_paths()
+    def clear(self):
+        super().clear()
+        self._paths.clear()
+        self.paths_changed.emit()
+    def path_exists(self, path_to_check): return path_to_check in self._paths
     def get_all_paths(self): return [self.itemWidget(self.item(i)).path for i in range(self.count()) if self.itemWidget(self.item(i))]
     def show_context_menu(self, pos):
         item = self.itemAt(pos)
@@ -364,7 +483,7 @@ class PathListWidget(QListWidget):
 class AnimatedPathListWidget(PathListWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
-    def add_path(self, path):
+    def add_path(self, path, animate=True):
         if self.path_exists(path):
             return
         item = QListWidgetItem(self)
@@ -373,6 +492,11 @@ class AnimatedPathListWidget(PathListWidget):
         item.setSizeHint(widget.sizeHint())
         self.addItem(item)
         self.setItemWidget(item, widget)
+        self._paths.add(path)
+        if not self._bulk_adding:
+            self.paths_changed.emit()
+        if not animate:
+            return
         effect = QGraphicsOpacityEffect(widget)
         widget.setGraphicsEffect(effect)
         self.anim_in = QPropertyAnimation(effect, b"opacity")
@@ -381,13 +505,6 @@ class AnimatedPathListWidget(PathListWidget):
         self.anim_in.setEndValue(1.0)
         self.anim_in.setEasingCurve(QEasingCurve.InOutQuad)
         self.anim_in.start(QPropertyAnimation.DeleteWhenStopped)
-    def remove_path(self, path_to_remove):
-        for i in range(self.count()):
-            item = self.item(i)
-            widget = self.itemWidget(item)
-            if widget and widget.path == path_to_remove:
-                self.takeItem(i)
-                break
     def remove_path_animated(self, path_to_remove):
         for i in range(self.count()):
             item = self.item(i)
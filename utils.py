@@ -1,16 +1,25 @@
 # utils.py
+import json
 import os
 import platform
 import subprocess
 import sys
 from datetime import datetime
+from functools import lru_cache
 import qtawesome as qta
 from PySide6.QtGui import QIcon
 
+try:
+    import orjson # optional; C encoder for the large project-state documents
+except ImportError:
+    orjson = None
+
+@lru_cache(maxsize=64)
 def get_icon(name, fallback_name, color=None):
     """
     Gets a native SF Symbol on macOS if available, otherwise a Font Awesome icon.
     The color parameter is only applied to the Font Awesome fallback.
+    Icons are cached, so callers share one QIcon per (name, fallback, color).
     """
     if sys.platform == "darwin":
         # QIcon.fromTheme() automatically finds SF Symbols by their name
@@ -45,6 +54,57 @@ def format_eta(seconds):
     if mins > 0: return f"{mins}m {secs}s"
     return f"{secs}s"
 
+def get_device_id(path):
+    """
+    Returns the st_dev of the volume holding path. Destinations often don't exist yet,
+    so the nearest existing parent is used. Returns None if nothing can be stat'ed.
+    """
+    path = os.path.abspath(path)
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+    try:
+        return os.stat(path).st_dev
+    except OSError:
+        return None
+
+def _json_default(o):
+    # datetimes become ISO strings; runtime-only objects (queues, workers) are stored as null
+    if isinstance(o, datetime):
+        return o.isoformat()
+    return None
+
+def json_dumps(obj, indent=False):
+    """
+    JSON text, compact unless indent is set (2 spaces, for files people may open by hand).
+    Uses orjson when installed, the stdlib encoder otherwise.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, default=_json_default, option=option).decode('utf-8')
+    if indent:
+        return json.dumps(obj, indent=2, default=_json_default)
+    return json.dumps(obj, separators=(',', ':'), default=_json_default)
+
+def json_loads(data):
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def atomic_write_text(path, text):
+    """
+    Writes text to path via a temp file in the same folder and os.replace, so a crash
+    mid-write leaves the previous file intact.
+    """
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
 def check_command(cmd_path):
     try:
         creationflags = subprocess.CREATE_NO_WINDOW if platform.system() == "Windows" else 0
@@ -8,20 +8,67 @@ import subprocess
 import xxhash
 import hashlib
 import queue
+import threading
+from collections import deque
 from xml.etree import ElementTree as ET
 from datetime import datetime
 
-import cv2
 import psutil
-from PySide6.QtCore import QThread, Signal
-
-
-from PIL import Image as PILImage
-import rawpy
+from PySide6.QtCore import QObject, QThread, Signal, Slot
 
 from config import FFMPEG_PATH, FFPROBE_PATH
 from utils import check_command, resolve_path_template
 
+class FileQueue:
+    """
+    Lightweight scan -> transfer handoff with the subset of the queue.Queue API the workers use.
+    Items live in a deque; the condition is only touched when a consumer has to wait.
+    """
+    def __init__(self):
+        self._items = deque()
+        self._cond = threading.Condition(threading.Lock())
+        self._waiters = 0
+
+    def put(self, item):
+        self._items.append(item)
+        if self._waiters:
+            with self._cond:
+                self._cond.notify()
+
+    def get(self, block=True, timeout=None):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            if not block:
+                raise queue.Empty
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._waiters += 1
+            try:
+                while True:
+                    try:
+                        return self._items.popleft()
+                    except IndexError:
+                        pass
+                    if deadline is None:
+                        self._cond.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0:
+                            raise queue.Empty
+                        self._cond.wait(remaining)
+            finally:
+                self._waiters -= 1
+
+    def task_done(self):
+        pass # No join() support is needed; kept so callers can treat this like queue.Queue
+
+    def qsize(self):
+        return len(self._items)
+
+    def empty(self):
+        return not self._items
+
 # --- ScanWorker, EjectWorker, PostProcessWorker are unchanged ---
 class ScanWorker(QThread):
     scan_finished = Signal(dict)
@@ -39,9 +86,14 @@ class ScanWorker(QThread):
         total_size = 0
         resolved_dests = {}
         files_found = 0
+        # Progress is batched so a large card can't flood the GUI thread's event queue
+        last_emit_files = 0
+        last_emit_time = time.monotonic()
 
         try:
             for source_path in sources:
+                # Destination roots depend only on the source, so resolve them once per source
+                dest_roots = self._resolve_dest_roots(source_path, destinations)
                 for root, _, files in os.walk(source_path):
                     for file in files:
                         full_path = os.path.join(root, file)
@@ -53,24 +105,8 @@ class ScanWorker(QThread):
                             continue
 
                         files_found += 1
-                        file_dests = []
                         relative_path = os.path.relpath(full_path, source_path)
-
-                        for dest_root in destinations:
-                            final_dest_root = dest_root
-                            if self.job_params['has_template']:
-                                source_folder_name = os.path.basename(source_path.rstrip(os.path.sep))
-                                resolved_template_path = resolve_path_template(
-                                    self.job_params['naming_preset']['template'],
-                                    self.job_params['naming_preset'],
-                                    self.job_params['card_counter'],
-                                    source_folder_name
-                                )
-                                final_dest_root = os.path.join(dest_root, resolved_template_path)
-                            elif self.job_params['create_source_folder']:
-                                source_folder_name = os.path.basename(source_path.rstrip(os.path.sep))
-                                final_dest_root = os.path.join(dest_root, source_folder_name)
-                            file_dests.append(os.path.join(final_dest_root, relative_path))
+                        file_dests = [os.path.join(dest_root, relative_path) for dest_root in dest_roots]
 
                         resolved_dests[full_path] = file_dests
 
@@ -83,8 +119,10 @@ class ScanWorker(QThread):
                         }
                         self.file_queue.put(task)
 
-                        if files_found % 10 == 0:
+                        if files_found - last_emit_files >= 500 or time.monotonic() - last_emit_time >= 0.1:
                             self.scan_progress.emit(files_found, total_size)
+                            last_emit_files = files_found
+                            last_emit_time = time.monotonic()
 
         finally:
             self.file_queue.put(None) # Sentinel
@@ -94,6 +132,20 @@ class ScanWorker(QThread):
         self.job_params['resolved_dests'] = resolved_dests
         self.scan_finished.emit(self.job_params)
 
+    def _resolve_dest_roots(self, source_path, destinations):
+        source_folder_name = os.path.basename(source_path.rstrip(os.path.sep))
+        if self.job_params['has_template']:
+            resolved_template_path = resolve_path_template(
+                self.job_params['naming_preset']['template'],
+                self.job_params['naming_preset'],
+                self.job_params['card_counter'],
+                source_folder_name
+            )
+            return [os.path.join(dest_root, resolved_template_path) for dest_root in destinations]
+        if self.job_params['create_source_folder']:
+            return [os.path.join(dest_root, source_folder_name) for dest_root in destinations]
+        return list(destinations)
+
 class EjectWorker(QThread):
     ejection_finished = Signal(str, bool)
     def __init__(self, path_to_eject, parent=None):
@@ -124,9 +176,35 @@ class EjectWorker(QThread):
         except Exception:
             self.ejection_finished.emit(self.mount_path, False)
 
+class DriveMonitorWorker(QObject):
+    """
+    Polls the mount table off the GUI thread. Lives on its own QThread; poll() is
+    triggered by a timer owned by the window and only emits when mounts change.
+    """
+    drives_changed = Signal(object, object) # added, removed (frozensets of mount points)
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._known_drives = None
+    @Slot()
+    def poll(self):
+        try:
+            current = frozenset(p.mountpoint for p in psutil.disk_partitions(all=False))
+        except Exception as e:
+            print(f"Error getting disk partitions: {e}")
+            return
+        if self._known_drives is None:
+            # First poll only establishes the baseline
+            self._known_drives = current
+            return
+        if current == self._known_drives:
+            return
+        added, removed = current - self._known_drives, self._known_drives - current
+        self._known_drives = current
+        self.drives_changed.emit(added, removed)
+
 class PostProcessWorker(QThread):
     progress = Signal(int, int, str)
-    file_processed = Signal(str, str, dict)
+    file_processed = Signal(str, list) # job_id, [(source_path, updates), ...]
     job_processed = Signal(str)
     def __init__(self, job, project_path, parent=None):
         super().__init__(parent)
@@ -142,6 +220,9 @@ class PostProcessWorker(QThread):
         files_to_process = self.job['report']['files']
         total_files = len(files_to_process)
         job_id = self.job['id']
+        # Updates are sent in batches (64 files or 100 ms) rather than one signal per file
+        pending = []
+        last_flush = time.monotonic()
         for i, file_info in enumerate(files_to_process):
             self.progress.emit(i + 1, total_files, os.path.basename(file_info['source']))
             updates = {}
@@ -155,7 +236,13 @@ class PostProcessWorker(QThread):
             elif self._is_image_file(file_info['source']):
                 updates['thumbnail'] = self._create_image_thumbnail(verified_dest)
             if updates:
-                self.file_processed.emit(job_id, file_info['source'], updates)
+                pending.append((file_info['source'], updates))
+            if pending and (len(pending) >= 64 or time.monotonic() - last_flush >= 0.1):
+                self.file_processed.emit(job_id, pending)
+                pending = []
+                last_flush = time.monotonic()
+        if pending:
+            self.file_processed.emit(job_id, pending)
         self.job_processed.emit(job_id)
     def _is_video_file(self, file_path):
         return any(file_path.lower().endswith(ext) for ext in ['.mov', '.mp4', '.mxf', '.avi', '.r3d', '.braw'])
@@ -179,6 +266,7 @@ class PostProcessWorker(QThread):
         thumb_path = self._get_thumb_path(video_path)
         if os.path.exists(thumb_path): return thumb_path
         try:
+            import cv2  # heavy; only loaded once post-processing actually runs
             cap = cv2.VideoCapture(video_path)
             if cap.isOpened():
                 frame_count = cap.get(cv2.CAP_PROP_FRAME_COUNT)
@@ -204,9 +292,11 @@ class PostProcessWorker(QThread):
         thumb_path = self._get_thumb_path(image_path)
         if os.path.exists(thumb_path): return thumb_path
         try:
+            from PIL import Image as PILImage
             img = None
             is_raw = any(image_path.lower().endswith(ext) for ext in ['.dng', '.cr2', '.cr3', '.nef', '.arw', '.rw2'])
             if is_raw:
+                import rawpy
                 with rawpy.imread(image_path) as raw:
                     rgb = raw.postprocess(use_camera_wb=True, no_auto_bright=True)
                 img = PILImage.fromarray(rgb)
@@ -228,8 +318,8 @@ class PostProcessWorker(QThread):
 
 # --- START REFACTOR: Simultaneous Hashing Implementation ---
 class TransferWorker(QThread):
-    progress = Signal(str, float, float, int)
-    file_progress = Signal(int, str, str, float)
+    progress = Signal(str, 'qulonglong') # job_id, bytes_done; speed/ETA are derived queue-wide by JobManager
+    file_progress = Signal(str, int, str, str, float) # job_id, percent, status, path, speed
     job_finished = Signal(dict)
     error = Signal(str, str)
     def __init__(self, job, project_path, parent=None):
@@ -237,6 +327,7 @@ class TransferWorker(QThread):
         self.job = job; self.project_path = project_path
         self.is_paused = False; self.is_cancelled = False
         self.CHUNK_SIZE = 4 * 1024 * 1024
+        self._created_dirs = set() # destination folders already made during this job
         
     def run(self):
         checksum_method = self.job['checksum_method']
@@ -249,7 +340,6 @@ class TransferWorker(QThread):
         }
         
         total_bytes_processed_in_job = 0
-        job_start_time = time.monotonic()
 
         # Pull from the shared queue
         file_queue = self.job.get('file_queue')
@@ -264,7 +354,10 @@ class TransferWorker(QThread):
                 if self.is_cancelled: break
                 time.sleep(0.5)
             if self.is_cancelled:
+                # Files copied before the cancel are still reported, so close the report like a finished one
                 report_data['status'] = 'Cancelled'
+                report_data['end_time'] = datetime.now()
+                report_data['total_size'] = total_bytes_processed_in_job
                 self.job_finished.emit(report_data)
                 return
 
@@ -300,14 +393,14 @@ class TransferWorker(QThread):
                 source_hash = None
                 hasher = None
                 if verification_mode == "full":
-                    self.file_progress.emit(0, "Copying & Hashing...", source_file_path, 0.0)
+                    self.file_progress.emit(self.job['id'], 0, "Copying & Hashing...", source_file_path, 0.0)
                     hasher = xxhash.xxh64() if checksum_method == "xxHash (Fast)" else hashlib.md5()
                     
                     self._copy_and_hash_file(source_file_path, dest_paths, hasher)
                     source_hash = hasher.hexdigest()
                     file_info['checksum'] = source_hash
                 else:
-                    self.file_progress.emit(0, "Copying...", source_file_path, 0.0)
+                    self.file_progress.emit(self.job['id'], 0, "Copying...", source_file_path, 0.0)
                     for dest_path in dest_paths:
                         self._copy_and_hash_file(source_file_path, [dest_path], None)
                 
@@ -324,7 +417,7 @@ class TransferWorker(QThread):
                         dest_info['verified'] = True
                         dest_info['status'] = "Verified (Size Only)"
                     elif verification_mode == "full":
-                        self.file_progress.emit(50, "Verifying...", dest_path, 0.0)
+                        self.file_progress.emit(self.job['id'], 50, "Verifying...", dest_path, 0.0)
                         dest_hash = self._calculate_hash(dest_path, checksum_method)
                         if source_hash == dest_hash:
                             dest_info['verified'] = True
@@ -346,16 +439,11 @@ class TransferWorker(QThread):
             file_queue.task_done()
 
             total_bytes_processed_in_job += file_info.get('size', 0)
-            elapsed_time = time.monotonic() - job_start_time
-            speed_mbps = (total_bytes_processed_in_job / (1024*1024)) / elapsed_time if elapsed_time > 0 else 0
 
             # Note: total_size in report_data is not updated here because it is dynamic.
-            # The UI handles the total size and ETA based on signals.
-            # We pass -1 for ETA if we don't trust the total size yet, or let UI handle it.
-            # However, the JobManager now needs to know the "current" total size from the scanner.
-            # For now, we will just emit progress.
-
-            self.progress.emit(self.job['id'], total_bytes_processed_in_job, speed_mbps, -1)
+            # The JobManager owns the queue total (fed by the scanner) and derives speed and ETA
+            # from its own smoothed rate, so only the byte count is sent.
+            self.progress.emit(self.job['id'], total_bytes_processed_in_job)
 
         if report_data['errors']:
             report_data['status'] = 'Completed with errors'
@@ -375,7 +463,10 @@ class TransferWorker(QThread):
         dest_files = []
         try:
             for dest_path in dest_paths:
-                os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+                dest_dir = os.path.dirname(dest_path)
+                if dest_dir not in self._created_dirs:
+                    os.makedirs(dest_dir, exist_ok=True)
+                    self._created_dirs.add(dest_dir)
                 dest_files.append(open(dest_path, 'wb'))
             
             with open(src_path, 'rb') as fsrc:
@@ -397,7 +488,7 @@ class TransferWorker(QThread):
 
                     copied_bytes += len(buf)
                     percent = int((copied_bytes / src_size) * 100) if src_size > 0 else 100
-                    self.file_progress.emit(percent, "Copying...", src_path, 0)
+                    self.file_progress.emit(self.job['id'], percent, "Copying...", src_path, 0)
         
         finally:
             # Ensure all destination files are closed
@@ -427,7 +518,7 @@ class TransferWorker(QThread):
 # ... (MHLVerifyWorker and ReportWorker are unchanged)
 class MHLVerifyWorker(QThread):
     progress = Signal(int, str, float, int)
-    file_progress = Signal(int, str, str, float)
+    file_progress = Signal(str, int, str, str, float) # job_id, percent, status, path, speed
     job_finished = Signal(dict)
     error = Signal(str, str)
     def __init__(self, job, parent=None):
@@ -453,6 +544,7 @@ class MHLVerifyWorker(QThread):
                     time.sleep(0.5)
                 if self.is_cancelled:
                     report_data['status'] = 'Cancelled'
+                    report_data['end_time'] = datetime.now()
                     self.job_finished.emit(report_data)
                     return
                 relative_path, expected_hash, hash_type, size = file_info
@@ -462,7 +554,7 @@ class MHLVerifyWorker(QThread):
                     file_report['status'] = 'Missing'
                     report_data['missing_count'] += 1
                 else:
-                    self.file_progress.emit(0, f"Verifying {os.path.basename(full_path)}...", full_path, 0.0)
+                    self.file_progress.emit(self.job['id'], 0, f"Verifying {os.path.basename(full_path)}...", full_path, 0.0)
                     actual_hash = self._calculate_hash(full_path, hash_type)
                     if actual_hash == expected_hash:
                         file_report['status'] = 'Verified'